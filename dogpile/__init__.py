@@ -1,9 +1,11 @@
 __version__ = "1.5.1"
 
+from .lock import AsyncLock
 from .lock import Lock
 from .lock import NeedRegenerationException
 
 __all__ = [
+    "AsyncLock",
     "Lock",
     "NeedRegenerationException",
     "__version__",
@@ -1,3 +1,5 @@
+from .async_region import AsyncCacheRegion
+from .async_region import make_async_region
 from .backends import register_backend
 from .region import CacheRegion
 from .region import make_region
@@ -6,7 +8,9 @@ from .. import __version__
 # backwards compat
 
 __all__ = [
+    "AsyncCacheRegion",
     "CacheRegion",
+    "make_async_region",
     "make_region",
     "register_backend",
     "__version__",
@@ -49,6 +49,67 @@ a  key not present."""
 MetaDataType = Mapping[str, Any]
 
 
+class CachedMetadata(Mapping[str, Any]):
+    """Compact form of the metadata of a :class:`.CachedValue`.
+
+    Presents the same mapping as the ``{"ct": ..., "v": ...}`` dictionary
+    used in serialized values, while storing the creation time and value
+    version in slots, so that the many values held by an in-memory backend
+    each carry a small fixed-size object rather than a dictionary.  Any
+    further keys are held in a dictionary created only when needed.
+
+    Pickles as a plain dictionary, so that values pickled by a backend
+    remain readable by versions of dogpile.cache without this class.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    __slots__ = ("ct", "v", "_extra")
+
+    ct: float
+    v: int
+    _extra: dict[str, Any] | None
+
+    def __init__(
+        self, ct: float, v: int, extra: Mapping[str, Any] | None = None
+    ):
+        self.ct = ct
+        self.v = v
+        self._extra = dict(extra) if extra else None
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "ct":
+            return self.ct
+        elif key == "v":
+            return self.v
+        elif self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield "ct"
+        yield "v"
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return 2 if self._extra is None else 2 + len(self._extra)
+
+    def __repr__(self):
+        return repr(self.as_dict())
+
+    def __reduce__(self):
+        return dict, (self.as_dict(),)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metadata as a new dictionary."""
+
+        if self._extra is None:
+            return {"ct": self.ct, "v": self.v}
+        return {"ct": self.ct, "v": self.v, **self._extra}
+
+
 KeyType = str
 """A cache key."""
 
@@ -120,6 +181,50 @@ class CacheMutex(abc.ABC):
         return hasattr(C, "acquire") and hasattr(C, "release")
 
 
+class AsyncCacheMutex(abc.ABC):
+    """Describes an asyncio mutexing object with awaitable acquire and
+    release methods.
+
+    This is the asyncio counterpart to :class:`.CacheMutex`, used by
+    :class:`.AsyncCacheRegion`.
+
+    .. versionadded:: 1.5.1
+
+    .. seealso::
+
+        :meth:`.AsyncCacheBackend.get_mutex` - the backend method that
+        optionally returns this locking object.
+
+    """
+
+    @abc.abstractmethod
+    async def acquire(self, wait: bool = True) -> bool:
+        """Acquire the mutex.
+
+        :param wait: if True, wait until available, else return True/False
+         immediately.
+
+        :return: True if the lock succeeded.
+
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def release(self) -> None:
+        """Release the mutex."""
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def locked(self) -> bool:
+        """Check if the mutex was acquired.
+
+        :return: true if the lock is acquired.
+
+        """
+        raise NotImplementedError()
+
+
 class CachedValue(NamedTuple):
     """Represent a value stored in the cache.
 
@@ -582,3 +687,226 @@ class BytesBackend(DefaultSerialization, CacheBackend):
 
         """
         raise NotImplementedError()
+
+
+class AsyncCacheBackend:
+    """Base class for asyncio backend implementations.
+
+    This is the asyncio counterpart to :class:`.CacheBackend`, for use
+    with :class:`.AsyncCacheRegion`.  Each method which talks to the cache
+    is a coroutine, and otherwise has the same contract as the method of
+    the same name on :class:`.CacheBackend`.  For backends in which the
+    value that's stored is ultimately a stream of bytes, the
+    :class:`.AsyncBytesBackend` should be used.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    key_mangler: Callable[[KeyType], KeyType] | None = None
+    """Key mangling function.
+
+    May be None, or otherwise declared
+    as an ordinary instance method.
+
+    """
+
+    serializer: Serializer | None = None
+    """Serializer function that will be used by default if not overridden
+    by the region.
+
+    """
+
+    deserializer: Deserializer | None = None
+    """deserializer function that will be used by default if not overridden
+    by the region.
+
+    """
+
+    def __init__(self, arguments: BackendArguments):  # pragma NO COVERAGE
+        """Construct a new :class:`.AsyncCacheBackend`.
+
+        Subclasses should override this to
+        handle the given arguments.
+
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def from_config_dict(
+        cls, config_dict: Mapping[str, Any], prefix: str
+    ) -> Self:
+        prefix_len = len(prefix)
+        return cls(
+            dict(
+                (key[prefix_len:], config_dict[key])
+                for key in config_dict
+                if key.startswith(prefix)
+            )
+        )
+
+    def has_lock_timeout(self) -> bool:
+        return False
+
+    def get_mutex(self, key: KeyType) -> AsyncCacheMutex | None:
+        """Return an optional :class:`.AsyncCacheMutex` for the given key.
+
+        May return ``None``, in which case the dogpile lock will use an
+        ``asyncio.Lock`` to mutex concurrent coroutines within the event
+        loop for value creation.  The default implementation returns
+        ``None``.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.get_mutex`
+
+        """
+        return None
+
+    async def get(
+        self, key: KeyType
+    ) -> BackendFormatted:  # pragma NO COVERAGE
+        """Retrieve an optionally serialized value from the cache.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.get`
+
+        """
+        raise NotImplementedError()
+
+    async def get_multi(
+        self, keys: Sequence[KeyType]
+    ) -> Sequence[BackendFormatted]:  # pragma NO COVERAGE
+        """Retrieve multiple optionally serialized values from the cache.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.get_multi`
+
+        """
+        raise NotImplementedError()
+
+    async def get_serialized(self, key: KeyType) -> SerializedReturnType:
+        """Retrieve a serialized value from the cache.
+
+        The default implementation of this method for
+        :class:`.AsyncCacheBackend` returns the value of the
+        :meth:`.AsyncCacheBackend.get` method.
+
+        """
+        return cast(SerializedReturnType, await self.get(key))
+
+    async def get_serialized_multi(
+        self, keys: Sequence[KeyType]
+    ) -> Sequence[SerializedReturnType]:
+        """Retrieve multiple serialized values from the cache.
+
+        The default implementation of this method for
+        :class:`.AsyncCacheBackend` returns the value of the
+        :meth:`.AsyncCacheBackend.get_multi` method.
+
+        """
+        return cast(Sequence[SerializedReturnType], await self.get_multi(keys))
+
+    async def set(
+        self, key: KeyType, value: BackendSetType
+    ) -> None:  # pragma NO COVERAGE
+        """Set an optionally serialized value in the cache.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.set`
+
+        """
+        raise NotImplementedError()
+
+    async def set_serialized(self, key: KeyType, value: bytes) -> None:
+        """Set a serialized value in the cache.
+
+        The default implementation of this method for
+        :class:`.AsyncCacheBackend` calls upon the
+        :meth:`.AsyncCacheBackend.set` method.
+
+        """
+        await self.set(key, value)
+
+    async def set_multi(
+        self, mapping: Mapping[KeyType, BackendSetType]
+    ) -> None:  # pragma NO COVERAGE
+        """Set multiple values in the cache.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.set_multi`
+
+        """
+        raise NotImplementedError()
+
+    async def set_serialized_multi(
+        self, mapping: Mapping[KeyType, bytes]
+    ) -> None:
+        """Set multiple serialized values in the cache.
+
+        The default implementation of this method for
+        :class:`.AsyncCacheBackend` calls upon the
+        :meth:`.AsyncCacheBackend.set_multi` method.
+
+        """
+        await self.set_multi(mapping)
+
+    async def delete(self, key: KeyType) -> None:  # pragma NO COVERAGE
+        """Delete a value from the cache.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.delete`
+
+        """
+        raise NotImplementedError()
+
+    async def delete_multi(
+        self, keys: Sequence[KeyType]
+    ) -> None:  # pragma NO COVERAGE
+        """Delete multiple values from the cache.
+
+        .. seealso::
+
+            :meth:`.CacheBackend.delete_multi`
+
+        """
+        raise NotImplementedError()
+
+
+class AsyncBytesBackend(DefaultSerialization, AsyncCacheBackend):
+    """An asyncio cache backend that receives and returns series of bytes.
+
+    This backend only supports the "serialized" form of values; subclasses
+    should implement :meth:`.AsyncCacheBackend.get_serialized`,
+    :meth:`.AsyncCacheBackend.get_serialized_multi`,
+    :meth:`.AsyncCacheBackend.set_serialized`,
+    :meth:`.AsyncCacheBackend.set_serialized_multi`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    async def get_serialized(
+        self, key: KeyType
+    ) -> SerializedReturnType:  # pragma NO COVERAGE
+        raise NotImplementedError()
+
+    async def get_serialized_multi(
+        self, keys: Sequence[KeyType]
+    ) -> Sequence[SerializedReturnType]:  # pragma NO COVERAGE
+        raise NotImplementedError()
+
+    async def set_serialized(
+        self, key: KeyType, value: bytes
+    ) -> None:  # pragma NO COVERAGE
+        raise NotImplementedError()
+
+    async def set_serialized_multi(
+        self, mapping: Mapping[KeyType, bytes]
+    ) -> None:  # pragma NO COVERAGE
+        raise NotImplementedError()
@@ -0,0 +1,848 @@
+"""
+Asyncio Region
+--------------
+
+Provides :class:`.AsyncCacheRegion`, an asyncio counterpart to
+:class:`.CacheRegion` for use with asyncio backends such as
+:class:`.AsyncRedisBackend`.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+import datetime
+from functools import partial
+from functools import wraps
+import time
+from typing import Any
+from typing import cast
+
+from decorator import decorate
+
+from . import exception
+from .api import AsyncCacheMutex
+from .api import BackendArguments
+from .api import CachedValue
+from .api import CacheReturnType
+from .api import CantDeserializeException
+from .api import KeyType
+from .api import NO_VALUE
+from .api import NoValueType
+from .api import SerializedReturnType
+from .api import ValuePayload
+from .region import _SerializedPayload
+from .region import CacheRegion
+from .region import ExpirationTimeCallable
+from .region import FunctionKeyGenerator
+from .region import FunctionMultiKeyGenerator
+from .region import RegionInvalidationStrategy
+from .serializers import Codec
+from .util import function_key_generator
+from .util import function_multi_key_generator
+from .. import AsyncLock
+from .. import NeedRegenerationException
+from ..util.typing import Self
+
+__all__ = ["AsyncCacheRegion", "make_async_region"]
+
+AsyncCreator = Callable[
+    ["AsyncCacheRegion", KeyType, Callable[[], Awaitable[ValuePayload]], Any],
+    Awaitable[None],
+]
+
+
+class _AsyncLockWrapper(AsyncCacheMutex):
+    """weakref-capable wrapper for asyncio.Lock"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, wait=True):
+        if not wait and self.lock.locked():
+            return False
+        await self.lock.acquire()
+        return True
+
+    async def release(self):
+        self.lock.release()
+
+    async def locked(self):
+        return self.lock.locked()
+
+
+class _AsyncRegionState(CacheRegion):
+    """The :class:`.CacheRegion` underlying an :class:`.AsyncCacheRegion`.
+
+    Holds the configuration of the region, and forms and parses cached
+    values; it's never used to talk to the backend itself.
+
+    """
+
+    _async_backend = True
+
+    def _create_mutex(self, key):
+        mutex = self.backend.get_mutex(key)
+        if mutex is not None:
+            return mutex
+        else:
+            return _AsyncLockWrapper()
+
+
+class AsyncCacheRegion:
+    """An asyncio front end to an asyncio backend.
+
+    :class:`.AsyncCacheRegion` provides the same behavior as
+    :class:`.CacheRegion`, where each method which talks to the backend is a
+    coroutine, and value creation functions are coroutine functions.  It's
+    configured with an :class:`.AsyncCacheBackend`, such as that of
+    ``dogpile.cache.redis_async``::
+
+        from dogpile.cache import make_async_region
+
+        region = make_async_region().configure(
+            "dogpile.cache.redis_async",
+            expiration_time=3600,
+            arguments={"host": "localhost", "port": 6379},
+        )
+
+        @region.async_cache_on_arguments()
+        async def load_user_info(user_id):
+            return await some_database.lookup_user_by_id(user_id)
+
+    The dogpile lock is an :class:`.AsyncLock`; coroutines which find no
+    value wait for the one coroutine which is generating it, rather than
+    each calling upon the creation function, and coroutines which find an
+    expired value return it while it's regenerated.  Unless the backend
+    provides a distributed lock via :meth:`.AsyncCacheBackend.get_mutex`,
+    the lock is an ``asyncio.Lock`` and coordinates coroutines within a
+    single event loop only.
+
+    The arguments accepted are those of :class:`.CacheRegion`, except that
+    ``async_creation_runner``, if given, is a coroutine function::
+
+        async def async_creation_runner(cache, somekey, creator, mutex):
+            async def runner():
+                try:
+                    value = await creator()
+                    await cache.set(somekey, value)
+                finally:
+                    await mutex.release()
+
+            asyncio.create_task(runner())
+
+    Asyncio backends can't be wrapped with a :class:`.ProxyBackend`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        function_key_generator: FunctionKeyGenerator = function_key_generator,
+        function_multi_key_generator: FunctionMultiKeyGenerator = function_multi_key_generator,  # noqa E501
+        key_mangler: Callable[[KeyType], KeyType] | None = None,
+        serializer: Callable[[ValuePayload], bytes] | None = None,
+        deserializer: Callable[[bytes], ValuePayload] | None = None,
+        async_creation_runner: AsyncCreator | None = None,
+        binary_metadata: bool = False,
+        early_expiration_beta: float | None = None,
+        codec: str | Codec | None = None,
+    ):
+        """Construct a new :class:`.AsyncCacheRegion`."""
+        self._region = _AsyncRegionState(
+            name,
+            function_key_generator,
+            function_multi_key_generator,
+            key_mangler,
+            serializer,
+            deserializer,
+            binary_metadata=binary_metadata,
+            early_expiration_beta=early_expiration_beta,
+            codec=codec,
+        )
+        self.async_creation_runner = async_creation_runner
+
+    def configure(
+        self,
+        backend: str,
+        expiration_time: float | datetime.timedelta | None = None,
+        arguments: BackendArguments | None = None,
+        _config_argument_dict: Mapping[str, Any] | None = None,
+        _config_prefix: str | None = None,
+        replace_existing_backend: bool = False,
+        region_invalidator: RegionInvalidationStrategy | None = None,
+    ) -> Self:
+        """Configure an :class:`.AsyncCacheRegion`.
+
+        The arguments are those of :meth:`.CacheRegion.configure`, where
+        ``backend`` names an :class:`.AsyncCacheBackend`.  The
+        :class:`.AsyncCacheRegion` itself is returned.
+
+        """
+        self._region.configure(
+            backend,
+            expiration_time=expiration_time,
+            arguments=arguments,
+            _config_argument_dict=_config_argument_dict,
+            _config_prefix=_config_prefix,
+            replace_existing_backend=replace_existing_backend,
+            region_invalidator=region_invalidator,
+        )
+        return self
+
+    def configure_from_config(
+        self, config_dict: dict[str, Any], prefix: str
+    ) -> Self:
+        """Configure from a configuration dictionary
+        and a prefix.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.configure_from_config`
+
+        """
+        self._region.configure_from_config(config_dict, prefix)
+        return self
+
+    @property
+    def name(self) -> str | None:
+        return self._region.name
+
+    @property
+    def backend(self) -> Any:
+        return self._region.backend
+
+    @property
+    def actual_backend(self) -> Any:
+        return self._region.actual_backend
+
+    @property
+    def is_configured(self) -> bool:
+        """Return True if the backend has been configured via the
+        :meth:`.AsyncCacheRegion.configure` method already."""
+        return self._region.is_configured
+
+    @property
+    def expiration_time(self) -> float | None:
+        return self._region.expiration_time
+
+    @property
+    def key_mangler(self) -> Callable[[KeyType], KeyType] | None:
+        return self._region.key_mangler
+
+    @property
+    def region_invalidator(self) -> RegionInvalidationStrategy:
+        return self._region.region_invalidator
+
+    def invalidate(self, hard: bool = True) -> None:
+        """Invalidate this :class:`.AsyncCacheRegion`.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.invalidate`
+
+        """
+        self._region.invalidate(hard)
+
+    async def get(
+        self,
+        key: KeyType,
+        expiration_time: float | None = None,
+        ignore_expiration: bool = False,
+    ) -> ValuePayload | NoValueType:
+        """Return a value from the cache, based on the given key.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.get`
+
+        """
+        value = await self._get_cache_value(
+            key, expiration_time, ignore_expiration
+        )
+        return value.payload
+
+    async def get_value_metadata(
+        self,
+        key: KeyType,
+        expiration_time: float | None = None,
+        ignore_expiration: bool = False,
+    ) -> CachedValue | None:
+        """Return the :class:`.CachedValue` object directly from the cache.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.get_value_metadata`
+
+        """
+        cache_value = await self._get_cache_value(
+            key, expiration_time, ignore_expiration
+        )
+        if cache_value is NO_VALUE:
+            return None
+        return cache_value
+
+    async def _get_cache_value(
+        self,
+        key: KeyType,
+        expiration_time: float | None = None,
+        ignore_expiration: bool = False,
+    ) -> CacheReturnType:
+        region = self._region
+        if region.key_mangler:
+            key = region.key_mangler(key)
+        value = await self._get_from_backend(key)
+        value = region._unexpired_value_fn(expiration_time, ignore_expiration)(
+            value
+        )
+        return region._deserialized(value)
+
+    async def get_multi(
+        self,
+        keys: Sequence[KeyType],
+        expiration_time: float | None = None,
+        ignore_expiration: bool = False,
+    ) -> list[ValuePayload | NoValueType]:
+        """Return multiple values from the cache, based on the given keys.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.get_multi`
+
+        """
+        if not keys:
+            return []
+
+        region = self._region
+        if region.key_mangler is not None:
+            keys = [region.key_mangler(key) for key in keys]
+
+        backend_values = await self._get_multi_from_backend(keys)
+
+        _unexpired_value_fn = region._unexpired_value_fn(
+            expiration_time, ignore_expiration
+        )
+        return [
+            region._deserialized(_unexpired_value_fn(value)).payload
+            for value in backend_values
+        ]
+
+    async def key_is_locked(self, key: KeyType) -> bool:
+        """Return True if a particular cache key is currently being generated
+        within the dogpile lock."""
+
+        mutex = self._region._mutex(key)
+        locked: bool = await mutex.locked()
+        return locked
+
+    async def get_or_create(
+        self,
+        key: KeyType,
+        creator: Callable[..., Awaitable[ValuePayload]],
+        expiration_time: float | None = None,
+        should_cache_fn: Callable[[ValuePayload], bool] | None = None,
+        creator_args: tuple[Any, Mapping[str, Any]] | None = None,
+    ) -> ValuePayload:
+        """Return a cached value based on the given key.
+
+        ``creator`` is a coroutine function which creates a new value.
+        While it runs, other coroutines calling upon the same key wait for
+        its result if no previous value is available, and otherwise return
+        the previous value.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.get_or_create`
+
+            :meth:`.AsyncCacheRegion.async_cache_on_arguments`
+
+        """
+        region = self._region
+        orig_key = key
+        if region.key_mangler:
+            key = region.key_mangler(key)
+
+        # see CacheRegion.get_or_create()
+        deserialize_expired = False
+
+        async def get_value():
+            value = await self._get_from_backend(key)
+            if region._is_cache_miss(value, orig_key):
+                raise NeedRegenerationException()
+
+            ct = cast(CachedValue, value).metadata["ct"]
+            if region.region_invalidator.is_soft_invalidated(ct):
+                if expiration_time is None:
+                    raise exception.DogpileCacheException(
+                        "Non-None expiration time required "
+                        "for soft invalidation"
+                    )
+                ct = time.time() - expiration_time - 0.0001
+            elif expiration_time is not None and region._is_early_expired(
+                value, ct, expiration_time
+            ):
+                ct = time.time() - expiration_time - 0.0001
+
+            if (
+                deserialize_expired
+                or expiration_time is None
+                or time.time() - ct <= expiration_time
+            ):
+                value = region._deserialized(value)
+                if value is NO_VALUE:
+                    raise NeedRegenerationException()
+
+            return value.payload, ct
+
+        async def gen_value():
+            start_time = time.time()
+            with region._log_time(orig_key):
+                if creator_args:
+                    created_value = await creator(
+                        *creator_args[0], **creator_args[1]
+                    )
+                else:
+                    created_value = await creator()
+            value = region._value(
+                created_value, region._gen_metadata(time.time() - start_time)
+            )
+
+            if (
+                expiration_time is None
+                and region.region_invalidator.was_soft_invalidated()
+            ):
+                raise exception.DogpileCacheException(
+                    "Non-None expiration time required "
+                    "for soft invalidation"
+                )
+
+            if not should_cache_fn or should_cache_fn(created_value):
+                await self._set_cached_value_to_backend(key, value)
+
+            return value.payload, value.metadata["ct"]
+
+        if expiration_time is None:
+            expiration_time = region.expiration_time
+
+        if expiration_time == -1:
+            expiration_time = None
+
+        async_creator: Callable[[Any], Awaitable[None]] | None
+        if self.async_creation_runner:
+            acr = self.async_creation_runner
+
+            async def async_creator(mutex):
+                if creator_args:
+                    ca = creator_args
+
+                    @wraps(creator)
+                    async def go():
+                        return await creator(*ca[0], **ca[1])
+
+                else:
+                    go = creator  # type: ignore
+                await acr(self, orig_key, go, mutex)
+
+        else:
+            async_creator = None
+
+        while True:
+            async with AsyncLock(
+                region._mutex(key),
+                gen_value,
+                get_value,
+                expiration_time,
+                async_creator,
+            ) as value:
+                if type(value) is not _SerializedPayload:
+                    return value
+
+            assert region.deserializer
+            try:
+                return region._loads(value)
+            except CantDeserializeException:
+                deserialize_expired = True
+
+    async def get_or_create_multi(
+        self,
+        keys: Sequence[KeyType],
+        creator: Callable[..., Awaitable[Sequence[ValuePayload]]],
+        expiration_time: float | None = None,
+        should_cache_fn: Callable[[ValuePayload], bool] | None = None,
+    ) -> Sequence[ValuePayload]:
+        """Return a sequence of cached values based on a sequence of keys.
+
+        ``creator`` is a coroutine function which accepts the keys to be
+        generated as positional arguments, and returns a sequence of new
+        values.
+
+        .. seealso::
+
+            :meth:`.CacheRegion.get_or_create_multi`
+
+        """
+        region = self._region
+
+        async def get_value(key):
+            value = values.get(key, NO_VALUE)
+
+            if not region._is_cache_miss(value, orig_key):
+                ct = cast(CachedValue, value).metadata["ct"]
+                if region.region_invalidator.is_soft_invalidated(ct):
+                    if expiration_time is None:
+                        raise exception.DogpileCacheException(
+                            "Non-None expiration time required "
+                            "for soft invalidation"
+                        )
+                    ct = time.time() - expiration_time - 0.0001
+                elif expiration_time is not None and region._is_early_expired(
+                    value, ct, expiration_time
+                ):
+                    ct = time.time() - expiration_time - 0.0001
+
+                if (
+                    expiration_time is None
+                    or time.time() - ct <= expiration_time
+                ):
+                    value = values[key] = region._deserialized(value)
+                if value is not NO_VALUE:
+                    return value.payload, ct
+
+            return value.payload, 0
+
+        async def gen_value() -> ValuePayload:
+            raise NotImplementedError()
+
+        async def async_creator(mutexes, key, mutex):
+            mutexes[key] = mutex
+
+        if expiration_time is None:
+            expiration_time = region.expiration_time
+
+        if expiration_time == -1:
+            expiration_time = None
+
+        sorted_unique_keys = sorted(set(keys))
+
+        if region.key_mangler:
+            mangled_keys = [region.key_mangler(k) for k in sorted_unique_keys]
+        else:
+            mangled_keys = sorted_unique_keys
+
+        orig_to_mangled = dict(zip(sorted_unique_keys, mangled_keys))
+
+        values = dict(
+            zip(mangled_keys, await self._get_multi_from_backend(mangled_keys))
+        )
+
+        mutexes: dict[KeyType, Any] = {}
+
+        for orig_key, mangled_key in orig_to_mangled.items():
+            async with AsyncLock(
+                region._mutex(mangled_key),
+                gen_value,
+                partial(get_value, mangled_key),
+                expiration_time,
+                async_creator=partial(async_creator, mutexes, orig_key),
+            ):
+                pass
+        try:
+            if mutexes:
+                keys_to_get = sorted(mutexes)
+
+                start_time = time.time()
+                with region._log_time(keys_to_get):
+                    new_values = await creator(*keys_to_get)
+                metadata = region._gen_metadata(time.time() - start_time)
+
+                values_w_created = {
+                    orig_to_mangled[k]: region._value(v, metadata)
+                    for k, v in zip(keys_to_get, new_values)
+                }
+
+                if (
+                    expiration_time is None
+                    and region.region_invalidator.was_soft_invalidated()
+                ):
+                    raise exception.DogpileCacheException(
+                        "Non-None expiration time required "
+                        "for soft invalidation"
+                    )
+
+                if not should_cache_fn:
+                    await self._set_multi_cached_value_to_backend(
+                        values_w_created
+                    )
+                else:
+                    await self._set_multi_cached_value_to_backend(
+                        {
+                            k: v
+                            for k, v in values_w_created.items()
+                            if should_cache_fn(v.payload)
+                        }
+                    )
+
+                values.update(values_w_created)
+            result = []
+            # see CacheRegion.get_or_create_multi()
+            undeserialized = []
+            for index, k in enumerate(keys):
+                value = region._deserialized(values[orig_to_mangled[k]])
+                if value is NO_VALUE:
+                    undeserialized.append((index, k))
+                result.append(value.payload)
+        finally:
+            for mutex in mutexes.values():
+                await mutex.release()
+
+        async def create_one(k):
+            return (await creator(k))[0]
+
+        for index, k in undeserialized:
+            result[index] = await self.get_or_create(
+                k,
+                partial(create_one, k),
+                -1 if expiration_time is None else expiration_time,
+                should_cache_fn,
+            )
+        return result
+
+    async def _get_from_backend(self, key: KeyType) -> CacheReturnType:
+        region = self._region
+        if region.deserializer:
+            return region._parse_serialized_metadata(
+                await region.backend.get_serialized(key)
+            )
+        else:
+            return cast(CacheReturnType, await region.backend.get(key))
+
+    async def _get_multi_from_backend(
+        self, keys: Sequence[KeyType]
+    ) -> Sequence[CacheReturnType]:
+        region = self._region
+        if region.deserializer:
+            serialized: Sequence[SerializedReturnType] = (
+                await region.backend.get_serialized_multi(keys)
+            )
+            return [region._parse_serialized_metadata(v) for v in serialized]
+        else:
+            return cast(
+                Sequence[CacheReturnType],
+                await region.backend.get_multi(keys),
+            )
+
+    async def _set_cached_value_to_backend(
+        self, key: KeyType, value: CachedValue
+    ) -> None:
+        region = self._region
+        if region.serializer:
+            await region.backend.set_serialized(
+                key, region._serialized_cached_value(value)
+            )
+        else:
+            await region.backend.set(key, value)
+
+    async def _set_multi_cached_value_to_backend(
+        self, mapping: Mapping[KeyType, CachedValue]
+    ) -> None:
+        if not mapping:
+            return
+
+        region = self._region
+        if region.serializer:
+            await region.backend.set_serialized_multi(
+                {
+                    k: region._serialized_cached_value(v)
+                    for k, v in mapping.items()
+                }
+            )
+        else:
+            await region.backend.set_multi(mapping)
+
+    async def set(self, key: KeyType, value: ValuePayload) -> None:
+        """Place a new value in the cache under the given key."""
+
+        region = self._region
+        if region.key_mangler:
+            key = region.key_mangler(key)
+
+        if region.serializer:
+            await region.backend.set_serialized(
+                key, region._serialized_payload(value)
+            )
+        else:
+            await region.backend.set(key, region._value(value))
+
+    async def set_multi(self, mapping: Mapping[KeyType, ValuePayload]) -> None:
+        """Place new values in the cache under the given keys."""
+        if not mapping:
+            return
+
+        region = self._region
+        metadata = region._gen_metadata()
+        km = region.key_mangler or (lambda key: key)
+
+        if region.serializer:
+            await region.backend.set_serialized_multi(
+                {
+                    km(k): region._serialized_payload(v, metadata=metadata)
+                    for k, v in mapping.items()
+                }
+            )
+        else:
+            await region.backend.set_multi(
+                {
+                    km(k): region._value(v, metadata=metadata)
+                    for k, v in mapping.items()
+                }
+            )
+
+    async def delete(self, key: KeyType) -> None:
+        """Remove a value from the cache.
+
+        This operation is idempotent (can be called multiple times, or on a
+        non-existent key, safely)
+        """
+
+        region = self._region
+        if region.key_mangler:
+            key = region.key_mangler(key)
+
+        await region.backend.delete(key)
+
+    async def delete_multi(self, keys: Iterable[KeyType]) -> None:
+        """Remove multiple values from the cache.
+
+        This operation is idempotent (can be called multiple times, or on a
+        non-existent key, safely)
+
+        """
+
+        region = self._region
+        if region.key_mangler:
+            km = region.key_mangler
+            keys = [km(key) for key in keys]
+        else:
+            keys = list(keys)
+
+        await region.backend.delete_multi(keys)
+
+    def async_cache_on_arguments(
+        self,
+        namespace: str | None = None,
+        expiration_time: float | ExpirationTimeCallable | None = None,
+        should_cache_fn: Callable[[ValuePayload], bool] | None = None,
+        to_str: Callable[[Any], str] = str,
+        function_key_generator: FunctionKeyGenerator | None = None,
+    ) -> Callable[[Callable[..., Awaitable[ValuePayload]]], Any]:
+        """A decorator for ``async def`` functions that will cache the return
+        value of the function using a key derived from the function itself
+        and its arguments.
+
+        The decorator internally makes use of the
+        :meth:`.AsyncCacheRegion.get_or_create` method, and accepts the
+        same arguments as :meth:`.CacheRegion.cache_on_arguments`::
+
+            @someregion.async_cache_on_arguments()
+            async def generate_something(x, y):
+                return await somedatabase.query(x, y)
+
+        The decorated function can then be awaited normally, where
+        data will be pulled from the cache region unless a new
+        value is needed::
+
+            result = await generate_something(5, 6)
+
+        The function is also given the coroutine functions
+        ``invalidate()``, ``set()``, ``get()`` and ``refresh()``, which
+        correspond to those of :meth:`.CacheRegion.cache_on_arguments`::
+
+            await generate_something.invalidate(5, 6)
+
+        """
+        expiration_time_is_callable = callable(expiration_time)
+
+        if function_key_generator is None:
+            _function_key_generator = self._region.function_key_generator
+        else:
+            _function_key_generator = function_key_generator
+
+        async def get_or_create_for_user_func(
+            key_generator, user_func, *arg, **kw
+        ):
+            key = key_generator(*arg, **kw)
+
+            timeout: float | None = (
+                cast(ExpirationTimeCallable, expiration_time)()
+                if expiration_time_is_callable
+                else cast(float | None, expiration_time)
+            )
+            return await self.get_or_create(
+                key, user_func, timeout, should_cache_fn, (arg, kw)
+            )
+
+        def cache_decorator(user_func):
+            if to_str is cast(Callable[[Any], str], str):
+                # backwards compatible
+                key_generator = _function_key_generator(namespace, user_func)
+            else:
+                key_generator = _function_key_generator(
+                    namespace, user_func, to_str
+                )
+
+            async def refresh(*arg, **kw):
+                """
+                Like invalidate, but regenerates the value instead
+                """
+                key = key_generator(*arg, **kw)
+                value = await user_func(*arg, **kw)
+                await self.set(key, value)
+                return value
+
+            async def invalidate(*arg, **kw):
+                key = key_generator(*arg, **kw)
+                await self.delete(key)
+
+            async def set_(value, *arg, **kw):
+                key = key_generator(*arg, **kw)
+                await self.set(key, value)
+
+            async def get(*arg, **kw):
+                key = key_generator(*arg, **kw)
+                return await self.get(key)
+
+            user_func.set = set_
+            user_func.invalidate = invalidate
+            user_func.get = get
+            user_func.refresh = refresh
+            user_func.original = user_func
+
+            # Use `decorate` to preserve the signature of :param:`user_func`.
+
+            return decorate(
+                user_func, partial(get_or_create_for_user_func, key_generator)
+            )
+
+        return cache_decorator
+
+
+def make_async_region(*arg: Any, **kw: Any) -> AsyncCacheRegion:
+    """Instantiate a new :class:`.AsyncCacheRegion`.
+
+    Currently, :func:`.make_async_region` is a passthrough
+    to :class:`.AsyncCacheRegion`.  See that class for
+    constructor arguments.
+
+    .. versionadded:: 1.5.1
+
+    """
+    return AsyncCacheRegion(*arg, **kw)
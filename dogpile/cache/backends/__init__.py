@@ -9,6 +9,11 @@ register_backend(
 register_backend(
     "dogpile.cache.dbm", "dogpile.cache.backends.file", "DBMBackend"
 )
+register_backend(
+    "dogpile.cache.directory",
+    "dogpile.cache.backends.file",
+    "DirectoryBackend",
+)
 register_backend(
     "dogpile.cache.pylibmc",
     "dogpile.cache.backends.memcached",
@@ -37,6 +42,51 @@ register_backend(
     "dogpile.cache.backends.memory",
     "MemoryPickleBackend",
 )
+register_backend(
+    "dogpile.cache.memory_bounded",
+    "dogpile.cache.backends.memory",
+    "BoundedMemoryBackend",
+)
+register_backend(
+    "dogpile.cache.memory_bounded_pickle",
+    "dogpile.cache.backends.memory",
+    "BoundedMemoryPickleBackend",
+)
+register_backend(
+    "dogpile.cache.memory_bytes_bounded",
+    "dogpile.cache.backends.memory",
+    "ByteBoundedMemoryBackend",
+)
+register_backend(
+    "dogpile.cache.memory_bytes_bounded_pickle",
+    "dogpile.cache.backends.memory",
+    "ByteBoundedMemoryPickleBackend",
+)
+register_backend(
+    "dogpile.cache.memory_sharded",
+    "dogpile.cache.backends.memory",
+    "ShardedMemoryBackend",
+)
+register_backend(
+    "dogpile.cache.memory_sharded_pickle",
+    "dogpile.cache.backends.memory",
+    "ShardedMemoryPickleBackend",
+)
+register_backend(
+    "dogpile.cache.memory_async",
+    "dogpile.cache.backends.memory",
+    "AsyncMemoryBackend",
+)
+register_backend(
+    "dogpile.cache.memory_async_pickle",
+    "dogpile.cache.backends.memory",
+    "AsyncMemoryPickleBackend",
+)
+register_backend(
+    "dogpile.cache.shared_memory",
+    "dogpile.cache.backends.shared_memory",
+    "SharedMemoryBackend",
+)
 register_backend(
     "dogpile.cache.redis", "dogpile.cache.backends.redis", "RedisBackend"
 )
@@ -50,6 +100,19 @@ register_backend(
     "dogpile.cache.backends.redis",
     "RedisClusterBackend",
 )
+register_backend(
+    "dogpile.cache.redis_async",
+    "dogpile.cache.backends.redis",
+    "AsyncRedisBackend",
+)
+register_backend(
+    "dogpile.cache.sqlite", "dogpile.cache.backends.sqlite", "SQLiteBackend"
+)
+register_backend(
+    "dogpile.cache.log_structured",
+    "dogpile.cache.backends.log_structured",
+    "LogStructuredBackend",
+)
 register_backend(
     "dogpile.cache.valkey", "dogpile.cache.backends.valkey", "ValkeyBackend"
 )
@@ -63,3 +126,8 @@ register_backend(
     "dogpile.cache.backends.valkey",
     "ValkeyClusterBackend",
 )
+register_backend(
+    "dogpile.cache.valkey_async",
+    "dogpile.cache.backends.valkey",
+    "AsyncValkeyBackend",
+)
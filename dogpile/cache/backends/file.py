@@ -8,14 +8,18 @@ Provides backends that deal with local filesystem access.
 
 from contextlib import contextmanager
 import dbm
+import hashlib
 import os
 import threading
+import time
+import weakref
+import zlib
 
 from ..api import BytesBackend
 from ..api import NO_VALUE
 from ... import util
 
-__all__ = ["DBMBackend", "FileLock", "AbstractFileLock"]
+__all__ = ["DBMBackend", "DirectoryBackend", "FileLock", "AbstractFileLock"]
 
 
 class DBMBackend(BytesBackend):
@@ -57,19 +61,35 @@ class DBMBackend(BytesBackend):
     can be dropped in using the ``lock_factory`` argument
     in conjunction with the :class:`.AbstractFileLock` base class.
 
-    Currently, the dogpile lock is against the entire
+    By default, the dogpile lock is against the entire
     DBM file, not per key.   This means there can
     only be one "creator" job running at a time
-    per dbm file.
-
-    A future improvement might be to have the dogpile lock
-    using a filename that's based on a modulus of the key.
-    Locking on a filename that uniquely corresponds to the
-    key is problematic, since it's not generally safe to
+    per dbm file.  The ``dogpile_lockfile_stripes`` argument
+    instead spreads keys among a fixed number of dogpile
+    lockfiles, based on a hash of the key, so that values whose
+    keys fall into different lockfiles may be created at the
+    same time.  Locking on a filename that uniquely corresponds
+    to the key is avoided, since it's not generally safe to
     delete lockfiles as the application runs, implying an
     unlimited number of key-based files would need to be
     created and never deleted.
 
+    Each thread keeps the DBM file open for reading between calls,
+    rather than opening it for every read.  Each write records a new
+    "generation" in a small file alongside the DBM file, named by
+    appending the suffix ".generation" to the DBM filename; a reader
+    reopens the DBM file when it finds the generation has changed, so
+    that values written by other processes are seen.  The ``*_multi()``
+    methods open the DBM file and acquire the read/write lock once per
+    call.
+
+    The handles kept open by each thread, and the generation file, are
+    closed by :meth:`.DBMBackend.close`; a handle is otherwise closed
+    once its thread has exited and it is garbage collected.
+
+    .. versionchanged:: 1.5.1  The DBM file is kept open for reading,
+       and reopened only after a write.
+
     Parameters to the ``arguments`` dictionary are
     below.
 
@@ -86,6 +106,17 @@ class DBMBackend(BytesBackend):
      suffix ".dogpile.lock" to the DBM filename. If
      False, then dogpile.cache uses the default dogpile
      lock, a plain thread-based mutex.
+    :param dogpile_lockfile_stripes: number of dogpile lockfiles
+     among which keys are spread.  Defaults to 1, in which case
+     one lockfile is used for all keys.  When greater than 1, the
+     suffix ".0", ".1" and so on is appended to the name of each
+     lockfile, and a key uses the lockfile selected by the CRC32
+     checksum of the key, which is the same in every process.
+     Values whose keys share a lockfile are still created one at
+     a time.
+
+     .. versionadded:: 1.5.1
+
     :param lock_factory: a function or class which provides
      for a read/write lock.  Defaults to :class:`.FileLock`.
      Custom implementations need to implement context-manager
@@ -147,15 +178,42 @@ class DBMBackend(BytesBackend):
         self._rw_lock = self._init_lock(
             arguments.get("rw_lockfile"), ".rw.lock", dir_, filename
         )
-        self._dogpile_lock = self._init_lock(
-            arguments.get("dogpile_lockfile"),
-            ".dogpile.lock",
-            dir_,
-            filename,
-            util.KeyReentrantMutex.factory,
+        self.dogpile_lockfile_stripes = int(
+            arguments.get("dogpile_lockfile_stripes", 1)
         )
+        dogpile_lockfile = arguments.get("dogpile_lockfile")
+        if self.dogpile_lockfile_stripes == 1:
+            self._dogpile_locks = [
+                self._init_lock(
+                    dogpile_lockfile,
+                    ".dogpile.lock",
+                    dir_,
+                    filename,
+                    util.KeyReentrantMutex.factory,
+                )
+            ]
+        else:
+            self._dogpile_locks = [
+                self._init_lock(
+                    dogpile_lockfile and "%s.%d" % (dogpile_lockfile, stripe),
+                    ".dogpile.lock.%d" % stripe,
+                    dir_,
+                    filename,
+                    util.KeyReentrantMutex.factory,
+                )
+                for stripe in range(self.dogpile_lockfile_stripes)
+            ]
 
         self._init_dbm_file()
+        self._dbm_module = dbm.whichdb(self.filename)
+
+        self._generation_file = self.filename + ".generation"
+        self._generation_fd = os.open(
+            self._generation_file, os.O_RDWR | os.O_CREAT
+        )
+        self._readers = threading.local()
+        self._all_readers: weakref.WeakSet[_DBMReader] = weakref.WeakSet()
+        self._all_readers_lock = threading.Lock()
 
     def _init_lock(self, argument, suffix, basedir, basefile, wrapper=None):
         if argument is None:
@@ -182,15 +240,24 @@ class DBMBackend(BytesBackend):
             fh.close()
 
     def get_mutex(self, key):
-        # using one dogpile for the whole file.   Other ways
-        # to do this might be using a set of files keyed to a
-        # hash/modulus of the key.   the issue is it's never
-        # really safe to delete a lockfile as this can
-        # break other processes trying to get at the file
-        # at the same time - so handling unlimited keys
-        # can't imply unlimited filenames
-        if self._dogpile_lock:
-            return self._dogpile_lock(key)
+        # using a fixed set of dogpile lockfiles, selected by a
+        # hash/modulus of the key.   it's never really safe to delete
+        # a lockfile as this can break other processes trying to get
+        # at the file at the same time - so handling unlimited keys
+        # can't imply unlimited filenames.  keys sharing a lockfile
+        # are reentrant within a thread, so that a creator may get
+        # or create another key
+        if self.dogpile_lockfile_stripes == 1:
+            lock = self._dogpile_locks[0]
+        else:
+            lock = self._dogpile_locks[
+                zlib.crc32(
+                    key if isinstance(key, bytes) else key.encode("utf-8")
+                )
+                % self.dogpile_lockfile_stripes
+            ]
+        if lock:
+            return lock(key)
         else:
             return None
 
@@ -205,45 +272,123 @@ class DBMBackend(BytesBackend):
             with self._rw_lock.read():
                 yield
 
+    def _open_reader(self):
+        if self._dbm_module == "dbm.gnu":
+            # without the "u" flag, gdbm holds a lock on the file for as
+            # long as it's open, which would prevent writes; the rw lock
+            # coordinates access instead
+            from dbm import gnu
+
+            return gnu.open(self.filename, "ru")
+        else:
+            return dbm.open(self.filename, "r")
+
     @contextmanager
-    def _dbm_file(self, write):
-        with self._use_rw_lock(write):
-            with dbm.open(self.filename, "w" if write else "r") as dbm_obj:
-                yield dbm_obj
+    def _dbm_reader(self):
+        with self._use_rw_lock(False):
+            reader = getattr(self._readers, "reader", None)
+            if reader is None:
+                reader = self._readers.reader = _DBMReader()
+                with self._all_readers_lock:
+                    self._all_readers.add(reader)
+            generation = self._read_generation()
+            pid = os.getpid()
+            if (
+                reader.dbm is None
+                or reader.generation != generation
+                or reader.pid != pid
+            ):
+                # the file has been written to since this thread opened
+                # it, or the process has forked
+                reader.close()
+                reader.dbm = self._open_reader()
+                reader.generation = generation
+                reader.pid = pid
+            yield reader.dbm
+
+    @contextmanager
+    def _dbm_writer(self):
+        with self._use_rw_lock(True):
+            try:
+                with dbm.open(self.filename, "w") as dbm_obj:
+                    yield dbm_obj
+            finally:
+                # a new generation has readers reopen the file
+                self._write_generation(os.urandom(8))
+
+    if hasattr(os, "pread"):
+
+        def _read_generation(self):
+            return os.pread(self._generation_fd, 8, 0)
+
+        def _write_generation(self, generation):
+            os.pwrite(self._generation_fd, generation, 0)
+
+    else:
+
+        def _read_generation(self):
+            with open(self._generation_file, "rb") as file_:
+                return file_.read(8)
+
+        def _write_generation(self, generation):
+            with open(self._generation_file, "r+b") as file_:
+                file_.write(generation)
+
+    def close(self):
+        """Close the DBM file handles kept open for reading by all
+        threads, and the generation file.
+
+        The backend can't be used once closed, and shouldn't be closed
+        while other threads are using it.
+
+        .. versionadded:: 1.5.1
+
+        """
+        with self._all_readers_lock:
+            readers = list(self._all_readers)
+            self._all_readers.clear()
+        for reader in readers:
+            reader.close()
+        if self._generation_fd != -1:
+            os.close(self._generation_fd)
+            self._generation_fd = -1
+
+    def _get(self, dbm_obj, key):
+        if hasattr(dbm_obj, "get"):
+            return dbm_obj.get(key, NO_VALUE)
+        else:
+            # gdbm objects lack a .get method
+            try:
+                return dbm_obj[key]
+            except KeyError:
+                return NO_VALUE
 
     def get_serialized(self, key):
-        with self._dbm_file(False) as dbm_obj:
-            if hasattr(dbm_obj, "get"):
-                value = dbm_obj.get(key, NO_VALUE)
-            else:
-                # gdbm objects lack a .get method
-                try:
-                    value = dbm_obj[key]
-                except KeyError:
-                    value = NO_VALUE
-            return value
+        with self._dbm_reader() as dbm_obj:
+            return self._get(dbm_obj, key)
 
     def get_serialized_multi(self, keys):
-        return [self.get_serialized(key) for key in keys]
+        with self._dbm_reader() as dbm_obj:
+            return [self._get(dbm_obj, key) for key in keys]
 
     def set_serialized(self, key, value):
-        with self._dbm_file(True) as dbm_obj:
+        with self._dbm_writer() as dbm_obj:
             dbm_obj[key] = value
 
     def set_serialized_multi(self, mapping):
-        with self._dbm_file(True) as dbm_obj:
+        with self._dbm_writer() as dbm_obj:
             for key, value in mapping.items():
                 dbm_obj[key] = value
 
     def delete(self, key):
-        with self._dbm_file(True) as dbm_obj:
+        with self._dbm_writer() as dbm_obj:
             try:
                 del dbm_obj[key]
             except KeyError:
                 pass
 
     def delete_multi(self, keys):
-        with self._dbm_file(True) as dbm_obj:
+        with self._dbm_writer() as dbm_obj:
             for key in keys:
                 try:
                     del dbm_obj[key]
@@ -251,6 +396,267 @@ class DBMBackend(BytesBackend):
                     pass
 
 
+class _DBMReader:
+    """A DBM file handle kept open for reading by one thread."""
+
+    __slots__ = ("dbm", "generation", "pid", "__weakref__")
+
+    def __init__(self):
+        self.dbm = None
+        self.generation = None
+        self.pid = None
+
+    def close(self):
+        if self.dbm is not None:
+            self.dbm.close()
+            self.dbm = None
+
+
+def _run_evictor(backend_ref, interval):
+    while True:
+        time.sleep(interval)
+        backend = backend_ref()
+        if backend is None:
+            return
+        backend.evict()
+        del backend
+
+
+class DirectoryBackend(BytesBackend):
+    """A file-backend which stores each value in its own file within a
+    directory.
+
+    Basic usage::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.directory',
+            expiration_time = 3600,
+            arguments = {
+                "directory": "/path/to/cachedir",
+                "max_size": 10 * 1024 ** 3,
+            }
+        )
+
+    Unlike :class:`.DBMBackend`, no lock is taken to read or write a
+    value, so that writers of different keys never wait for each other,
+    and the time taken to store or retrieve a value of many megabytes
+    doesn't depend on the number or size of the other values.  This
+    suits large values, such as rendered reports.
+
+    Each key is hashed to a filename, placed in a tree of subdirectories
+    named by the leading characters of the hash so that no single
+    directory holds too many files.  A value is written to a temporary
+    file in the same subdirectory, which then replaces the value's file
+    using ``os.replace()``, so that a reader sees either the old value or
+    the new value in full, never a partially written one.
+
+    When ``max_size`` is given, a background daemon thread periodically
+    removes the least recently used files until their total size is
+    within this limit.  Recency is based on the access time of each
+    file, which the backend updates when a value is read, at most once
+    per ``touch_interval``, so that it doesn't depend on how the
+    filesystem is mounted.  The thread exits once the backend is garbage
+    collected.
+
+    The dogpile lock is coordinated among processes using lockfiles in
+    the directory, among which keys are spread as described for the
+    ``dogpile_lockfile_stripes`` argument of :class:`.DBMBackend`.  These
+    use the ``flock()`` system call by default, which is **only
+    available on Unix platforms**.
+
+    Parameters to the ``arguments`` dictionary are
+    below.
+
+    :param directory: path of the directory in which to store values,
+     which is created if it does not exist.
+    :param levels: number of levels of subdirectories, each named by two
+     characters of the hash of the key.  Defaults to 2, giving 65536
+     subdirectories.
+    :param max_size: maximum total size in bytes of the stored values.
+     If omitted, the size is not limited.
+    :param eviction_interval: when used with ``max_size``, the interval
+     in seconds at which the background thread removes files.  Defaults
+     to 60.  If False, no thread is started, and :meth:`.evict` should be
+     called by the application.
+    :param touch_interval: when used with ``max_size``, the minimum
+     number of seconds between updates of the access time of a file.
+     Defaults to 60.
+    :param dogpile_lockfile_stripes: number of dogpile lockfiles among
+     which keys are spread.  Defaults to 16.
+    :param dogpile_lockfile: if False, dogpile.cache uses the default
+     dogpile lock, a plain thread-based mutex.
+    :param lock_factory: a function or class which provides the dogpile
+     lock given a filename; see :class:`.DBMBackend`.  Defaults to
+     :class:`.FileLock`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    _stale_tmp_age = 3600
+    """Age in seconds after which a temporary file, left by a process
+    which exited while writing a value, is removed by :meth:`.evict`."""
+
+    def __init__(self, arguments):
+        self.directory = os.path.abspath(
+            os.path.normpath(arguments["directory"])
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        self.levels = int(arguments.get("levels", 2))
+        max_size = arguments.get("max_size")
+        self.max_size = int(max_size) if max_size else None
+        self.touch_interval = float(arguments.get("touch_interval", 60))
+
+        self.lock_factory = arguments.get("lock_factory", FileLock)
+        self.dogpile_lockfile_stripes = int(
+            arguments.get("dogpile_lockfile_stripes", 16)
+        )
+        if arguments.get("dogpile_lockfile", True) is False:
+            self._dogpile_locks = None
+        else:
+            self._dogpile_locks = [
+                util.KeyReentrantMutex.factory(
+                    self.lock_factory(
+                        os.path.join(
+                            self.directory, "dogpile.lock.%d" % stripe
+                        )
+                    )
+                )
+                for stripe in range(self.dogpile_lockfile_stripes)
+            ]
+
+        eviction_interval = arguments.get("eviction_interval", 60)
+        if self.max_size is not None and eviction_interval:
+            evictor = threading.Thread(
+                target=_run_evictor,
+                args=(weakref.ref(self), eviction_interval),
+                name="dogpile.cache directory evictor",
+                daemon=True,
+            )
+            evictor.start()
+
+    def get_mutex(self, key):
+        if self._dogpile_locks is None:
+            return None
+        return self._dogpile_locks[
+            zlib.crc32(key.encode("utf-8")) % self.dogpile_lockfile_stripes
+        ](key)
+
+    def _path(self, key):
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(
+            self.directory,
+            *[name[level * 2 : level * 2 + 2] for level in range(self.levels)],
+            name,
+        )
+
+    def get_serialized(self, key):
+        path = self._path(key)
+        try:
+            # an unbuffered file reads the whole value with one read of
+            # its size, without copying it through a buffer
+            with open(path, "rb", buffering=0) as file_:
+                if self.max_size is not None:
+                    self._touch(path, file_.fileno())
+                return file_.readall()
+        except FileNotFoundError:
+            return NO_VALUE
+
+    def _touch(self, path, fileno):
+        now = time.time()
+        stat = os.fstat(fileno)
+        if stat.st_atime < now - self.touch_interval:
+            try:
+                os.utime(path, (now, stat.st_mtime))
+            except FileNotFoundError:
+                pass
+
+    def get_serialized_multi(self, keys):
+        return [self.get_serialized(key) for key in keys]
+
+    def set_serialized(self, key, value):
+        path = self._path(key)
+        # unique to this thread, so that concurrent writers of the same
+        # key don't write to the same temporary file
+        tmp_path = "%s.%d.%d.tmp" % (path, os.getpid(), threading.get_ident())
+        try:
+            file_ = open(tmp_path, "wb")
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_ = open(tmp_path, "wb")
+        try:
+            with file_:
+                file_.write(value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def set_serialized_multi(self, mapping):
+        for key, value in mapping.items():
+            self.set_serialized(key, value)
+
+    def delete(self, key):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def delete_multi(self, keys):
+        for key in keys:
+            self.delete(key)
+
+    def _scan(self, path, level, now, files):
+        try:
+            entries = list(os.scandir(path))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            try:
+                if level < self.levels:
+                    if len(entry.name) == 2 and entry.is_dir():
+                        self._scan(entry.path, level + 1, now, files)
+                    continue
+                stat = entry.stat()
+                if entry.name.endswith(".tmp"):
+                    if stat.st_mtime < now - self._stale_tmp_age:
+                        os.unlink(entry.path)
+                elif len(entry.name) == 32:
+                    files.append((stat.st_atime, stat.st_size, entry.path))
+            except FileNotFoundError:
+                # removed by another process during the scan
+                pass
+
+    def evict(self):
+        """Remove the least recently used files until the total size of
+        the stored values is within ``max_size``.
+
+        Has no effect if the ``max_size`` argument is not in use.
+
+        """
+        if self.max_size is None:
+            return
+        files: list[tuple[float, int, str]] = []
+        self._scan(self.directory, 0, time.time(), files)
+        size = sum(file_size for atime, file_size, path in files)
+        if size <= self.max_size:
+            return
+        files.sort()
+        for atime, file_size, path in files:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
+            if size <= self.max_size:
+                break
+
+
 class AbstractFileLock:
     """Coordinate read/write access to a file.
 
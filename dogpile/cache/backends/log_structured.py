@@ -0,0 +1,662 @@
+"""
+Log-Structured Backend
+----------------------
+
+Provides a backend which appends values to log files on local disk,
+locating them with an index held in memory, in the manner of Bitcask.
+
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+import threading
+import time
+from typing import Any
+import weakref
+import zlib
+
+from ..api import BytesBackend
+from ..api import NO_VALUE
+
+__all__ = ["LogStructuredBackend"]
+
+# a record is the CRC32 checksum of the rest of the record, followed by
+# the sequence number, expiry time or 0, key length, value length or
+# _TOMBSTONE, the key and the value
+_CRC = struct.Struct("<I")
+_RECORD = struct.Struct("<QdII")
+_HEADER_SIZE = _CRC.size + _RECORD.size
+
+# a hint file entry is the sequence number, offset and length of a
+# record, its value length or _TOMBSTONE, key length and expiry time,
+# followed by the key
+_HINT = struct.Struct("<QQIIId")
+_HINT_HEADER = struct.Struct("<8sI")
+_HINT_MAGIC = b"DPHINT\x00\x01"
+
+_TOMBSTONE = 0xFFFFFFFF
+
+_WRITE_BUFFER = 1024 * 1024
+
+# lists the segments merged by a compaction while they are removed
+_COMPACTION_FILE = "compaction"
+
+
+def _pack_record(seq, expires, key_bytes, value):
+    header = _RECORD.pack(
+        seq,
+        expires,
+        len(key_bytes),
+        _TOMBSTONE if value is None else len(value),
+    )
+    crc = zlib.crc32(key_bytes, zlib.crc32(header))
+    if value is None:
+        return _CRC.pack(crc) + header + key_bytes
+    return _CRC.pack(zlib.crc32(value, crc)) + header + key_bytes + value
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _write_file(path, data):
+    """Write a small file atomically."""
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file_:
+        file_.write(data)
+    os.replace(tmp_path, path)
+
+
+def _run_compactor(backend_ref, interval):
+    while True:
+        time.sleep(interval)
+        backend = backend_ref()
+        if backend is None or backend._closed:
+            return
+        backend._maybe_compact()
+        del backend
+
+
+class _Segment:
+    """A data file, open for reading.
+
+    The file is closed when the segment is no longer referenced, so that
+    a value being read from a segment removed by compaction is read in
+    full.
+
+    """
+
+    __slots__ = ("id", "path", "file", "fd", "size", "dead", "expires")
+
+    def __init__(self, directory, id_):
+        self.id = id_
+        self.path = os.path.join(directory, "%09d.data" % id_)
+        self.file = open(self.path, "rb", buffering=0)
+        self.fd = self.file.fileno()
+
+        self.size = 0
+        """Size of the file."""
+
+        self.dead = 0
+        """Total length of the records which have been overwritten or
+        deleted."""
+
+        self.expires = 0.0
+        """Time at which every value in the segment has expired."""
+
+    @property
+    def hint_path(self):
+        return self.path[:-5] + ".hint"
+
+
+class LogStructuredBackend(BytesBackend):
+    """A backend which appends values to log files on local disk, for
+    regions which write often.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.log_structured',
+            expiration_time=600,
+            arguments={
+                "directory": "/var/cache/myapp",
+                "expiration_time": 3600,
+            }
+        )
+
+    Rather than updating a value in place, each value set or deleted is
+    appended as a record to the current "segment" file in the directory,
+    so that a write is a single ``write()`` of all of the values passed
+    to :meth:`.CacheRegion.set_multi`, with no lookup or reorganization
+    of existing data.  The location of the latest record of each key is
+    held in a dictionary in memory, so that a value is read with a single
+    ``pread()``.  The index holds each key and around 100 bytes besides,
+    so the number of keys is limited by the memory of the process rather
+    than the size of the values.
+
+    A new segment is started once the current one reaches
+    ``segment_size``.  Records which are overwritten, deleted or expired
+    remain in the older segments until they are compacted: a background
+    daemon thread periodically checks the proportion of the older
+    segments taken up by such records, and once it reaches
+    ``compaction_ratio``, copies the remaining values to new segments
+    and removes the old ones, while values continue to be read and
+    written.
+
+    When a segment is finished, a "hint" file alongside it records the
+    key and location of each of its records, so that the index can be
+    rebuilt when the backend is next opened without reading the values,
+    and the values stored survive a restart of the application.  Values
+    are not flushed to disk as they are written, so a crash of the
+    operating system may lose recently written values; records which are
+    incomplete are discarded when the backend is opened.
+
+    Only one process may use the directory at a time, as each process
+    holds its own index; the directory is locked using the ``flock()``
+    system call, which is **only available on Unix platforms**, and the
+    backend can't be used by a child process forked from the one which
+    created it.  For a cache shared by several processes, see
+    :class:`.SQLiteBackend` or :class:`.DirectoryBackend`.  The dogpile
+    lock used is the default thread-based mutex.
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param directory: Path of the directory holding the segment files,
+     which is created if it does not exist.
+
+    :param expiration_time: Optional.  Number of seconds after being set
+     at which a value expires, and is removed by compaction.
+
+    :param segment_size: Optional.  Size in bytes at which a new segment
+     file is started; defaults to 64 MB.
+
+    :param compaction_ratio: Optional.  Proportion of the segments, other
+     than the one being written, taken up by overwritten, deleted or
+     expired records at which they are compacted; defaults to 0.5.
+
+    :param compaction_interval: Optional.  Interval in seconds at which
+     the background thread checks whether to compact segments; defaults
+     to 60.  If False, no thread is started, and :meth:`.compact` should
+     be called by the application.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self, arguments):
+        import fcntl
+
+        self.directory = os.path.abspath(
+            os.path.normpath(arguments["directory"])
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        expiration_time = arguments.get("expiration_time")
+        self.expiration_time = (
+            float(expiration_time) if expiration_time else None
+        )
+        self.segment_size = int(
+            arguments.get("segment_size", 64 * 1024 * 1024)
+        )
+        self.compaction_ratio = float(arguments.get("compaction_ratio", 0.5))
+
+        self._lockfile = open(os.path.join(self.directory, "lock"), "wb")
+        try:
+            fcntl.flock(self._lockfile, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as err:
+            self._lockfile.close()
+            raise RuntimeError(
+                "Directory %r is in use by another process" % self.directory
+            ) from err
+        self._pid = os.getpid()
+        self._closed = False
+
+        # serializes writes and changes to the set of segments
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+
+        # key -> (segment, value offset, value length, record length,
+        # sequence number, expiry time or 0)
+        self._index: dict[str, tuple[Any, ...]] = {}
+        self._segments: dict[int, _Segment] = {}
+        self._seq = 0
+        self._next_id = 0
+        self._active: Any = None
+        self._active_fd = -1
+        self._active_hints = bytearray()
+
+        with self._lock:
+            self._load()
+            self._roll()
+
+        compaction_interval = arguments.get("compaction_interval", 60)
+        if compaction_interval:
+            compactor = threading.Thread(
+                target=_run_compactor,
+                args=(weakref.ref(self), compaction_interval),
+                name="dogpile.cache log compactor",
+                daemon=True,
+            )
+            compactor.start()
+
+    def _load(self):
+        # assumes self._lock is held
+        compaction_path = os.path.join(self.directory, _COMPACTION_FILE)
+        if os.path.exists(compaction_path):
+            # the previous compaction wrote its output but didn't finish
+            # removing the merged segments
+            with open(compaction_path, "rb") as file_:
+                merged = [int(id_) for id_ in file_.read().split()]
+            for id_ in merged:
+                self._remove_files(os.path.join(self.directory, "%09d" % id_))
+            os.unlink(compaction_path)
+
+        ids = sorted(
+            int(name[:-5])
+            for name in os.listdir(self.directory)
+            if name.endswith(".data") and name[:-5].isdigit()
+        )
+        deleted: dict[str, int] = {}
+        for id_ in ids:
+            self._next_id = id_ + 1
+            segment = _Segment(self.directory, id_)
+            segment.size = os.fstat(segment.fd).st_size
+            if not segment.size:
+                self._remove_files(segment.path[:-5])
+                continue
+            self._segments[id_] = segment
+            hints = self._read_hints(segment)
+            if hints is None:
+                hints = self._scan(segment)
+                _write_file(segment.hint_path, self._hint_file(hints))
+            self._apply_hints(segment, hints, deleted)
+
+    def _read_hints(self, segment):
+        try:
+            with open(segment.hint_path, "rb") as file_:
+                data = file_.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < _HINT_HEADER.size:
+            return None
+        magic, crc = _HINT_HEADER.unpack_from(data)
+        hints = data[_HINT_HEADER.size :]
+        if magic != _HINT_MAGIC or zlib.crc32(hints) != crc:
+            return None
+        return hints
+
+    def _hint_file(self, hints):
+        return _HINT_HEADER.pack(_HINT_MAGIC, zlib.crc32(hints)) + hints
+
+    def _scan(self, segment):
+        """Read the records of a segment without a hint file, returning
+        the hints for them.
+
+        Reading stops at the first incomplete record, left by a crash
+        while it was written.
+
+        """
+        with open(segment.path, "rb") as file_:
+            data = file_.read()
+        view = memoryview(data)
+        hints = bytearray()
+        position = 0
+        while position + _HEADER_SIZE <= len(data):
+            (crc,) = _CRC.unpack_from(data, position)
+            seq, expires, key_length, value_length = _RECORD.unpack_from(
+                data, position + _CRC.size
+            )
+            end = position + _HEADER_SIZE + key_length
+            if value_length != _TOMBSTONE:
+                end += value_length
+            if end > len(data) or (
+                zlib.crc32(view[position + _CRC.size : end]) != crc
+            ):
+                break
+            hints += _HINT.pack(
+                seq,
+                position,
+                end - position,
+                value_length,
+                key_length,
+                expires,
+            )
+            hints += view[
+                position + _HEADER_SIZE : position + _HEADER_SIZE + key_length
+            ]
+            position = end
+        segment.dead += len(data) - position
+        return bytes(hints)
+
+    def _apply_hints(self, segment, hints, deleted):
+        # assumes self._lock is held.  segments are loaded in the order
+        # they were created, but the output of a compaction holds records
+        # older than those of segments created before it, so the sequence
+        # number of each record, and of each deletion, is compared
+        index = self._index
+        position = 0
+        while position < len(hints):
+            seq, offset, length, value_length, key_length, expires = (
+                _HINT.unpack_from(hints, position)
+            )
+            position += _HINT.size
+            key = hints[position : position + key_length].decode("utf-8")
+            position += key_length
+            self._seq = max(self._seq, seq)
+
+            current = index.get(key)
+            if (current is not None and current[4] >= seq) or deleted.get(
+                key, 0
+            ) >= seq:
+                segment.dead += length
+                continue
+            if current is not None:
+                current[0].dead += current[3]
+            if value_length == _TOMBSTONE:
+                segment.dead += length
+                deleted[key] = seq
+                index.pop(key, None)
+            else:
+                segment.expires = max(segment.expires, expires or math.inf)
+                index[key] = (
+                    segment,
+                    offset + _HEADER_SIZE + key_length,
+                    value_length,
+                    length,
+                    seq,
+                    expires,
+                )
+
+    def _new_segment(self):
+        # assumes self._lock is held
+        id_ = self._next_id
+        self._next_id += 1
+        fd = os.open(
+            os.path.join(self.directory, "%09d.data" % id_),
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND,
+            0o600,
+        )
+        segment = self._segments[id_] = _Segment(self.directory, id_)
+        return segment, fd
+
+    def _finish_segment(self, segment, fd, hints, sync=False):
+        if sync:
+            os.fsync(fd)
+        os.close(fd)
+        _write_file(segment.hint_path, self._hint_file(bytes(hints)))
+
+    def _roll(self):
+        """Finish the segment being written, and start a new one."""
+
+        # assumes self._lock is held
+        if self._active is not None:
+            self._finish_segment(
+                self._active, self._active_fd, self._active_hints
+            )
+        self._active, self._active_fd = self._new_segment()
+        self._active_hints = bytearray()
+
+    def _check_process(self):
+        if self._closed:
+            raise RuntimeError("Backend is closed")
+        if os.getpid() != self._pid:
+            raise RuntimeError(
+                "LogStructuredBackend can't be used by a forked process"
+            )
+
+    def _remove_files(self, base_path):
+        for path in (base_path + ".data", base_path + ".hint"):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def get_serialized(self, key):
+        entry = self._index.get(key)
+        if entry is None or (entry[5] and entry[5] <= time.time()):
+            return NO_VALUE
+        return os.pread(entry[0].fd, entry[2], entry[1])
+
+    def get_serialized_multi(self, keys):
+        now = time.time()
+        index = self._index
+        result: list[Any] = []
+        for key in keys:
+            entry = index.get(key)
+            if entry is None or (entry[5] and entry[5] <= now):
+                result.append(NO_VALUE)
+            else:
+                result.append(os.pread(entry[0].fd, entry[2], entry[1]))
+        return result
+
+    def set_serialized(self, key, value):
+        self._write([(key, value)])
+
+    def set_serialized_multi(self, mapping):
+        self._write(mapping.items())
+
+    def delete(self, key):
+        self._write([(key, None)])
+
+    def delete_multi(self, keys):
+        self._write([(key, None) for key in keys])
+
+    def _write(self, items):
+        """Append records for the given (key, value) pairs, where a value
+        of None deletes the key."""
+
+        expires = (
+            time.time() + self.expiration_time
+            if self.expiration_time is not None
+            else 0.0
+        )
+        with self._lock:
+            self._check_process()
+            index = self._index
+            segment = self._active
+            hints = bytearray()
+            data = bytearray()
+            entries = []
+            for key, value in items:
+                if value is None and key not in index:
+                    continue
+                self._seq += 1
+                key_bytes = key.encode("utf-8")
+                record = _pack_record(self._seq, expires, key_bytes, value)
+                offset = segment.size + len(data)
+                data += record
+                hints += _HINT.pack(
+                    self._seq,
+                    offset,
+                    len(record),
+                    _TOMBSTONE if value is None else len(value),
+                    len(key_bytes),
+                    expires,
+                )
+                hints += key_bytes
+                entries.append((key, key_bytes, value, offset, len(record)))
+            if not data:
+                return
+            try:
+                _write_all(self._active_fd, data)
+            except BaseException:
+                # the records are discarded, along with any part of them
+                # written; later records go to a new segment, so that the
+                # records of a segment can be read back in sequence
+                size = os.fstat(self._active_fd).st_size
+                segment.dead += size - segment.size
+                segment.size = size
+                self._roll()
+                raise
+            segment.size += len(data)
+            self._active_hints += hints
+
+            seq = self._seq - len(entries)
+            for key, key_bytes, value, offset, length in entries:
+                seq += 1
+                current = index.get(key)
+                if current is not None:
+                    current[0].dead += current[3]
+                if value is None:
+                    segment.dead += length
+                    index.pop(key, None)
+                else:
+                    segment.expires = max(segment.expires, expires or math.inf)
+                    index[key] = (
+                        segment,
+                        offset + _HEADER_SIZE + len(key_bytes),
+                        len(value),
+                        length,
+                        seq,
+                        expires,
+                    )
+            if segment.size >= self.segment_size:
+                self._roll()
+
+    def _maybe_compact(self):
+        now = time.time()
+        with self._lock:
+            size = garbage = 0
+            for segment in self._segments.values():
+                if segment is self._active:
+                    continue
+                size += segment.size
+                if segment.expires <= now:
+                    garbage += segment.size
+                else:
+                    garbage += segment.dead
+        if size and garbage >= size * self.compaction_ratio:
+            self.compact()
+
+    def compact(self):
+        """Copy the values remaining in all segments, other than the one
+        being written, to new segments, and remove the old ones.
+
+        Values which have been overwritten, deleted or have expired are
+        not copied.  Values continue to be read and written while the
+        segments are copied.
+
+        """
+        with self._compact_lock:
+            with self._lock:
+                self._check_process()
+                self._roll()
+                merged = [
+                    segment
+                    for segment in self._segments.values()
+                    if segment is not self._active
+                ]
+                merged_ids = {segment.id for segment in merged}
+                entries = [
+                    (key, entry)
+                    for key, entry in self._index.items()
+                    if entry[0].id in merged_ids
+                ]
+
+            now = time.time()
+            moved = []
+            expired = []
+            output = None
+            output_fd = -1
+            hints = bytearray()
+            data = bytearray()
+            for key, entry in entries:
+                segment, offset, value_length, length, seq, expires = entry
+                if expires and expires <= now:
+                    expired.append((key, entry))
+                    continue
+                if output is None or output.size >= self.segment_size:
+                    if output is not None:
+                        _write_all(output_fd, data)
+                        data.clear()
+                        self._finish_segment(output, output_fd, hints, True)
+                        hints = bytearray()
+                    with self._lock:
+                        output, output_fd = self._new_segment()
+                key_bytes = key.encode("utf-8")
+                record = _pack_record(
+                    seq,
+                    expires,
+                    key_bytes,
+                    os.pread(segment.fd, value_length, offset),
+                )
+                hints += _HINT.pack(
+                    seq,
+                    output.size,
+                    len(record),
+                    value_length,
+                    len(key_bytes),
+                    expires,
+                )
+                hints += key_bytes
+                moved.append(
+                    (
+                        key,
+                        entry,
+                        (
+                            output,
+                            output.size + _HEADER_SIZE + len(key_bytes),
+                            value_length,
+                            len(record),
+                            seq,
+                            expires,
+                        ),
+                    )
+                )
+                output.size += len(record)
+                output.expires = max(output.expires, expires or math.inf)
+                data += record
+                if len(data) >= _WRITE_BUFFER:
+                    _write_all(output_fd, data)
+                    data.clear()
+            if output is not None:
+                _write_all(output_fd, data)
+                self._finish_segment(output, output_fd, hints, True)
+
+            # once the output is on disk, the merged segments are listed
+            # so that, if removing them is interrupted, the rest are
+            # removed when the backend is next opened; otherwise a
+            # deletion recorded in a removed segment could be undone by
+            # a value in one which remained
+            compaction_path = os.path.join(self.directory, _COMPACTION_FILE)
+            _write_file(
+                compaction_path,
+                b" ".join(b"%d" % segment.id for segment in merged),
+            )
+            with self._lock:
+                index = self._index
+                for key, entry, new_entry in moved:
+                    if index.get(key) is entry:
+                        index[key] = new_entry
+                    else:
+                        # written while the segments were copied
+                        new_entry[0].dead += new_entry[3]
+                for key, entry in expired:
+                    if index.get(key) is entry:
+                        del index[key]
+                for segment in merged:
+                    del self._segments[segment.id]
+            for segment in merged:
+                self._remove_files(segment.path[:-5])
+            os.unlink(compaction_path)
+
+    def close(self):
+        """Finish the segment being written and release the directory,
+        so that it may be opened by another process.
+
+        """
+        with self._lock:
+            if self._closed or os.getpid() != self._pid:
+                return
+            self._finish_segment(
+                self._active, self._active_fd, self._active_hints
+            )
+            self._closed = True
+            self._lockfile.close()
@@ -8,11 +8,101 @@ The two backends are :class:`.MemoryBackend` and :class:`.MemoryPickleBackend`;
 the latter applies a serialization step to cached values while the former
 places the value as given into the dictionary.
 
+The :class:`.BoundedMemoryBackend` and :class:`.BoundedMemoryPickleBackend`
+variants additionally limit the number of entries retained, evicting
+according to a configurable policy; :class:`.ByteBoundedMemoryBackend` and
+:class:`.ByteBoundedMemoryPickleBackend` limit the total size of the
+values retained.  :class:`.ShardedMemoryBackend` and
+:class:`.ShardedMemoryPickleBackend` partition keys among independently
+locked segments, for use by many concurrent threads.
+:class:`.AsyncMemoryBackend` and :class:`.AsyncMemoryPickleBackend` present
+the dictionary as an :class:`.AsyncCacheBackend`, for use with
+:class:`.AsyncCacheRegion`.
+
+All of the memory backends accept an optional ``expiration_time``
+argument, which causes entries to be removed from memory once they are
+older than the given number of seconds.
+
 """
 
+import heapq
+import itertools
+import math
+import pickle
+import threading
+import time
+from typing import Any
+from typing import Callable
+import weakref
+
+from ..api import AsyncCacheBackend
 from ..api import CacheBackend
+from ..api import CachedValue
 from ..api import DefaultSerialization
 from ..api import NO_VALUE
+from ..eviction import policy_for_name
+from ..serializers import pickle_buffers
+
+
+class _ExpiryTracker:
+    """Track a removal deadline per key.
+
+    Deadlines are kept in a dictionary, and also in a heap so that
+    expired keys can be located without scanning; heap entries for keys
+    that were since re-set or removed are skipped when popped.
+
+    """
+
+    def __init__(self, expiration_time):
+        self.expiration_time = expiration_time
+        self._deadlines = {}
+        self._heap = []
+        self._counter = itertools.count()
+
+    def track(self, key, now):
+        deadline = now + self.expiration_time
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            # too many superseded heap entries; rebuild
+            self._heap = [
+                (deadline, next(self._counter), key)
+                for key, deadline in self._deadlines.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def forget(self, key):
+        self._deadlines.pop(key, None)
+
+    def is_expired(self, key, now):
+        deadline = self._deadlines.get(key)
+        return deadline is not None and deadline <= now
+
+    def has_expired(self, now):
+        return bool(self._heap) and self._heap[0][0] <= now
+
+    def pop_expired(self, now, limit=None):
+        heap = self._heap
+        deadlines = self._deadlines
+        expired: list[Any] = []
+        while heap and heap[0][0] <= now:
+            if limit is not None and len(expired) >= limit:
+                break
+            deadline, _, key = heapq.heappop(heap)
+            if deadlines.get(key) == deadline:
+                del deadlines[key]
+                expired.append(key)
+        return expired
+
+
+def _run_sweeper(backend_ref, interval):
+    while True:
+        time.sleep(interval)
+        backend = backend_ref()
+        if backend is None:
+            return
+        backend.sweep()
+        del backend
 
 
 class MemoryBackend(CacheBackend):
@@ -20,9 +110,10 @@ class MemoryBackend(CacheBackend):
 
     There is no size management, and values which
     are placed into the dictionary will remain
-    until explicitly removed.   Note that
+    until explicitly removed, unless the ``expiration_time``
+    argument is used.   Note that
     Dogpile's expiration of items is based on
-    timestamps and does not remove them from
+    timestamps and does not by itself remove them from
     the cache.
 
     E.g.::
@@ -46,31 +137,162 @@ class MemoryBackend(CacheBackend):
             }
         )
 
+    To have entries removed from memory once they are no longer useful,
+    pass the ``expiration_time`` argument.  Expired entries are removed
+    as they are accessed, and additionally a small batch of expired
+    entries is reclaimed on each read; a background thread may also be
+    used to reclaim entries for keys which are no longer accessed at all::
+
+        region = make_region().configure(
+            'dogpile.cache.memory',
+            expiration_time=600,
+            arguments={
+                "expiration_time": 3600,
+                "sweep_interval": 60,
+            }
+        )
+
+    As is the case for :paramref:`.RedisBackend.redis_expiration_time`, the
+    backend's ``expiration_time`` should normally be greater than that of
+    the region, so that an expired value remains available to be returned
+    by :meth:`.CacheRegion.get_or_create` while a new value is generated.
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param cache_dict: Optional.  The dictionary in which to store values.
+
+    :param expiration_time: Optional.  Number of seconds after being set
+     at which an entry is removed from memory.
+
+     .. versionadded:: 1.5.1
+
+    :param sweep_interval: Optional.  When used with ``expiration_time``,
+     the interval in seconds at which a background daemon thread removes
+     all expired entries.  The thread exits once the backend is garbage
+     collected.
+
+     .. versionadded:: 1.5.1
 
     """
 
+    _reap_batch = 100
+    """Maximum number of expired entries removed as part of a read."""
+
     def __init__(self, arguments):
         self._cache = arguments.get("cache_dict", {})
+        self._init_expiry(arguments)
+
+    def _init_expiry(self, arguments):
+        self._lock = threading.Lock()
+        expiration_time = arguments.get("expiration_time")
+        if not expiration_time:
+            self._expiry = None
+            return
+
+        self._expiry = _ExpiryTracker(expiration_time)
+        sweep_interval = arguments.get("sweep_interval")
+        if sweep_interval:
+            sweeper = threading.Thread(
+                target=_run_sweeper,
+                args=(weakref.ref(self), sweep_interval),
+                name="dogpile.cache memory sweeper",
+                daemon=True,
+            )
+            sweeper.start()
+
+    def _reap(self, now, limit=_reap_batch):
+        # assumes self._lock is held
+        expiry = self._expiry
+        assert expiry is not None
+        if expiry.has_expired(now):
+            for key in expiry.pop_expired(now, limit):
+                self._cache.pop(key, None)
+
+    def _get_unexpired(self, key, now):
+        # assumes self._lock is held
+        self._reap(now)
+        expiry = self._expiry
+        assert expiry is not None
+        if expiry.is_expired(key, now):
+            expiry.forget(key)
+            self._cache.pop(key, None)
+            return NO_VALUE
+        return self._cache.get(key, NO_VALUE)
+
+    def sweep(self):
+        """Remove all expired entries from memory.
+
+        Has no effect if the ``expiration_time`` argument is not in use.
+
+        .. versionadded:: 1.5.1
+
+        """
+        if self._expiry is None:
+            return
+        with self._lock:
+            self._reap(time.time(), None)
 
     def get(self, key):
-        return self._cache.get(key, NO_VALUE)
+        if self._expiry is None:
+            return self._cache.get(key, NO_VALUE)
+        with self._lock:
+            return self._get_unexpired(key, time.time())
 
     def get_multi(self, keys):
-        return [self._cache.get(key, NO_VALUE) for key in keys]
+        if self._expiry is None:
+            return [self._cache.get(key, NO_VALUE) for key in keys]
+        now = time.time()
+        with self._lock:
+            return [self._get_unexpired(key, now) for key in keys]
 
     def set(self, key, value):
-        self._cache[key] = value
+        if self._expiry is None:
+            self._cache[key] = value
+            return
+        with self._lock:
+            self._cache[key] = value
+            self._expiry.track(key, time.time())
 
     def set_multi(self, mapping):
-        for key, value in mapping.items():
-            self._cache[key] = value
+        if self._expiry is None:
+            for key, value in mapping.items():
+                self._cache[key] = value
+            return
+        now = time.time()
+        with self._lock:
+            for key, value in mapping.items():
+                self._cache[key] = value
+                self._expiry.track(key, now)
 
     def delete(self, key):
-        self._cache.pop(key, None)
+        if self._expiry is None:
+            self._cache.pop(key, None)
+            return
+        with self._lock:
+            self._cache.pop(key, None)
+            self._expiry.forget(key)
 
     def delete_multi(self, keys):
-        for key in keys:
-            self._cache.pop(key, None)
+        if self._expiry is None:
+            for key in keys:
+                self._cache.pop(key, None)
+            return
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+                self._expiry.forget(key)
+
+
+class _PickledBuffers:
+    """A value stored by :class:`.MemoryPickleBackend` using out-of-band
+    buffers."""
+
+    __slots__ = ("metadata", "data", "buffers")
+
+    def __init__(self, metadata, data, buffers):
+        self.metadata = metadata
+        self.data = data
+        self.buffers = buffers
 
 
 class MemoryPickleBackend(DefaultSerialization, MemoryBackend):
@@ -101,6 +323,520 @@ class MemoryPickleBackend(DefaultSerialization, MemoryBackend):
     either ``cPickle`` or ``pickle`` and specifying ``HIGHEST_PROTOCOL``
     upon serialize.
 
+    Values holding large buffers which support pickle protocol 5, such as
+    NumPy arrays, are normally copied into the pickled bytes, and copied again
+    when unpickled.  With the ``out_of_band`` argument, such buffers are
+    instead copied once when the value is set and kept alongside the
+    pickled value, using pickle protocol 5; values returned refer to the
+    stored buffers without copying them, so that NumPy arrays returned are
+    read-only::
+
+        region = make_region().configure(
+            'dogpile.cache.memory_pickle',
+            arguments={"out_of_band": True}
+        )
+
+    When ``out_of_band`` is used, the region's ``serializer`` and
+    ``deserializer`` are not applied.
+
+    Parameters to the ``arguments`` dictionary are those of
+    :class:`.MemoryBackend`, as well as:
+
+    :param out_of_band: Optional.  If True, store the out-of-band buffers
+     of values separately from the pickled value, as above.  Defaults to
+     False.
+
+     .. versionadded:: 1.5.1
+
     .. versionadded:: 0.5.3
 
     """
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        self._out_of_band = arguments.get("out_of_band", False)
+        if self._out_of_band:
+            self.serializer = self.deserializer = None
+
+    def _dump(self, value):
+        if self._out_of_band and isinstance(value, CachedValue):
+            data, buffers = pickle_buffers(value.payload)
+            return _PickledBuffers(
+                value.metadata, data, [buffer.tobytes() for buffer in buffers]
+            )
+        return value
+
+    def _load(self, value):
+        if isinstance(value, _PickledBuffers):
+            return CachedValue(
+                pickle.loads(value.data, buffers=value.buffers),
+                value.metadata,
+            )
+        return value
+
+    def get(self, key):
+        return self._load(super().get(key))
+
+    def get_multi(self, keys):
+        return [self._load(value) for value in super().get_multi(keys)]
+
+    def set(self, key, value):
+        super().set(key, self._dump(value))
+
+    def set_multi(self, mapping):
+        super().set_multi(
+            {key: self._dump(value) for key, value in mapping.items()}
+        )
+
+
+class BoundedMemoryBackend(MemoryBackend):
+    """A memory backend which retains at most a fixed number of entries.
+
+    When a new entry would exceed the bound, an existing entry is
+    evicted according to the configured eviction policy.  All
+    operations, including eviction, run in constant time; the ``*_multi``
+    methods acquire the backend's lock once for the whole batch.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.memory_bounded',
+            arguments={
+                "max_entries": 100000,
+                "eviction_policy": "tinylfu",
+            }
+        )
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param max_entries: Required.  The maximum number of entries to be
+     held in memory.
+
+    :param eviction_policy: Optional.  Name of the eviction policy to use,
+     one of:
+
+     * ``"lru"`` - least recently used; the default.
+     * ``"lfu"`` - least frequently used.
+     * ``"arc"`` - Adaptive Replacement Cache, which balances recency and
+       frequency.
+     * ``"tinylfu"`` - Window TinyLFU, which admits new entries into the
+       main area of the cache only if they are estimated to be accessed
+       more often than the entry they would replace; this typically gives
+       the best hit ratio for skewed access patterns.
+
+     A subclass of :class:`.EvictionPolicy` may also be passed.
+
+    :param expiration_time: Optional.  Number of seconds after being set
+     at which an entry is removed from memory; see :class:`.MemoryBackend`.
+
+    :param sweep_interval: Optional.  Interval at which a background
+     thread removes expired entries; see :class:`.MemoryBackend`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self, arguments):
+        policy_cls = policy_for_name(arguments.get("eviction_policy", "lru"))
+        self._cache = policy_cls(int(arguments["max_entries"]))
+        self._init_expiry(arguments)
+
+    def _track(self, key, evicted, now):
+        # assumes self._lock is held
+        expiry = self._expiry
+        if expiry is not None:
+            expiry.track(key, now)
+            for evicted_key in evicted:
+                expiry.forget(evicted_key)
+
+    def get(self, key):
+        with self._lock:
+            if self._expiry is None:
+                return self._cache.get(key, NO_VALUE)
+            return self._get_unexpired(key, time.time())
+
+    def get_multi(self, keys):
+        with self._lock:
+            if self._expiry is None:
+                return [self._cache.get(key, NO_VALUE) for key in keys]
+            now = time.time()
+            return [self._get_unexpired(key, now) for key in keys]
+
+    def set(self, key, value):
+        with self._lock:
+            self._track(key, self._cache.set(key, value), time.time())
+
+    def set_multi(self, mapping):
+        now = time.time()
+        with self._lock:
+            for key, value in mapping.items():
+                self._track(key, self._cache.set(key, value), now)
+
+    def delete(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+            if self._expiry is not None:
+                self._expiry.forget(key)
+
+    def delete_multi(self, keys):
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+                if self._expiry is not None:
+                    self._expiry.forget(key)
+
+
+class BoundedMemoryPickleBackend(DefaultSerialization, BoundedMemoryBackend):
+    """A :class:`.BoundedMemoryBackend` which serializes values, in the
+    same way as the :class:`.MemoryPickleBackend`.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.memory_bounded_pickle',
+            arguments={"max_entries": 100000}
+        )
+
+    .. versionadded:: 1.5.1
+
+    """
+
+
+class ByteBoundedMemoryBackend(BoundedMemoryBackend):
+    """A memory backend which limits the total size of the values retained.
+
+    The size of each entry is determined by a user-supplied ``weigher``
+    function; when the total exceeds ``max_bytes``, entries are evicted
+    according to the configured eviction policy until the total is
+    within bounds.  An entry which is larger than ``max_bytes`` on its own
+    is not retained, and does not cause other entries to be evicted.
+
+    As this backend does not serialize, the values passed to the weigher
+    are :class:`.CachedValue` objects; the weigher will typically measure
+    the ``.payload`` attribute::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.memory_bytes_bounded',
+            arguments={
+                "max_bytes": 512 * 1024 * 1024,
+                "weigher": lambda value: len(value.payload),
+            }
+        )
+
+    The :class:`.ByteBoundedMemoryPickleBackend` stores serialized values
+    and weighs them using their length by default.
+
+    Current and peak usage, as measured by the weigher, are available from
+    the :attr:`.ByteBoundedMemoryBackend.current_bytes` and
+    :attr:`.ByteBoundedMemoryBackend.peak_bytes` attributes.
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param max_bytes: Required.  The maximum total weight of the values
+     held in memory.
+
+    :param weigher: Required for :class:`.ByteBoundedMemoryBackend`.  A
+     callable which receives a value to be stored and returns its size as
+     an integer.  For :class:`.ByteBoundedMemoryPickleBackend`, defaults to
+     ``len()`` of the serialized value.
+
+    :param eviction_policy: Optional.  Either ``"lru"``, the default, or
+     ``"lfu"``.
+
+    :param expiration_time: Optional.  Number of seconds after being set
+     at which an entry is removed from memory; see :class:`.MemoryBackend`.
+
+    :param sweep_interval: Optional.  Interval at which a background
+     thread removes expired entries; see :class:`.MemoryBackend`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    weigher: Callable[[Any], int]
+
+    def __init__(self, arguments):
+        policy_cls = policy_for_name(
+            arguments.get("eviction_policy", "lru"), weighted=True
+        )
+        self._cache = policy_cls(int(arguments["max_bytes"]))
+        self._init_expiry(arguments)
+        weigher = arguments.get("weigher", getattr(self, "weigher", None))
+        if weigher is None:
+            raise ValueError(
+                "The 'weigher' argument is required for %s"
+                % self.__class__.__name__
+            )
+        self.weigher = weigher
+        self.peak_bytes = 0
+
+    @property
+    def current_bytes(self):
+        """The current total size of all values held in memory."""
+        return self._cache.weight
+
+    def set(self, key, value):
+        weight = self.weigher(value)
+        with self._lock:
+            self._track(key, self._cache.set(key, value, weight), time.time())
+            if self._cache.weight > self.peak_bytes:
+                self.peak_bytes = self._cache.weight
+
+    def set_multi(self, mapping):
+        weigher = self.weigher
+        weighed = [
+            (key, value, weigher(value)) for key, value in mapping.items()
+        ]
+        now = time.time()
+        with self._lock:
+            for key, value, weight in weighed:
+                self._track(key, self._cache.set(key, value, weight), now)
+            if self._cache.weight > self.peak_bytes:
+                self.peak_bytes = self._cache.weight
+
+
+class ByteBoundedMemoryPickleBackend(
+    DefaultSerialization, ByteBoundedMemoryBackend
+):
+    """A :class:`.ByteBoundedMemoryBackend` which serializes values, in the
+    same way as the :class:`.MemoryPickleBackend`.
+
+    Values are weighed using ``len()`` of their serialized form by
+    default, so that ``max_bytes`` corresponds directly to the size of the
+    data retained::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.memory_bytes_bounded_pickle',
+            arguments={"max_bytes": 512 * 1024 * 1024}
+        )
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    weigher = staticmethod(len)
+
+
+class ShardedMemoryBackend(CacheBackend):
+    """A memory backend which partitions keys among a fixed number of
+    independently locked segments.
+
+    A single dictionary or :class:`.BoundedMemoryBackend` shared among
+    many threads becomes a point of contention, particularly on
+    free-threaded builds of Python where threads otherwise run in
+    parallel.  This backend distributes keys among ``shards`` segments by
+    hash, each of which is a :class:`.MemoryBackend`, or a
+    :class:`.BoundedMemoryBackend` if ``max_entries`` is given, so that
+    threads working with different keys seldom contend for the same lock.
+    The ``*_multi`` methods group keys by segment, so that each segment
+    is accessed once per call.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.memory_sharded',
+            arguments={
+                "shards": 32,
+                "max_entries": 1000000,
+                "eviction_policy": "lru",
+            }
+        )
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param shards: Optional.  Number of segments; defaults to 16.
+
+    :param max_entries: Optional.  The maximum number of entries held in
+     memory, divided evenly among the segments.  If omitted, the number of
+     entries is unbounded.
+
+    :param eviction_policy: Optional.  Eviction policy used by each segment
+     when ``max_entries`` is given; see :class:`.BoundedMemoryBackend`.
+
+    :param expiration_time: Optional.  Number of seconds after being set
+     at which an entry is removed from memory; see :class:`.MemoryBackend`.
+
+    :param sweep_interval: Optional.  Interval at which a single background
+     thread removes expired entries from all segments; see
+     :class:`.MemoryBackend`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self, arguments):
+        self._num_shards = num_shards = int(arguments.get("shards", 16))
+        if num_shards < 1:
+            raise ValueError("shards must be a positive integer")
+
+        shard_arguments = {
+            key: arguments[key]
+            for key in ("eviction_policy", "expiration_time")
+            if key in arguments
+        }
+        shard_cls: type[MemoryBackend]
+        if arguments.get("max_entries"):
+            shard_cls = BoundedMemoryBackend
+            shard_arguments["max_entries"] = math.ceil(
+                int(arguments["max_entries"]) / num_shards
+            )
+        else:
+            shard_cls = MemoryBackend
+        self._shards = [shard_cls(shard_arguments) for _ in range(num_shards)]
+
+        sweep_interval = arguments.get("sweep_interval")
+        if sweep_interval and arguments.get("expiration_time"):
+            sweeper = threading.Thread(
+                target=_run_sweeper,
+                args=(weakref.ref(self), sweep_interval),
+                name="dogpile.cache memory sweeper",
+                daemon=True,
+            )
+            sweeper.start()
+
+    def _group(self, keys):
+        num_shards = self._num_shards
+        groups: dict[int, list[int]] = {}
+        for position, key in enumerate(keys):
+            groups.setdefault(hash(key) % num_shards, []).append(position)
+        return groups
+
+    def sweep(self):
+        """Remove all expired entries from memory.
+
+        Has no effect if the ``expiration_time`` argument is not in use.
+
+        """
+        for shard in self._shards:
+            shard.sweep()
+
+    def get(self, key):
+        return self._shards[hash(key) % self._num_shards].get(key)
+
+    def get_multi(self, keys):
+        keys = list(keys)
+        values = [NO_VALUE] * len(keys)
+        for index, positions in self._group(keys).items():
+            shard_values = self._shards[index].get_multi(
+                [keys[position] for position in positions]
+            )
+            for position, value in zip(positions, shard_values):
+                values[position] = value
+        return values
+
+    def set(self, key, value):
+        self._shards[hash(key) % self._num_shards].set(key, value)
+
+    def set_multi(self, mapping):
+        keys = list(mapping)
+        for index, positions in self._group(keys).items():
+            self._shards[index].set_multi(
+                {
+                    keys[position]: mapping[keys[position]]
+                    for position in positions
+                }
+            )
+
+    def delete(self, key):
+        self._shards[hash(key) % self._num_shards].delete(key)
+
+    def delete_multi(self, keys):
+        keys = list(keys)
+        for index, positions in self._group(keys).items():
+            self._shards[index].delete_multi(
+                [keys[position] for position in positions]
+            )
+
+
+class ShardedMemoryPickleBackend(DefaultSerialization, ShardedMemoryBackend):
+    """A :class:`.ShardedMemoryBackend` which serializes values, in the
+    same way as the :class:`.MemoryPickleBackend`.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.memory_sharded_pickle',
+            arguments={"shards": 32}
+        )
+
+    .. versionadded:: 1.5.1
+
+    """
+
+
+class AsyncMemoryBackend(AsyncCacheBackend):
+    """An asyncio backend that uses a plain dictionary, for use with
+    :class:`.AsyncCacheRegion`.
+
+    E.g.::
+
+        from dogpile.cache import make_async_region
+
+        region = make_async_region().configure(
+            'dogpile.cache.memory_async'
+        )
+
+    Values are stored by a :class:`.MemoryBackend`, which accepts the same
+    ``arguments``; as the dictionary is accessed without awaiting, the
+    backend is mostly of use for testing and for caching within a single
+    event loop.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    backend_cls: type[MemoryBackend] = MemoryBackend
+
+    def __init__(self, arguments):
+        self._backend = self.backend_cls(arguments)
+        self.serializer = self._backend.serializer
+        self.deserializer = self._backend.deserializer
+
+    async def get(self, key):
+        return self._backend.get(key)
+
+    async def get_multi(self, keys):
+        return self._backend.get_multi(keys)
+
+    async def set(self, key, value):
+        self._backend.set(key, value)
+
+    async def set_multi(self, mapping):
+        self._backend.set_multi(mapping)
+
+    async def delete(self, key):
+        self._backend.delete(key)
+
+    async def delete_multi(self, keys):
+        self._backend.delete_multi(keys)
+
+
+class AsyncMemoryPickleBackend(AsyncMemoryBackend):
+    """An :class:`.AsyncMemoryBackend` which serializes values, using a
+    :class:`.MemoryPickleBackend`.
+
+    E.g.::
+
+        from dogpile.cache import make_async_region
+
+        region = make_async_region().configure(
+            'dogpile.cache.memory_async_pickle'
+        )
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    backend_cls = MemoryPickleBackend
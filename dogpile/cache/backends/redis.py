@@ -10,6 +10,8 @@ import re
 import typing
 import warnings
 
+from ..api import AsyncBytesBackend
+from ..api import AsyncCacheMutex
 from ..api import BytesBackend
 from ..api import NO_VALUE
 
@@ -19,13 +21,127 @@ else:
     # delayed import
     redis = None  # noqa F811
 
-__all__ = ("RedisBackend", "RedisSentinelBackend", "RedisClusterBackend")
+__all__ = (
+    "RedisBackend",
+    "RedisSentinelBackend",
+    "RedisClusterBackend",
+    "AsyncRedisBackend",
+)
 
 
 RE_VALID_PREFIX = re.compile(r"^[\w\-\.\:]{2,10}$")
 
 
-class RedisBackend(BytesBackend):
+class _RedisConnection:
+    """Parses the arguments of the Redis backends, and creates the client."""
+
+    lock_template: str = "_lock{0}"
+
+    def __init__(self, arguments):
+        arguments = arguments.copy()
+        self._imports()
+        self.url = arguments.pop("url", None)
+        self.host = arguments.pop("host", "localhost")
+        self.username = arguments.pop("username", None)
+        self.password = arguments.pop("password", None)
+        self.port = arguments.pop("port", 6379)
+        self.db = arguments.pop("db", 0)
+        self.socket_timeout = arguments.pop("socket_timeout", None)
+        self.socket_connect_timeout = arguments.pop(
+            "socket_connect_timeout", None
+        )
+        self.socket_keepalive = arguments.pop("socket_keepalive", False)
+        self.socket_keepalive_options = arguments.pop(
+            "socket_keepalive_options", None
+        )
+
+        # additional ssl params should be submitted in `connection_kwargs`
+        self.ssl = arguments.pop("ssl", None)
+
+        # used by `get_mutex`
+        self.distributed_lock = arguments.pop("distributed_lock", False)
+        self.lock_timeout = arguments.pop("lock_timeout", None)
+        self.lock_sleep = arguments.pop("lock_sleep", 0.1)
+        self.lock_blocking = arguments.pop("lock_blocking", True)
+        self.lock_blocking_timeout = arguments.pop(
+            "lock_blocking_timeout", None
+        )
+
+        self.thread_local_lock = arguments.pop("thread_local_lock", True)
+        self.connection_kwargs = arguments.pop("connection_kwargs", {})
+
+        if self.distributed_lock and self.thread_local_lock:
+            warnings.warn(
+                "The Redis backend thread_local_lock parameter should be "
+                "set to False when distributed_lock is True"
+            )
+
+        self.redis_expiration_time = arguments.pop("redis_expiration_time", 0)
+        self.connection_pool = arguments.pop("connection_pool", None)
+
+        lock_prefix = arguments.pop("lock_prefix", None)
+        if lock_prefix:
+            if (not isinstance(lock_prefix, str)) or (
+                not RE_VALID_PREFIX.match(lock_prefix)
+            ):
+                raise ValueError(
+                    "Invalid `lock_prefix` submitted: `%s`." % lock_prefix
+                )
+            self.lock_template = "%s{0}" % lock_prefix
+
+        self._create_client()
+
+    def _imports(self):
+        # defer imports until backend is used
+        global redis
+        import redis  # noqa
+
+    def _client_class(self):
+        return redis.StrictRedis
+
+    def _create_client(self):
+        client_cls = self._client_class()
+        if self.connection_pool is not None:
+            # the connection pool already has all other connection
+            # options present within, so here we disregard socket_timeout
+            # and others.
+            self.writer_client = client_cls(
+                connection_pool=self.connection_pool
+            )
+            self.reader_client = self.writer_client
+        else:
+            args = {}
+            args.update(self.connection_kwargs)
+            if self.socket_timeout is not None:
+                args["socket_timeout"] = self.socket_timeout
+            if self.socket_connect_timeout is not None:
+                args["socket_connect_timeout"] = self.socket_connect_timeout
+            if self.socket_keepalive:
+                args["socket_keepalive"] = True
+                if self.socket_keepalive_options is not None:
+                    args["socket_keepalive_options"] = (
+                        self.socket_keepalive_options
+                    )
+            if self.ssl is not None:
+                args["ssl"] = self.ssl
+
+            if self.url is not None:
+                args.update(url=self.url)
+                self.writer_client = client_cls.from_url(**args)
+                self.reader_client = self.writer_client
+            else:
+                args.update(
+                    host=self.host,
+                    username=self.username,
+                    password=self.password,
+                    port=self.port,
+                    db=self.db,
+                )
+                self.writer_client = client_cls(**args)
+                self.reader_client = self.writer_client
+
+
+class RedisBackend(_RedisConnection, BytesBackend):
     r"""A `Redis <http://redis.io/>`__ backend, using the
     `redis-py <http://pypi.python.org/pypi/redis/>`__ driver.
 
@@ -142,107 +258,6 @@ class RedisBackend(BytesBackend):
      .. versionadded:: 1.1.6
     """
 
-    lock_template: str = "_lock{0}"
-
-    def __init__(self, arguments):
-        arguments = arguments.copy()
-        self._imports()
-        self.url = arguments.pop("url", None)
-        self.host = arguments.pop("host", "localhost")
-        self.username = arguments.pop("username", None)
-        self.password = arguments.pop("password", None)
-        self.port = arguments.pop("port", 6379)
-        self.db = arguments.pop("db", 0)
-        self.socket_timeout = arguments.pop("socket_timeout", None)
-        self.socket_connect_timeout = arguments.pop(
-            "socket_connect_timeout", None
-        )
-        self.socket_keepalive = arguments.pop("socket_keepalive", False)
-        self.socket_keepalive_options = arguments.pop(
-            "socket_keepalive_options", None
-        )
-
-        # additional ssl params should be submitted in `connection_kwargs`
-        self.ssl = arguments.pop("ssl", None)
-
-        # used by `get_mutex`
-        self.distributed_lock = arguments.pop("distributed_lock", False)
-        self.lock_timeout = arguments.pop("lock_timeout", None)
-        self.lock_sleep = arguments.pop("lock_sleep", 0.1)
-        self.lock_blocking = arguments.pop("lock_blocking", True)
-        self.lock_blocking_timeout = arguments.pop(
-            "lock_blocking_timeout", None
-        )
-
-        self.thread_local_lock = arguments.pop("thread_local_lock", True)
-        self.connection_kwargs = arguments.pop("connection_kwargs", {})
-
-        if self.distributed_lock and self.thread_local_lock:
-            warnings.warn(
-                "The Redis backend thread_local_lock parameter should be "
-                "set to False when distributed_lock is True"
-            )
-
-        self.redis_expiration_time = arguments.pop("redis_expiration_time", 0)
-        self.connection_pool = arguments.pop("connection_pool", None)
-
-        lock_prefix = arguments.pop("lock_prefix", None)
-        if lock_prefix:
-            if (not isinstance(lock_prefix, str)) or (
-                not RE_VALID_PREFIX.match(lock_prefix)
-            ):
-                raise ValueError(
-                    "Invalid `lock_prefix` submitted: `%s`." % lock_prefix
-                )
-            self.lock_template = "%s{0}" % lock_prefix
-
-        self._create_client()
-
-    def _imports(self):
-        # defer imports until backend is used
-        global redis
-        import redis  # noqa
-
-    def _create_client(self):
-        if self.connection_pool is not None:
-            # the connection pool already has all other connection
-            # options present within, so here we disregard socket_timeout
-            # and others.
-            self.writer_client = redis.StrictRedis(
-                connection_pool=self.connection_pool
-            )
-            self.reader_client = self.writer_client
-        else:
-            args = {}
-            args.update(self.connection_kwargs)
-            if self.socket_timeout is not None:
-                args["socket_timeout"] = self.socket_timeout
-            if self.socket_connect_timeout is not None:
-                args["socket_connect_timeout"] = self.socket_connect_timeout
-            if self.socket_keepalive:
-                args["socket_keepalive"] = True
-                if self.socket_keepalive_options is not None:
-                    args["socket_keepalive_options"] = (
-                        self.socket_keepalive_options
-                    )
-            if self.ssl is not None:
-                args["ssl"] = self.ssl
-
-            if self.url is not None:
-                args.update(url=self.url)
-                self.writer_client = redis.StrictRedis.from_url(**args)
-                self.reader_client = self.writer_client
-            else:
-                args.update(
-                    host=self.host,
-                    username=self.username,
-                    password=self.password,
-                    port=self.port,
-                    db=self.db,
-                )
-                self.writer_client = redis.StrictRedis(**args)
-                self.reader_client = self.writer_client
-
     def get_mutex(self, key):
         if self.distributed_lock:
             return _RedisLockWrapper(
@@ -617,3 +632,109 @@ class RedisClusterBackend(RedisBackend):
             )
         self.writer_client = typing.cast("redis.Redis[bytes]", redis_cluster)
         self.reader_client = self.writer_client
+
+
+class AsyncRedisBackend(_RedisConnection, AsyncBytesBackend):
+    """A `Redis <http://redis.io/>`__ backend for :class:`.AsyncCacheRegion`,
+    using the ``redis.asyncio`` client of the redis-py driver.
+
+    Example configuration::
+
+        from dogpile.cache import make_async_region
+
+        region = make_async_region().configure(
+            'dogpile.cache.redis_async',
+            arguments = {
+                'host': 'localhost',
+                'port': 6379,
+                'db': 0,
+                'redis_expiration_time': 60*60*2,   # 2 hours
+                'distributed_lock': True,
+                'thread_local_lock': False
+                }
+        )
+
+    Arguments accepted in the arguments dictionary are those of
+    :class:`.RedisBackend`, where a ``connection_pool`` given should be a
+    ``redis.asyncio.ConnectionPool``.  As the client connects within the
+    event loop in which it's first used, the backend should be used
+    within a single event loop.
+
+    With ``distributed_lock``, the dogpile lock is a ``redis.asyncio``
+    lock, which is awaited rather than blocking the event loop.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def _imports(self):
+        # defer imports until backend is used
+        global redis
+        import redis.asyncio  # noqa
+
+    def _client_class(self):
+        return redis.asyncio.StrictRedis
+
+    def get_mutex(self, key):
+        if self.distributed_lock:
+            return _AsyncRedisLockWrapper(
+                self.writer_client.lock(
+                    self.lock_template.format(key),
+                    timeout=self.lock_timeout,
+                    sleep=self.lock_sleep,
+                    thread_local=self.thread_local_lock,
+                    blocking=self.lock_blocking,
+                    blocking_timeout=self.lock_blocking_timeout,
+                )
+            )
+        else:
+            return None
+
+    async def get_serialized(self, key):
+        value = await self.reader_client.get(key)
+        if value is None:
+            return NO_VALUE
+        return value
+
+    async def get_serialized_multi(self, keys):
+        if not keys:
+            return []
+        values = await self.reader_client.mget(keys)
+        return [v if v is not None else NO_VALUE for v in values]
+
+    async def set_serialized(self, key, value):
+        if self.redis_expiration_time:
+            await self.writer_client.setex(
+                key, self.redis_expiration_time, value
+            )
+        else:
+            await self.writer_client.set(key, value)
+
+    async def set_serialized_multi(self, mapping):
+        if not self.redis_expiration_time:
+            await self.writer_client.mset(mapping)
+        else:
+            async with self.writer_client.pipeline() as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, self.redis_expiration_time, value)
+                await pipe.execute()
+
+    async def delete(self, key):
+        await self.writer_client.delete(key)
+
+    async def delete_multi(self, keys):
+        await self.writer_client.delete(*keys)
+
+
+class _AsyncRedisLockWrapper(AsyncCacheMutex):
+    def __init__(self, mutex: typing.Any):
+        self.mutex = mutex
+
+    async def acquire(self, wait: bool = True) -> typing.Any:
+        return await self.mutex.acquire(blocking=wait)
+
+    async def release(self) -> None:
+        await self.mutex.release()
+
+    async def locked(self) -> bool:
+        return await self.mutex.locked()  # type: ignore
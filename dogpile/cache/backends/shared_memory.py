@@ -0,0 +1,529 @@
+"""
+Shared Memory Backend
+---------------------
+
+Provides a backend which stores values in a memory-mapped file, so that
+all processes on a host which map the same file share a single cache.
+
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Any
+import weakref
+
+from ..api import BytesBackend
+from ..api import NO_VALUE
+from ... import util
+
+__all__ = ["SharedMemoryBackend"]
+
+_MAGIC = b"DPSHM\x00\x00\x01"
+
+# magic, slot count, arena size, head, tail, live entries, used slots
+_HEADER = struct.Struct("<8sQQQQQQ")
+
+# key hash, logical offset of the record in the arena, record length
+_SLOT = struct.Struct("<QQQ")
+
+# key length, value length, key hash
+_RECORD = struct.Struct("<IIQ")
+
+_EMPTY = 0
+_TOMBSTONE = 1
+_PADDING = 0xFFFFFFFF
+
+
+def _hash(key_bytes):
+    # a stable hash, as str hashes are randomized per process; 0 and 1
+    # mark empty and deleted slots, so the top bit is set rather than
+    # one of the low bits used to select slots and lock stripes
+    return int.from_bytes(
+        hashlib.blake2b(key_bytes, digest_size=8).digest(), "little"
+    ) | (1 << 63)
+
+
+class _StripeLock:
+    """An exclusive lock on one byte of a file, held by one thread of one
+    process at a time.
+
+    ``fcntl.lockf()`` locks are held per process, so a thread lock
+    serializes the threads within a process.
+
+    """
+
+    def __init__(self, fcntl, fileno, offset):
+        self._fcntl = fcntl
+        self._fileno = fileno
+        self._offset = offset
+        self._thread_lock = threading.Lock()
+
+    def acquire(self, wait=True):
+        if not self._thread_lock.acquire(wait):
+            return False
+        flags = self._fcntl.LOCK_EX
+        if not wait:
+            flags |= self._fcntl.LOCK_NB
+        try:
+            self._fcntl.lockf(self._fileno, flags, 1, self._offset)
+        except OSError:
+            self._thread_lock.release()
+            if not wait:
+                return False
+            raise
+        return True
+
+    def release(self):
+        self._fcntl.lockf(self._fileno, self._fcntl.LOCK_UN, 1, self._offset)
+        self._thread_lock.release()
+
+    def locked(self):
+        return self._thread_lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.release()
+
+    def _after_fork(self):
+        self._thread_lock = threading.Lock()
+
+
+class _SharedFile:
+    """A file descriptor of a file, and the locks taken on it, shared by
+    all of the backends of a process which use the same file.
+
+    ``fcntl.lockf()`` locks belong to the process, so that backends of
+    the same process each with their own descriptor and thread locks
+    would both acquire the same lock, and closing any descriptor of the
+    file releases all of the locks of the process on it.  Sharing one
+    descriptor and one set of thread locks per file serializes these
+    backends, and the descriptor is closed only once no backend uses it.
+
+    """
+
+    def __init__(self, fcntl, path):
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self.users = 0
+        self._fcntl = fcntl
+        self._locks: dict[int, _StripeLock] = {}
+        self._mutex_factories: dict[int, Any] = {}
+
+    def lock(self, offset):
+        with _shared_files_lock:
+            lock = self._locks.get(offset)
+            if lock is None:
+                lock = self._locks[offset] = _StripeLock(
+                    self._fcntl, self.fd, offset
+                )
+            return lock
+
+    def mutex_factory(self, offset):
+        """Return a factory of dogpile locks for the given lock, shared so
+        that a thread holding it for one key may take it for another key
+        using any of the backends."""
+
+        lock = self.lock(offset)
+        with _shared_files_lock:
+            factory = self._mutex_factories.get(offset)
+            if factory is None:
+                factory = self._mutex_factories[offset] = (
+                    util.KeyReentrantMutex.factory(lock)
+                )
+            return factory
+
+
+_shared_files: dict[str, _SharedFile] = {}
+_shared_files_lock = threading.Lock()
+
+
+def _open_shared_file(fcntl, path):
+    with _shared_files_lock:
+        shared = _shared_files.get(path)
+        if shared is None:
+            shared = _shared_files[path] = _SharedFile(fcntl, path)
+        shared.users += 1
+        return shared
+
+
+def _release_shared_file(shared):
+    with _shared_files_lock:
+        shared.users -= 1
+        if not shared.users:
+            del _shared_files[shared.path]
+            os.close(shared.fd)
+
+
+def _reset_locks_after_fork():
+    global _shared_files_lock
+    _shared_files_lock = threading.Lock()
+    for shared in _shared_files.values():
+        for lock in shared._locks.values():
+            lock._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+class SharedMemoryBackend(BytesBackend):
+    """A backend which stores values in a memory-mapped file shared by
+    all processes on a host.
+
+    Each process of a pre-forking server such as gunicorn normally holds
+    its own copy of an in-memory cache, regenerating the same values in
+    every process.  When configured with the same ``filename``, each
+    process instead maps one hash table and value arena, so that a value
+    generated by one process is seen by all of them, and the dogpile lock
+    is coordinated across processes, so that only one process on the host
+    regenerates a given key at a time.  Placing the file on a ``tmpfs``
+    filesystem such as ``/dev/shm`` keeps it entirely in memory.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.shared_memory',
+            expiration_time=3600,
+            arguments={
+                "filename": "/dev/shm/myapp.cache",
+                "size": 256 * 1024 * 1024,
+            }
+        )
+
+    Values are appended to a fixed-size ring buffer; when the buffer is
+    full, the oldest values are evicted to make room, so that the memory
+    used never exceeds the configured size.  Writes are serialized among
+    all processes using ``fcntl.lockf()``, while reads take no lock; each
+    value read is validated against its key and against the current
+    position of the ring buffer, and is treated as a miss if a concurrent
+    write has overwritten it.  Locking is **only available on Unix
+    platforms**.
+
+    Backends of the same process which use the same file, such as those
+    of two regions, share a single file descriptor and set of locks.  As
+    ``fcntl.lockf()`` locks belong to the process, and are all released
+    once any descriptor of the file is closed, the file should not be
+    opened by other code in a process which uses it; all processes and
+    regions using a file should also be configured with the same
+    ``lock_stripes``.
+
+    The file is created and laid out by the first process which opens it;
+    subsequent processes use the ``size`` and ``slots`` recorded in the
+    file, ignoring their own arguments.  To change these, remove the
+    file while no process is using it.
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param filename: Path of the file to be mapped into memory, which is
+     created if it does not exist.
+
+    :param size: Optional.  Size in bytes of the ring buffer holding keys
+     and values; defaults to 64 MB.  Values larger than this are not
+     stored.
+
+    :param slots: Optional.  Number of slots in the hash table, rounded up
+     to a power of two; defaults to 65536.  At most three quarters of the
+     slots are used, beyond which the oldest values are evicted.
+
+    :param lock_stripes: Optional.  Number of distinct dogpile locks,
+     among which keys are distributed by hash; defaults to 64.  Keys
+     sharing a lock are regenerated one at a time.
+
+    :param dogpile_lock: Optional.  If False, dogpile.cache uses the
+     default dogpile lock, a plain thread-based mutex which does not
+     coordinate regeneration among processes.  Defaults to True.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self, arguments):
+        import fcntl
+
+        self.filename = os.path.abspath(
+            os.path.normpath(arguments["filename"])
+        )
+        shared = _open_shared_file(fcntl, os.path.realpath(self.filename))
+        self._release_file = weakref.finalize(
+            self, _release_shared_file, shared
+        )
+        self._fd = shared.fd
+
+        self._write_lock = shared.lock(0)
+        lock_stripes = int(arguments.get("lock_stripes", 64))
+        self._dogpile_locks: list[Any] | None
+        if arguments.get("dogpile_lock", True):
+            self._dogpile_locks = [
+                shared.mutex_factory(1 + stripe)
+                for stripe in range(lock_stripes)
+            ]
+        else:
+            self._dogpile_locks = None
+
+        with self._write_lock:
+            self._init_file(
+                int(arguments.get("size", 64 * 1024 * 1024)),
+                int(arguments.get("slots", 65536)),
+            )
+
+    def _init_file(self, size, slots):
+        if os.fstat(self._fd).st_size >= _HEADER.size:
+            with mmap.mmap(self._fd, _HEADER.size) as header:
+                magic, file_slots, file_size = _HEADER.unpack_from(header)[0:3]
+            new = magic != _MAGIC
+        else:
+            new = True
+
+        if new:
+            slots = 1 << max(slots - 1, 1).bit_length()
+        else:
+            slots, size = file_slots, file_size
+
+        self._slots = slots
+        self._mask = slots - 1
+        self._max_live = slots * 3 // 4
+        self._size = size
+        self._slot_base = _HEADER.size
+        self._arena_base = _HEADER.size + slots * _SLOT.size
+
+        if new:
+            os.ftruncate(self._fd, 0)
+            os.ftruncate(self._fd, self._arena_base + size)
+        self._mm = mmap.mmap(self._fd, self._arena_base + size)
+        if new:
+            _HEADER.pack_into(self._mm, 0, _MAGIC, slots, size, 0, 0, 0, 0)
+
+    def close(self):
+        """Unmap the file, and close its file descriptor unless another
+        backend of the process is using the same file.
+
+        The backend can't be used once closed; values remain in the file
+        for other processes.
+
+        """
+        if not self._mm.closed:
+            self._mm.close()
+            self._release_file()
+
+    def get_mutex(self, key):
+        if self._dogpile_locks is None:
+            return None
+        stripe = _hash(key.encode("utf-8")) % len(self._dogpile_locks)
+        return self._dogpile_locks[stripe](key)
+
+    def _read_header(self):
+        return _HEADER.unpack_from(self._mm)[3:]
+
+    def _write_header(self, head, tail, live, used):
+        _HEADER.pack_into(
+            self._mm,
+            0,
+            _MAGIC,
+            self._slots,
+            self._size,
+            head,
+            tail,
+            live,
+            used,
+        )
+
+    def _read_record(self, offset, length):
+        """Return a copy of the record at the given logical offset, or
+        None if it is not valid."""
+
+        position = offset % self._size
+        if length < _RECORD.size or position + length > self._size:
+            return None
+        start = self._arena_base + position
+        record = self._mm[start : start + length]
+        # slots are written without a lock, so a read during a write may
+        # pair the offset of one record with the length of another
+        key_length, value_length = _RECORD.unpack_from(record)[0:2]
+        if _RECORD.size + key_length + value_length != length:
+            return None
+        # the tail is advanced before a record is overwritten, so checking
+        # it after the copy detects a concurrent overwrite
+        if offset < _HEADER.unpack_from(self._mm)[4]:
+            return None
+        return record
+
+    def _find(self, key_bytes, key_hash):
+        """Locate the slot of a key, returning (index, record), or
+        (None, None) if not present."""
+
+        mm = self._mm
+        for probe in range(self._slots):
+            index = (key_hash + probe) & self._mask
+            slot_hash, offset, length = _SLOT.unpack_from(
+                mm, self._slot_base + index * _SLOT.size
+            )
+            if slot_hash == _EMPTY:
+                break
+            elif slot_hash != key_hash:
+                continue
+            record = self._read_record(offset, length)
+            if record is None:
+                continue
+            key_length = _RECORD.unpack_from(record)[0]
+            if record[_RECORD.size : _RECORD.size + key_length] == key_bytes:
+                return index, record
+        return None, None
+
+    def get_serialized(self, key):
+        key_bytes = key.encode("utf-8")
+        index, record = self._find(key_bytes, _hash(key_bytes))
+        if record is None:
+            return NO_VALUE
+        return record[_RECORD.size + len(key_bytes) :]
+
+    def get_serialized_multi(self, keys):
+        return [self.get_serialized(key) for key in keys]
+
+    def _set_slot(self, index, key_hash, offset, length):
+        _SLOT.pack_into(
+            self._mm,
+            self._slot_base + index * _SLOT.size,
+            key_hash,
+            offset,
+            length,
+        )
+
+    def _evict_oldest(self, tail, live):
+        """Remove the record at the tail of the ring buffer, returning the
+        new (tail, live) values."""
+
+        position = tail % self._size
+        if self._size - position < _RECORD.size:
+            return tail + self._size - position, live
+        key_length, value_length, key_hash = _RECORD.unpack_from(
+            self._mm, self._arena_base + position
+        )
+        if key_length == _PADDING:
+            return tail + self._size - position, live
+
+        for probe in range(self._slots):
+            index = (key_hash + probe) & self._mask
+            slot_hash, offset = _SLOT.unpack_from(
+                self._mm, self._slot_base + index * _SLOT.size
+            )[0:2]
+            if slot_hash == _EMPTY:
+                break
+            elif slot_hash == key_hash and offset == tail:
+                self._set_slot(index, _TOMBSTONE, 0, 0)
+                live -= 1
+                break
+        return tail + _RECORD.size + key_length + value_length, live
+
+    def _rehash(self):
+        """Rebuild the hash table, discarding deleted slots."""
+
+        entries = []
+        for index in range(self._slots):
+            entry = _SLOT.unpack_from(
+                self._mm, self._slot_base + index * _SLOT.size
+            )
+            if entry[0] > _TOMBSTONE:
+                entries.append(entry)
+        self._mm[self._slot_base : self._arena_base] = bytes(
+            self._arena_base - self._slot_base
+        )
+        for key_hash, offset, length in entries:
+            index = key_hash & self._mask
+            while _SLOT.unpack_from(
+                self._mm, self._slot_base + index * _SLOT.size
+            )[0]:
+                index = (index + 1) & self._mask
+            self._set_slot(index, key_hash, offset, length)
+        return len(entries)
+
+    def _store(self, key, value):
+        key_bytes = key.encode("utf-8")
+        key_hash = _hash(key_bytes)
+        length = _RECORD.size + len(key_bytes) + len(value)
+        if length > self._size:
+            self._remove(key_bytes, key_hash)
+            return
+
+        head, tail, live, used = self._read_header()
+        position = head % self._size
+        if position + length > self._size:
+            # records don't wrap around the end of the buffer; skip to
+            # the start, marking the remainder as padding
+            padding = self._size - position
+        else:
+            padding = 0
+        while tail < head and head + padding + length - tail > self._size:
+            tail, live = self._evict_oldest(tail, live)
+        while tail < head and live >= self._max_live:
+            tail, live = self._evict_oldest(tail, live)
+        if tail >= head:
+            tail = head + padding
+        if used >= self._max_live:
+            used = self._rehash()
+        self._write_header(head, tail, live, used)
+
+        if padding >= _RECORD.size:
+            _RECORD.pack_into(
+                self._mm, self._arena_base + position, _PADDING, 0, 0
+            )
+        offset = head + padding
+        start = self._arena_base + offset % self._size
+        _RECORD.pack_into(
+            self._mm, start, len(key_bytes), len(value), key_hash
+        )
+        start += _RECORD.size
+        self._mm[start : start + len(key_bytes)] = key_bytes
+        start += len(key_bytes)
+        self._mm[start : start + len(value)] = value
+
+        index, record = self._find(key_bytes, key_hash)
+        if index is None:
+            live += 1
+            for probe in range(self._slots):
+                index = (key_hash + probe) & self._mask
+                slot_hash = _SLOT.unpack_from(
+                    self._mm, self._slot_base + index * _SLOT.size
+                )[0]
+                if slot_hash == _EMPTY:
+                    used += 1
+                    break
+                elif slot_hash == _TOMBSTONE:
+                    break
+        # the slot is published once the record is complete
+        self._set_slot(index, key_hash, offset, length)
+        self._write_header(offset + length, tail, live, used)
+
+    def _remove(self, key_bytes, key_hash):
+        index, record = self._find(key_bytes, key_hash)
+        if index is not None:
+            self._set_slot(index, _TOMBSTONE, 0, 0)
+            head, tail, live, used = self._read_header()
+            self._write_header(head, tail, live - 1, used)
+
+    def set_serialized(self, key, value):
+        with self._write_lock:
+            self._store(key, value)
+
+    def set_serialized_multi(self, mapping):
+        with self._write_lock:
+            for key, value in mapping.items():
+                self._store(key, value)
+
+    def delete(self, key):
+        key_bytes = key.encode("utf-8")
+        with self._write_lock:
+            self._remove(key_bytes, _hash(key_bytes))
+
+    def delete_multi(self, keys):
+        with self._write_lock:
+            for key in keys:
+                key_bytes = key.encode("utf-8")
+                self._remove(key_bytes, _hash(key_bytes))
@@ -0,0 +1,346 @@
+"""
+SQLite Backend
+--------------
+
+Provides a backend which stores values in an SQLite database, a
+persistent local cache which may be shared by the processes on a host.
+
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+
+from ..api import BytesBackend
+from ..api import NO_VALUE
+
+__all__ = ["SQLiteBackend"]
+
+
+class SQLiteBackend(BytesBackend):
+    """A backend which stores values in an SQLite database file.
+
+    The database is opened in write-ahead log mode, so that readers don't
+    block the writer or each other, and each thread, and each process,
+    uses its own connection.  Any number of processes on a host may share
+    the same database file.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+
+        region = make_region().configure(
+            'dogpile.cache.sqlite',
+            expiration_time=600,
+            arguments={
+                "filename": "/var/cache/myapp/cache.sqlite",
+                "expiration_time": 3600,
+                "max_entries": 100000,
+            }
+        )
+
+    The ``get_multi()``, ``set_multi()`` and ``delete_multi()`` methods of
+    the region each use a single query, or a single transaction, for all
+    of the given keys.
+
+    When ``expiration_time`` is given, the time at which each row expires
+    is stored along with it; expired rows are treated as misses, and a
+    small batch of them is deleted as part of each write, so that rows
+    for keys which are no longer accessed are eventually removed without
+    a pause to scan the whole table.  As is the case for
+    :paramref:`.RedisBackend.redis_expiration_time`, the backend's
+    ``expiration_time`` should normally be greater than that of the
+    region, so that an expired value remains available to be returned by
+    :meth:`.CacheRegion.get_or_create` while a new value is generated.
+
+    When ``max_entries`` is given, the least recently used rows are
+    deleted once the table holds more than this number of rows.  To avoid
+    turning every read into a write, the time at which a row was last
+    read is only updated once it is older than ``touch_interval``, so
+    that eviction order is only approximately least recently used.
+
+    The dogpile lock used by this backend is the default thread-based
+    mutex, which does not coordinate regeneration among processes.
+
+    Parameters to the ``arguments`` dictionary are below.
+
+    :param filename: Path of the database file, which is created if it
+     does not exist.
+
+    :param table: Optional.  Name of the table holding values; defaults
+     to ``"dogpile_cache"``.  Several regions may share one database file
+     by using different tables.
+
+    :param expiration_time: Optional.  Number of seconds after being set
+     at which a row expires and is removed from the database.
+
+    :param max_entries: Optional.  The maximum number of rows held in the
+     table.
+
+    :param touch_interval: Optional.  When used with ``max_entries``, the
+     minimum number of seconds between updates of the time at which a row
+     was last read; defaults to 60.
+
+    :param timeout: Optional.  Number of seconds to wait for another
+     connection to finish writing before raising an error; defaults to 5.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    _purge_batch = 100
+    """Maximum number of expired rows deleted as part of a write."""
+
+    _chunk_size = 500
+    """Maximum number of keys in the ``IN`` clause of a single query,
+    which is kept below the SQLite limit on the number of parameters."""
+
+    def __init__(self, arguments):
+        self.filename = os.path.abspath(
+            os.path.normpath(arguments["filename"])
+        )
+        self.table = table = arguments.get("table", "dogpile_cache")
+        if not table.isidentifier():
+            raise ValueError("Invalid table name %r" % table)
+        expiration_time = arguments.get("expiration_time")
+        self.expiration_time = (
+            float(expiration_time) if expiration_time else None
+        )
+        max_entries = arguments.get("max_entries")
+        self.max_entries = int(max_entries) if max_entries else None
+        self.touch_interval = float(arguments.get("touch_interval", 60))
+        self.timeout = float(arguments.get("timeout", 5))
+        self._local = threading.local()
+
+        self._select_one = (
+            'SELECT value, expires, accessed FROM "%s" WHERE key = ?' % table
+        )
+        self._upsert = (
+            'INSERT INTO "%s" (key, value, expires, accessed) '
+            "VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+            "value = excluded.value, expires = excluded.expires, "
+            "accessed = excluded.accessed" % table
+        )
+        self._delete = 'DELETE FROM "%s" WHERE key = ?' % table
+        self._touch = 'UPDATE "%s" SET accessed = ? WHERE key = ?' % table
+        self._purge = (
+            'DELETE FROM "%s" WHERE key IN (SELECT key FROM "%s" '
+            "WHERE expires IS NOT NULL AND expires <= ? LIMIT ?)"
+            % (table, table)
+        )
+
+        with self._transaction() as conn:
+            self._create_schema(conn)
+
+    def _create_schema(self, conn):
+        table = self.table
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS "%s" ('
+            "key TEXT PRIMARY KEY, "
+            "value BLOB NOT NULL, "
+            "expires REAL, "
+            "accessed REAL NOT NULL)" % table
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS "%s_expires" ON "%s" (expires) '
+            "WHERE expires IS NOT NULL" % (table, table)
+        )
+        if self.max_entries is None:
+            return
+
+        # count(*) scans the whole table, so the number of rows is kept
+        # up to date by triggers once eviction is in use
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS "%s_accessed" ON "%s" (accessed)'
+            % (table, table)
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS "%s_count" (n INTEGER NOT NULL)'
+            % table
+        )
+        conn.execute(
+            'INSERT INTO "%s_count" (n) SELECT count(*) FROM "%s" '
+            'WHERE NOT EXISTS (SELECT 1 FROM "%s_count")'
+            % (table, table, table)
+        )
+        conn.execute(
+            'CREATE TRIGGER IF NOT EXISTS "%s_insert" AFTER INSERT ON "%s" '
+            'BEGIN UPDATE "%s_count" SET n = n + 1; END'
+            % (table, table, table)
+        )
+        conn.execute(
+            'CREATE TRIGGER IF NOT EXISTS "%s_delete" AFTER DELETE ON "%s" '
+            'BEGIN UPDATE "%s_count" SET n = n - 1; END'
+            % (table, table, table)
+        )
+
+    def _connection(self):
+        """Return the connection of the current thread, opening it if
+        needed.
+
+        A connection must not be used after a fork, so the child process
+        opens its own.
+
+        """
+        pid = os.getpid()
+        try:
+            conn, conn_pid = self._local.conn
+        except AttributeError:
+            pass
+        else:
+            if conn_pid == pid:
+                return conn
+        conn = sqlite3.connect(
+            self.filename, timeout=self.timeout, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # in WAL mode, a commit is durable across an application crash
+        # without an fsync; only a power loss may lose recent writes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn, pid
+        return conn
+
+    def _transaction(self):
+        return _Transaction(self._connection())
+
+    def _chunks(self, keys):
+        for start in range(0, len(keys), self._chunk_size):
+            yield keys[start : start + self._chunk_size]
+
+    def _is_live(self, row, now):
+        return row is not None and (row[1] is None or row[1] > now)
+
+    def _touch_rows(self, keys, now):
+        if keys:
+            with self._transaction() as conn:
+                conn.executemany(self._touch, [(now, key) for key in keys])
+
+    def get_serialized(self, key):
+        now = time.time()
+        row = self._connection().execute(self._select_one, (key,)).fetchone()
+        if not self._is_live(row, now):
+            return NO_VALUE
+        if self.max_entries is not None and row[2] < now - self.touch_interval:
+            self._touch_rows([key], now)
+        return row[0]
+
+    def get_serialized_multi(self, keys):
+        keys = list(keys)
+        if not keys:
+            return []
+        now = time.time()
+        conn = self._connection()
+        live: dict[str, tuple[bytes, float]] = {}
+        for chunk in self._chunks(list(set(keys))):
+            for key, value, expires, accessed in conn.execute(
+                'SELECT key, value, expires, accessed FROM "%s" '
+                "WHERE key IN (%s)"
+                % (self.table, ", ".join("?" * len(chunk))),
+                chunk,
+            ):
+                if expires is None or expires > now:
+                    live[key] = value, accessed
+
+        if self.max_entries is not None:
+            self._touch_rows(
+                [
+                    key
+                    for key, (value, accessed) in live.items()
+                    if accessed < now - self.touch_interval
+                ],
+                now,
+            )
+        return [live[key][0] if key in live else NO_VALUE for key in keys]
+
+    def set_serialized(self, key, value):
+        self.set_serialized_multi({key: value})
+
+    def set_serialized_multi(self, mapping):
+        if not mapping:
+            return
+        now = time.time()
+        expires = (
+            now + self.expiration_time
+            if self.expiration_time is not None
+            else None
+        )
+        with self._transaction() as conn:
+            conn.executemany(
+                self._upsert,
+                [(key, value, expires, now) for key, value in mapping.items()],
+            )
+            if self.expiration_time is not None:
+                conn.execute(self._purge, (now, self._purge_batch))
+            if self.max_entries is not None:
+                self._evict(conn)
+
+    def _evict(self, conn):
+        (count,) = conn.execute(
+            'SELECT n FROM "%s_count"' % self.table
+        ).fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                'DELETE FROM "%s" WHERE key IN (SELECT key FROM "%s" '
+                "ORDER BY accessed LIMIT ?)" % (self.table, self.table),
+                (count - self.max_entries,),
+            )
+
+    def delete(self, key):
+        with self._transaction() as conn:
+            conn.execute(self._delete, (key,))
+
+    def delete_multi(self, keys):
+        keys = list(keys)
+        if not keys:
+            return
+        with self._transaction() as conn:
+            for chunk in self._chunks(keys):
+                conn.execute(
+                    'DELETE FROM "%s" WHERE key IN (%s)'
+                    % (self.table, ", ".join("?" * len(chunk))),
+                    chunk,
+                )
+
+    def sweep(self):
+        """Delete all expired rows from the database.
+
+        Has no effect if the ``expiration_time`` argument is not in use.
+
+        """
+        if self.expiration_time is None:
+            return
+        with self._transaction() as conn:
+            conn.execute(
+                'DELETE FROM "%s" WHERE expires IS NOT NULL AND expires <= ?'
+                % self.table,
+                (time.time(),),
+            )
+
+
+class _Transaction:
+    """Runs a write transaction on a connection in autocommit mode.
+
+    ``BEGIN IMMEDIATE`` takes the write lock up front, waiting for it up
+    to the connection's timeout, rather than upgrading a read lock part
+    way through, which fails immediately if another connection is
+    writing.
+
+    """
+
+    __slots__ = ("conn",)
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, type_, value, traceback):
+        if type_ is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
@@ -0,0 +1,424 @@
+"""
+Compression
+-----------
+
+Provides :class:`.CompressionProxy`, a :class:`.ProxyBackend` which
+compresses serialized values above a size threshold before they are
+stored, along with the compressors it may use.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+import logging
+import lzma
+import threading
+import time
+from typing import Any
+import zlib
+
+from .api import KeyType
+from .api import NO_VALUE
+from .api import SerializedReturnType
+from .proxy import ProxyBackend
+
+__all__ = [
+    "CompressionProxy",
+    "CompressionStats",
+    "Compressor",
+    "ZlibCompressor",
+    "LzmaCompressor",
+    "ZstdCompressor",
+]
+
+log = logging.getLogger(__name__)
+
+# first byte of a compressed value, followed by the tag of the compressor.
+# serialized values written by a region begin with "{" or the binary
+# metadata magic byte 0xD0, so cannot be mistaken for a compressed value
+_MAGIC = b"\xdc"
+
+
+class Compressor(abc.ABC):
+    """Compresses and decompresses the values stored by a
+    :class:`.CompressionProxy`.
+
+    Each compressor has a :attr:`.tag`, stored in the header of each
+    compressed value so that it is decompressed by the same kind of
+    compressor.  Tags 1 through 15 are reserved for the compressors
+    included with dogpile.cache; custom compressors should use a tag
+    from 16 to 255.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    tag: int
+    """Identifies values compressed by this compressor; an integer from
+    0 to 255."""
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress bytes."""
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress bytes returned by :meth:`.Compressor.compress`."""
+
+        raise NotImplementedError()
+
+
+class ZlibCompressor(Compressor):
+    """Compresses values using :mod:`zlib`.
+
+    :param level: compression level from 0 to 9, or -1 for the zlib
+     default.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    tag = 1
+
+    def __init__(self, level: int = -1):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class LzmaCompressor(Compressor):
+    """Compresses values using :mod:`lzma`, which achieves a higher
+    compression ratio than zlib at a much greater cost in CPU time.
+
+    :param preset: compression preset from 0 to 9.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    tag = 2
+
+    def __init__(self, preset: int = 6):
+        self.preset = preset
+
+    def compress(self, data: bytes) -> bytes:
+        return lzma.compress(
+            data, format=lzma.FORMAT_RAW, filters=self._filters
+        )
+
+    def decompress(self, data: bytes) -> bytes:
+        return lzma.decompress(
+            data, format=lzma.FORMAT_RAW, filters=self._filters
+        )
+
+    @property
+    def _filters(self) -> list[dict[str, Any]]:
+        # the raw format omits the xz container, which would otherwise add
+        # around 60 bytes to each value
+        return [{"id": lzma.FILTER_LZMA2, "preset": self.preset}]
+
+
+class ZstdCompressor(Compressor):
+    """Compresses values using Zstandard.
+
+    Uses the :mod:`compression.zstd` module of Python 3.14 and later, or
+    the `zstandard <https://pypi.org/project/zstandard/>`_ package on
+    earlier versions.
+
+    Small values, such as JSON documents of a few hundred bytes, compress
+    poorly on their own.  A dictionary trained on a sample of typical
+    values using :meth:`.ZstdCompressor.train_dictionary` improves their
+    compression considerably::
+
+        dictionary = ZstdCompressor.train_dictionary(samples)
+        compressor = ZstdCompressor(dictionary=dictionary)
+
+    The same dictionary must be used to read the values back, so the
+    dictionary would normally be saved along with the application.
+
+    :param level: compression level, from 1 to 22.
+
+    :param dictionary: a dictionary returned by
+     :meth:`.ZstdCompressor.train_dictionary`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    tag = 3
+
+    def __init__(self, level: int = 3, dictionary: bytes | None = None):
+        self.level = level
+        self.dictionary = dictionary
+        zstd = self._imports()
+        if zstd.__name__ == "compression.zstd":
+            self._zstd_dict = (
+                zstd.ZstdDict(dictionary) if dictionary is not None else None
+            )
+        else:
+            # zstandard compressors aren't safe for concurrent use, so are
+            # created per thread
+            self._local = threading.local()
+            self._dict_data = (
+                zstd.ZstdCompressionDict(dictionary)
+                if dictionary is not None
+                else None
+            )
+        self._zstd = zstd
+
+    @staticmethod
+    def _imports() -> Any:
+        try:
+            from compression import zstd
+        except ImportError:
+            import zstandard as zstd
+        return zstd
+
+    @classmethod
+    def train_dictionary(
+        cls, samples: Iterable[bytes], size: int = 16384
+    ) -> bytes:
+        """Train a compression dictionary of up to ``size`` bytes from
+        sample values.
+
+        The samples should be serialized values as they would be stored
+        by the region, typically a few hundred or more of them.
+
+        """
+
+        zstd = cls._imports()
+        if zstd.__name__ == "compression.zstd":
+            return bytes(zstd.train_dict(list(samples), size).dict_content)
+        else:
+            return bytes(zstd.train_dictionary(size, list(samples)).as_bytes())
+
+    def compress(self, data: bytes) -> bytes:
+        if self._zstd.__name__ == "compression.zstd":
+            return bytes(
+                self._zstd.compress(
+                    data, level=self.level, zstd_dict=self._zstd_dict
+                )
+            )
+        try:
+            compressor = self._local.compressor
+        except AttributeError:
+            compressor = self._local.compressor = self._zstd.ZstdCompressor(
+                level=self.level, dict_data=self._dict_data
+            )
+        return bytes(compressor.compress(data))
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._zstd.__name__ == "compression.zstd":
+            return bytes(
+                self._zstd.decompress(data, zstd_dict=self._zstd_dict)
+            )
+        try:
+            decompressor = self._local.decompressor
+        except AttributeError:
+            decompressor = self._local.decompressor = (
+                self._zstd.ZstdDecompressor(dict_data=self._dict_data)
+            )
+        return bytes(decompressor.decompress(data))
+
+
+class CompressionStats:
+    """Counts the values compressed and decompressed by a
+    :class:`.CompressionProxy`, and the time spent doing so, for use in
+    tuning :paramref:`.CompressionProxy.threshold`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all counts to zero."""
+
+        with self._lock:
+            self.compressed = 0
+            """Number of values stored compressed."""
+
+            self.uncompressed = 0
+            """Number of values stored uncompressed, because they were
+            smaller than the threshold or didn't become smaller when
+            compressed."""
+
+            self.decompressed = 0
+            """Number of values decompressed."""
+
+            self.bytes_in = 0
+            """Total size of the values compressed, before compression,
+            including those which didn't become smaller."""
+
+            self.bytes_out = 0
+            """Total size of the values compressed, after compression."""
+
+            self.compress_seconds = 0.0
+            """Total time spent compressing values."""
+
+            self.decompress_seconds = 0.0
+            """Total time spent decompressing values."""
+
+    @property
+    def ratio(self) -> float:
+        """The total size of values before compression divided by their
+        size after compression, or 1.0 if no values were compressed."""
+
+        return self.bytes_in / self.bytes_out if self.bytes_out else 1.0
+
+    def _record_compress(
+        self, seconds: float, size: int, compressed_size: int | None
+    ) -> None:
+        with self._lock:
+            self.compress_seconds += seconds
+            self.bytes_in += size
+            if compressed_size is None:
+                self.bytes_out += size
+                self.uncompressed += 1
+            else:
+                self.bytes_out += compressed_size
+                self.compressed += 1
+
+    def _record_decompress(self, seconds: float) -> None:
+        with self._lock:
+            self.decompress_seconds += seconds
+            self.decompressed += 1
+
+
+class CompressionProxy(ProxyBackend):
+    """Compresses serialized values of at least
+    :paramref:`.CompressionProxy.threshold` bytes before they are stored,
+    decompressing them when they are read back::
+
+        from dogpile.cache import make_region
+        from dogpile.cache.compression import CompressionProxy
+        from dogpile.cache.compression import ZlibCompressor
+
+        region = make_region().configure(
+            "dogpile.cache.redis",
+            arguments={"host": "localhost"},
+            wrap=[CompressionProxy(ZlibCompressor(level=6), threshold=1024)],
+        )
+
+    Compressed values begin with a two-byte header identifying the
+    compressor used, and values stored uncompressed are read back
+    unchanged, so the proxy may be added to a region whose backend
+    already holds values, and the compressor or threshold may be changed
+    without clearing the cache, provided the previous compressor is
+    listed in :paramref:`.CompressionProxy.decompressors`.  A value which
+    can't be decompressed is treated as a cache miss.
+
+    Only serialized values are compressed; the proxy has no effect on a
+    backend which stores Python objects, such as
+    ``dogpile.cache.memory``.
+
+    :param compressor: the :class:`.Compressor` used to compress values;
+     defaults to :class:`.ZlibCompressor`.
+
+    :param threshold: values smaller than this number of bytes are
+     stored uncompressed.  Values which don't become smaller when
+     compressed are also stored uncompressed.
+
+    :param decompressors: additional :class:`.Compressor` objects used to
+     decompress values with their tag, such as a compressor used
+     previously.
+
+    The :attr:`.CompressionProxy.stats` attribute counts the values
+    compressed, their total size before and after, and the time spent.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(
+        self,
+        compressor: Compressor | None = None,
+        threshold: int = 1024,
+        decompressors: Sequence[Compressor] = (),
+    ):
+        super().__init__()
+        self.compressor = (
+            compressor if compressor is not None else ZlibCompressor()
+        )
+        self.threshold = threshold
+        self.decompressors: dict[int, Compressor] = {
+            decompressor.tag: decompressor for decompressor in decompressors
+        }
+        self.decompressors[self.compressor.tag] = self.compressor
+        self.stats = CompressionStats()
+
+    def _compress(self, value: bytes) -> bytes:
+        if len(value) < self.threshold:
+            return value
+        start = time.perf_counter()
+        compressed = self.compressor.compress(value)
+        seconds = time.perf_counter() - start
+        if len(compressed) + 2 >= len(value):
+            self.stats._record_compress(seconds, len(value), None)
+            return value
+        self.stats._record_compress(seconds, len(value), len(compressed) + 2)
+        return _MAGIC + bytes((self.compressor.tag,)) + compressed
+
+    def _decompress(
+        self, key: KeyType, value: SerializedReturnType
+    ) -> SerializedReturnType:
+        if value is NO_VALUE or value[0:1] != _MAGIC:
+            return value
+        decompressor = self.decompressors.get(value[1])
+        if decompressor is None:
+            log.warning(
+                "No decompressor for tag %d of value %r; "
+                "treating as a cache miss",
+                value[1],
+                key,
+            )
+            return NO_VALUE
+        start = time.perf_counter()
+        try:
+            data = decompressor.decompress(value[2:])
+        except Exception:
+            log.warning(
+                "Can't decompress value %r; treating as a cache miss",
+                key,
+                exc_info=True,
+            )
+            return NO_VALUE
+        self.stats._record_decompress(time.perf_counter() - start)
+        return data
+
+    def get_serialized(self, key: KeyType) -> SerializedReturnType:
+        return self._decompress(key, self.proxied.get_serialized(key))
+
+    def get_serialized_multi(
+        self, keys: Iterable[KeyType]
+    ) -> Sequence[SerializedReturnType]:
+        keys = list(keys)
+        return [
+            self._decompress(key, value)
+            for key, value in zip(
+                keys, self.proxied.get_serialized_multi(keys)
+            )
+        ]
+
+    def set_serialized(self, key: KeyType, value: bytes) -> None:
+        self.proxied.set_serialized(key, self._compress(value))
+
+    def set_serialized_multi(self, mapping: Mapping[KeyType, bytes]) -> None:
+        self.proxied.set_serialized_multi(
+            {key: self._compress(value) for key, value in mapping.items()}
+        )
@@ -0,0 +1,627 @@
+"""
+Eviction Policies
+-----------------
+
+Provides bounded key/value containers which implement a particular
+eviction policy, for use by the size-managed in-process backends such as
+:class:`.BoundedMemoryBackend`.
+
+Each policy stores its own values and keeps the number of entries at or
+below a fixed ``capacity``; the weighted variants instead keep the sum of
+per-entry weights within ``capacity``.  Every operation runs in constant
+time, or amortized constant time in the case of weighted eviction.  The
+policies are **not** thread safe on their own; the backends which make use
+of them provide their own locking.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+__all__ = [
+    "EvictionPolicy",
+    "LRUPolicy",
+    "LFUPolicy",
+    "ARCPolicy",
+    "TinyLFUPolicy",
+    "WeightedLRUPolicy",
+    "WeightedLFUPolicy",
+    "eviction_policies",
+    "weighted_eviction_policies",
+    "policy_for_name",
+]
+
+
+class EvictionPolicy:
+    """Base class for a bounded store which evicts according to a policy.
+
+    Subclasses implement :meth:`.EvictionPolicy.get`,
+    :meth:`.EvictionPolicy.set`, :meth:`.EvictionPolicy.pop`,
+    :meth:`.EvictionPolicy.clear` and ``__len__()`` / ``__contains__()``.
+
+    :param capacity: maximum number of entries to be retained.
+
+    """
+
+    name: str
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key``, recording an access."""
+        raise NotImplementedError()
+
+    def set(self, key: Hashable, value: Any) -> list[Hashable]:
+        """Store ``value`` under ``key``, recording an access.
+
+        :return: a list of keys which were evicted in order to make
+         room for the new entry; typically empty or of length one.  The
+         given ``key`` itself may be present in this list, in the case
+         that the policy chose not to admit the new entry.
+
+        """
+        raise NotImplementedError()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key``, returning its value or ``default``."""
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError()
+
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+    def __contains__(self, key: Hashable) -> bool:
+        raise NotImplementedError()
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used entry."""
+
+    name = "lru"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        evicted = []
+        while len(data) > self.capacity:
+            evicted.append(data.popitem(last=False)[0])
+        return evicted
+
+    def pop(self, key, default=None):
+        return self._data.pop(key, default)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently used entry.
+
+    Entries are grouped into buckets by access count; ties within the
+    lowest-count bucket are broken by recency.
+
+    """
+
+    name = "lfu"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._values: dict[Hashable, Any] = {}
+        self._counts: dict[Hashable, int] = {}
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_count = 0
+
+    def _touch(self, key):
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        count += 1
+        self._counts[key] = count
+        self._buckets.setdefault(count, OrderedDict())[key] = None
+
+    def get(self, key, default=None):
+        try:
+            value = self._values[key]
+        except KeyError:
+            return default
+        self._touch(key)
+        return value
+
+    def set(self, key, value):
+        if key in self._values:
+            self._values[key] = value
+            self._touch(key)
+            return []
+
+        evicted = []
+        if len(self._values) >= self.capacity:
+            if self._min_count not in self._buckets:
+                # a pop() emptied the lowest bucket
+                self._min_count = min(self._buckets)
+            bucket = self._buckets[self._min_count]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._values[victim]
+            del self._counts[victim]
+            evicted.append(victim)
+
+        self._values[key] = value
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+        return evicted
+
+    def pop(self, key, default=None):
+        try:
+            value = self._values.pop(key)
+        except KeyError:
+            return default
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+        return value
+
+    def clear(self):
+        self._values.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+
+class ARCPolicy(EvictionPolicy):
+    """Adaptive Replacement Cache.
+
+    Balances between a recency list and a frequency list, using "ghost"
+    lists of recently evicted keys to adapt the target size of each.
+    Ghost entries hold keys only; at most ``capacity`` of them are
+    retained.
+
+    """
+
+    name = "arc"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._t1: OrderedDict[Hashable, Any] = OrderedDict()
+        self._t2: OrderedDict[Hashable, Any] = OrderedDict()
+        self._b1: OrderedDict[Hashable, None] = OrderedDict()
+        self._b2: OrderedDict[Hashable, None] = OrderedDict()
+        self._p = 0.0
+
+    def get(self, key, default=None):
+        if key in self._t1:
+            value = self._t2[key] = self._t1.pop(key)
+            return value
+        try:
+            value = self._t2[key]
+        except KeyError:
+            return default
+        self._t2.move_to_end(key)
+        return value
+
+    def _replace(self, in_b2, evicted):
+        t1 = self._t1
+        if t1 and (
+            len(t1) > self._p or (in_b2 and len(t1) == self._p) or not self._t2
+        ):
+            old, _ = t1.popitem(last=False)
+            self._b1[old] = None
+        else:
+            old, _ = self._t2.popitem(last=False)
+            self._b2[old] = None
+        evicted.append(old)
+
+    def set(self, key, value):
+        c = self.capacity
+        t1, t2, b1, b2 = self._t1, self._t2, self._b1, self._b2
+        evicted: list[Hashable] = []
+
+        if key in t1:
+            del t1[key]
+            t2[key] = value
+        elif key in t2:
+            t2[key] = value
+            t2.move_to_end(key)
+        elif key in b1:
+            self._p = min(c, self._p + max(len(b2) / len(b1), 1))
+            if len(t1) + len(t2) >= c:
+                self._replace(False, evicted)
+            del b1[key]
+            t2[key] = value
+        elif key in b2:
+            self._p = max(0.0, self._p - max(len(b1) / len(b2), 1))
+            if len(t1) + len(t2) >= c:
+                self._replace(True, evicted)
+            del b2[key]
+            t2[key] = value
+        else:
+            l1 = len(t1) + len(b1)
+            if l1 >= c:
+                if len(t1) < c:
+                    b1.popitem(last=False)
+                    if len(t1) + len(t2) >= c:
+                        self._replace(False, evicted)
+                else:
+                    evicted.append(t1.popitem(last=False)[0])
+            else:
+                total = l1 + len(t2) + len(b2)
+                if total >= c:
+                    if total >= 2 * c:
+                        b2.popitem(last=False)
+                    if len(t1) + len(t2) >= c:
+                        self._replace(False, evicted)
+            t1[key] = value
+        return evicted
+
+    def pop(self, key, default=None):
+        if key in self._t1:
+            return self._t1.pop(key)
+        return self._t2.pop(key, default)
+
+    def clear(self):
+        self._t1.clear()
+        self._t2.clear()
+        self._b1.clear()
+        self._b2.clear()
+        self._p = 0.0
+
+    def __len__(self):
+        return len(self._t1) + len(self._t2)
+
+    def __contains__(self, key):
+        return key in self._t1 or key in self._t2
+
+
+class _FrequencySketch:
+    """A count-min sketch of saturating 4-bit counters with periodic aging.
+
+    Sixteen counters are allocated per unit of capacity.  Counters are
+    halved once the number of recorded increments reaches ten times the
+    capacity, so that the sketch reflects recent history.
+
+    """
+
+    __slots__ = ("_table", "_mask", "_additions", "_sample_size")
+
+    _seeds = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+
+    _halve = bytes(c >> 1 for c in range(256))
+
+    def __init__(self, capacity: int):
+        width = 16
+        while width < capacity * 16:
+            width <<= 1
+        self._table = bytearray(width)
+        self._mask = width - 1
+        self._additions = 0
+        self._sample_size = 10 * capacity
+
+    def increment(self, key):
+        h = hash(key)
+        mask = self._mask
+        table = self._table
+        added = False
+        for seed in self._seeds:
+            idx = ((h * seed) >> 32) & mask
+            if table[idx] < 15:
+                table[idx] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._table = table.translate(self._halve)
+                self._additions //= 2
+
+    def frequency(self, key):
+        h = hash(key)
+        mask = self._mask
+        table = self._table
+        return min(table[((h * seed) >> 32) & mask] for seed in self._seeds)
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """Window TinyLFU.
+
+    New entries enter a small LRU "window"; entries leaving the window are
+    admitted into a segmented LRU main area only if their estimated access
+    frequency, as tracked by a count-min sketch, exceeds that of the entry
+    which would be evicted to make room.  This keeps one-hit wonders from
+    displacing a popular working set, which works well for skewed access
+    patterns.
+
+    """
+
+    name = "tinylfu"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._window_capacity = max(1, capacity // 100)
+        self._main_capacity = capacity - self._window_capacity
+        self._protected_capacity = int(self._main_capacity * 0.8)
+        self._window: OrderedDict[Hashable, Any] = OrderedDict()
+        self._probation: OrderedDict[Hashable, Any] = OrderedDict()
+        self._protected: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sketch = _FrequencySketch(capacity)
+
+    def get(self, key, default=None):
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+            return self._window[key]
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+            return self._protected[key]
+        elif key in self._probation:
+            value = self._probation.pop(key)
+            self._promote(key, value)
+            return value
+        else:
+            return default
+
+    def _promote(self, key, value):
+        protected = self._protected
+        protected[key] = value
+        if len(protected) > self._protected_capacity:
+            demoted, demoted_value = protected.popitem(last=False)
+            self._probation[demoted] = demoted_value
+
+    def set(self, key, value):
+        for segment in (self._window, self._protected, self._probation):
+            if key in segment:
+                segment[key] = value
+                break
+        else:
+            self._sketch.increment(key)
+            self._window[key] = value
+            if len(self._window) > self._window_capacity:
+                return self._admit(*self._window.popitem(last=False))
+            return []
+
+        # existing entry; treat as an access
+        self.get(key)
+        return []
+
+    def _admit(self, candidate, value):
+        probation = self._probation
+        if len(probation) + len(self._protected) < self._main_capacity:
+            probation[candidate] = value
+            return []
+
+        if probation:
+            victim = next(iter(probation))
+        elif self._protected:
+            victim = next(iter(self._protected))
+        else:
+            return [candidate]
+
+        sketch = self._sketch
+        if sketch.frequency(candidate) > sketch.frequency(victim):
+            if victim in probation:
+                del probation[victim]
+            else:
+                del self._protected[victim]
+            probation[candidate] = value
+            return [victim]
+        else:
+            return [candidate]
+
+    def pop(self, key, default=None):
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                return segment.pop(key)
+        return default
+
+    def clear(self):
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._sketch = _FrequencySketch(self.capacity)
+
+    def __len__(self):
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def __contains__(self, key):
+        return (
+            key in self._window
+            or key in self._probation
+            or key in self._protected
+        )
+
+
+def _discard_oversized(policy, key):
+    """Handle an entry which weighs more than the capacity of a weighted
+    policy on its own, returning the list of keys evicted.
+
+    Such an entry is not stored, and other entries are left in place
+    rather than being evicted to make room for it; only an existing entry
+    for the same key is removed, as the new value replaces it.
+
+    """
+    if key not in policy:
+        return []
+    policy.pop(key)
+    return [key]
+
+
+class WeightedLRUPolicy(LRUPolicy):
+    """Evict the least recently used entries until the total weight of
+    all entries is within ``capacity``.
+
+    Weights are passed to :meth:`.WeightedLRUPolicy.set`; the current total
+    is available as :attr:`.WeightedLRUPolicy.weight`.  An entry which
+    weighs more than ``capacity`` on its own is not stored.
+
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._weights: dict[Hashable, int] = {}
+        self.weight = 0
+
+    def set(self, key, value, weight=1):
+        if weight > self.capacity:
+            return _discard_oversized(self, key)
+        data = self._data
+        weights = self._weights
+        self.weight += weight - weights.get(key, 0)
+        data[key] = value
+        data.move_to_end(key)
+        weights[key] = weight
+        evicted = []
+        while self.weight > self.capacity:
+            victim, _ = data.popitem(last=False)
+            self.weight -= weights.pop(victim)
+            evicted.append(victim)
+        return evicted
+
+    def pop(self, key, default=None):
+        if key in self._data:
+            self.weight -= self._weights.pop(key)
+        return self._data.pop(key, default)
+
+    def clear(self):
+        super().clear()
+        self._weights.clear()
+        self.weight = 0
+
+
+class WeightedLFUPolicy(LFUPolicy):
+    """Evict the least frequently used entries until the total weight of
+    all entries is within ``capacity``.
+
+    Weights are passed to :meth:`.WeightedLFUPolicy.set`; the current total
+    is available as :attr:`.WeightedLFUPolicy.weight`.  An entry which
+    weighs more than ``capacity`` on its own is not stored.
+
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._weights: dict[Hashable, int] = {}
+        self.weight = 0
+
+    def set(self, key, value, weight=1):
+        if weight > self.capacity:
+            return _discard_oversized(self, key)
+        weights = self._weights
+        if key in self._values:
+            self.weight += weight - weights[key]
+            self._values[key] = value
+            self._touch(key)
+        else:
+            self.weight += weight
+            self._values[key] = value
+            self._counts[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_count = 1
+        weights[key] = weight
+
+        evicted = []
+        buckets = self._buckets
+        while self.weight > self.capacity:
+            if self._min_count not in buckets:
+                self._min_count = min(buckets)
+            bucket = buckets[self._min_count]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del buckets[self._min_count]
+            del self._values[victim]
+            del self._counts[victim]
+            self.weight -= weights.pop(victim)
+            evicted.append(victim)
+        return evicted
+
+    def pop(self, key, default=None):
+        if key in self._values:
+            self.weight -= self._weights.pop(key)
+        return super().pop(key, default)
+
+    def clear(self):
+        super().clear()
+        self._weights.clear()
+        self.weight = 0
+
+
+eviction_policies: dict[str, type[EvictionPolicy]] = {
+    cls.name: cls for cls in (LRUPolicy, LFUPolicy, ARCPolicy, TinyLFUPolicy)
+}
+"""Eviction policy classes, keyed on the names accepted by the
+``eviction_policy`` backend argument."""
+
+weighted_eviction_policies: dict[str, type[EvictionPolicy]] = {
+    "lru": WeightedLRUPolicy,
+    "lfu": WeightedLFUPolicy,
+}
+"""Eviction policy classes which accept a per-entry weight, keyed on the
+names accepted by the ``eviction_policy`` argument of
+:class:`.ByteBoundedMemoryBackend`."""
+
+
+def policy_for_name(
+    name: str | type[EvictionPolicy], weighted: bool = False
+) -> type[EvictionPolicy]:
+    """Resolve an ``eviction_policy`` argument to a policy class.
+
+    The argument may be one of the names in :data:`.eviction_policies`
+    (or :data:`.weighted_eviction_policies`, if ``weighted`` is True)
+    or an :class:`.EvictionPolicy` subclass.
+
+    """
+    if isinstance(name, type) and issubclass(name, EvictionPolicy):
+        return name
+    policies = weighted_eviction_policies if weighted else eviction_policies
+    try:
+        return policies[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown eviction policy %r; expected one of %s"
+            % (name, ", ".join(sorted(policies)))
+        )
@@ -0,0 +1,492 @@
+"""
+Near Cache
+----------
+
+Provides :class:`.NearCacheProxy`, a :class:`.ProxyBackend` which keeps
+a bounded in-process cache of recently used values in front of another
+backend, along with invalidation buses which remove entries from the
+in-process caches of other processes when a value is changed.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+import json
+import logging
+import os
+import socket
+import threading
+from typing import Any
+from typing import Callable
+import uuid
+
+from .api import BackendFormatted
+from .api import BackendSetType
+from .api import KeyType
+from .api import NO_VALUE
+from .api import SerializedReturnType
+from .backends.memory import BoundedMemoryBackend
+from .proxy import ProxyBackend
+
+__all__ = [
+    "NearCacheProxy",
+    "InvalidationBus",
+    "LocalSocketInvalidationBus",
+    "RedisInvalidationBus",
+    "RedisKeyspaceInvalidationBus",
+]
+
+log = logging.getLogger(__name__)
+
+InvalidationCallback = Callable[[Sequence[KeyType]], None]
+
+
+class InvalidationBus(abc.ABC):
+    """Carries the keys of changed values between processes, so that
+    their entries are removed from the in-process cache of each
+    :class:`.NearCacheProxy`.
+
+    Keys are those received by the backend, after any key mangler has
+    been applied, and must be strings.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    @abc.abstractmethod
+    def publish(self, keys: Sequence[KeyType]) -> None:
+        """Announce to other processes that the values of the given keys
+        have changed."""
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        """Register a callable to receive the keys announced by other
+        processes.
+
+        The callable may be called from a background thread.
+
+        """
+
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Stop receiving announcements and release resources."""
+
+
+class LocalSocketInvalidationBus(InvalidationBus):
+    """An :class:`.InvalidationBus` connecting processes on the same
+    host using Unix datagram sockets in a shared directory.
+
+    Each bus binds a socket within the directory, and sends the keys it
+    publishes to all other sockets present there, split over as many
+    datagrams as needed.  This is intended for tests and single-host
+    deployments; the sockets of processes which exit without closing
+    their bus are skipped and removed, and a message which can't be
+    delivered to a socket is logged and dropped, leaving that process's
+    local values to expire.
+
+    E.g.::
+
+        from dogpile.cache.near_cache import LocalSocketInvalidationBus
+
+        bus = LocalSocketInvalidationBus("/var/run/myapp/invalidation")
+
+    :param path: directory in which sockets are created.  It is created
+     if it doesn't exist.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    _max_datagram = 65536
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._address = os.path.join(
+            path, "%d-%s.sock" % (os.getpid(), uuid.uuid4().hex[:12])
+        )
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(self._address)
+        self._datagram_size = min(
+            self._max_datagram,
+            self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+        )
+        self._callbacks: list[InvalidationCallback] = []
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._listen,
+            name="dogpile.cache invalidation listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def publish(self, keys: Sequence[KeyType]) -> None:
+        datagrams = list(self._datagrams(keys))
+        for name in os.listdir(self.path):
+            address = os.path.join(self.path, name)
+            if address == self._address or not name.endswith(".sock"):
+                continue
+            try:
+                for data in datagrams:
+                    self._socket.sendto(data, address)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # the process owning the socket has gone away
+                try:
+                    os.unlink(address)
+                except OSError:
+                    pass
+            except OSError:
+                # the announcement is lost for this peer; its local
+                # entries remain bounded by the near cache expiration time
+                log.warning(
+                    "Failed to send invalidation message to %s",
+                    address,
+                    exc_info=True,
+                )
+
+    def _datagrams(self, keys: Sequence[KeyType]) -> Iterator[bytes]:
+        """Split keys into JSON lists which each fit in one datagram."""
+        chunk: list[KeyType] = []
+        size = 2
+        for key in keys:
+            key_size = len(json.dumps(key).encode("utf-8")) + 1
+            if chunk and size + key_size > self._datagram_size:
+                yield json.dumps(chunk, separators=(",", ":")).encode("utf-8")
+                chunk = []
+                size = 2
+            chunk.append(key)
+            size += key_size
+        if chunk:
+            yield json.dumps(chunk, separators=(",", ":")).encode("utf-8")
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        self._callbacks.append(callback)
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                data = self._socket.recv(self._max_datagram)
+            except OSError:
+                return
+            if self._closed:
+                return
+            try:
+                keys = json.loads(data)
+            except ValueError:
+                log.warning("Ignoring malformed invalidation message")
+                continue
+            for callback in self._callbacks:
+                callback(keys)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            # wake the listener thread
+            self._socket.sendto(b"", self._address)
+        except OSError:
+            pass
+        self._thread.join(5)
+        self._socket.close()
+        try:
+            os.unlink(self._address)
+        except OSError:
+            pass
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """An :class:`.InvalidationBus` using Redis pub/sub.
+
+    Keys are published as a message on a channel, to which each bus
+    subscribes using a background thread.  Messages published by a bus
+    are ignored by that same bus.
+
+    E.g.::
+
+        import redis
+
+        from dogpile.cache.near_cache import RedisInvalidationBus
+
+        bus = RedisInvalidationBus(redis.StrictRedis(host="localhost"))
+
+    :param client: a ``redis.StrictRedis`` client, or a client of a
+     compatible library such as ``valkey``.
+
+    :param channel: name of the channel.  Defaults to
+     ``"dogpile.cache.invalidate"``.
+
+    :param sleep_time: interval in seconds at which the background thread
+     polls for messages.  Defaults to ``0.1``.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        channel: str = "dogpile.cache.invalidate",
+        sleep_time: float = 0.1,
+    ):
+        self.client = client
+        self.channel = channel
+        self._origin = uuid.uuid4().hex
+        self._callbacks: list[InvalidationCallback] = []
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{channel: self._on_message})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=sleep_time, daemon=True
+        )
+
+    def publish(self, keys: Sequence[KeyType]) -> None:
+        self.client.publish(
+            self.channel, json.dumps({"o": self._origin, "k": list(keys)})
+        )
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        self._callbacks.append(callback)
+
+    def _on_message(self, message: Mapping[str, Any]) -> None:
+        try:
+            data = json.loads(message["data"])
+        except ValueError:
+            log.warning("Ignoring malformed invalidation message")
+            return
+        if data["o"] == self._origin:
+            return
+        for callback in self._callbacks:
+            callback(data["k"])
+
+    def close(self) -> None:
+        self._thread.stop()
+        self._pubsub.close()
+
+
+class RedisKeyspaceInvalidationBus(InvalidationBus):
+    """An :class:`.InvalidationBus` using Redis keyspace notifications.
+
+    Rather than publishing keys itself, the bus subscribes to the
+    notifications Redis sends whenever a key is written, deleted, expired
+    or evicted, so that values changed by any client, not only a
+    :class:`.NearCacheProxy`, are invalidated.  The Redis server must be
+    configured to send keyspace notifications, e.g. using
+    ``notify-keyspace-events "Kgx$"``.  As notifications are also received
+    for the process's own writes, a value set by a process is removed
+    from its own in-process cache shortly afterwards.
+
+    :param client: a ``redis.StrictRedis`` client, or a client of a
+     compatible library such as ``valkey``.
+
+    :param db: the database number the backend uses.  Defaults to ``0``.
+
+    :param pattern: glob-style pattern of the keys to receive
+     notifications for.  Defaults to ``"*"``.
+
+    :param sleep_time: interval in seconds at which the background thread
+     polls for messages.  Defaults to ``0.1``.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        db: int = 0,
+        pattern: str = "*",
+        sleep_time: float = 0.1,
+    ):
+        self.client = client
+        self._prefix = "__keyspace@%d__:" % db
+        self._callbacks: list[InvalidationCallback] = []
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.psubscribe(**{self._prefix + pattern: self._on_message})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=sleep_time, daemon=True
+        )
+
+    def publish(self, keys: Sequence[KeyType]) -> None:
+        # Redis publishes notifications for the keys written
+        pass
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        self._callbacks.append(callback)
+
+    def _on_message(self, message: Mapping[str, Any]) -> None:
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        keys = [channel[len(self._prefix) :]]
+        for callback in self._callbacks:
+            callback(keys)
+
+    def close(self) -> None:
+        self._thread.stop()
+        self._pubsub.close()
+
+
+class NearCacheProxy(ProxyBackend):
+    """A :class:`.ProxyBackend` which keeps a bounded in-process cache of
+    values in front of the proxied backend.
+
+    Values read from or written to the proxied backend are kept in an
+    in-process :class:`.BoundedMemoryBackend`, so that further reads of
+    the same keys are served without a round trip to the proxied
+    backend.  Values are kept in the form the proxied backend returned
+    them, so that values retrieved using serialization are not
+    serialized again.
+
+    E.g.::
+
+        import redis
+
+        from dogpile.cache import make_region
+        from dogpile.cache.near_cache import NearCacheProxy
+        from dogpile.cache.near_cache import RedisInvalidationBus
+
+        region = make_region().configure(
+            "dogpile.cache.redis",
+            expiration_time=3600,
+            arguments={"host": "localhost"},
+            wrap=[
+                NearCacheProxy(
+                    max_entries=1000,
+                    expiration_time=5,
+                    bus=RedisInvalidationBus(
+                        redis.StrictRedis(host="localhost")
+                    ),
+                )
+            ],
+        )
+
+    Values written or deleted through the proxy are announced on the
+    ``bus``, if given, which removes them from the in-process caches of
+    other processes.  As announcements may be lost, such as when a
+    process is disconnected from the bus, the ``expiration_time`` bounds
+    how long a value may be served from memory after it was changed
+    elsewhere.
+
+    :param max_entries: maximum number of values kept in memory.
+     Defaults to ``1000``.
+
+    :param expiration_time: number of seconds for which a value is kept
+     in memory.  Defaults to ``None``, in which case values are kept until
+     they are evicted or invalidated.
+
+    :param eviction_policy: eviction policy of the in-process cache; see
+     :class:`.BoundedMemoryBackend`.  Defaults to ``"lru"``.
+
+    :param bus: an :class:`.InvalidationBus`.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        expiration_time: float | None = None,
+        eviction_policy: str = "lru",
+        bus: InvalidationBus | None = None,
+    ):
+        self.local = BoundedMemoryBackend(
+            {
+                "max_entries": max_entries,
+                "expiration_time": expiration_time,
+                "eviction_policy": eviction_policy,
+            }
+        )
+        self.bus = bus
+        if bus is not None:
+            bus.subscribe(self.invalidate_local)
+
+    def _publish(self, keys: Sequence[KeyType]) -> None:
+        if self.bus is not None:
+            self.bus.publish(keys)
+
+    def get(self, key: KeyType) -> BackendFormatted:
+        value: BackendFormatted = self.local.get(key)
+        if value is NO_VALUE:
+            value = self.proxied.get(key)
+            if value is not NO_VALUE:
+                self.local.set(key, value)
+        return value
+
+    def get_multi(self, keys: Iterable[KeyType]) -> Sequence[BackendFormatted]:
+        return self._get_multi(keys, self.proxied.get_multi)
+
+    def get_serialized(self, key: KeyType) -> SerializedReturnType:
+        value: SerializedReturnType = self.local.get(key)
+        if value is NO_VALUE:
+            value = self.proxied.get_serialized(key)
+            if value is not NO_VALUE:
+                self.local.set(key, value)
+        return value
+
+    def get_serialized_multi(
+        self, keys: Iterable[KeyType]
+    ) -> Sequence[SerializedReturnType]:
+        return self._get_multi(keys, self.proxied.get_serialized_multi)
+
+    def _get_multi(
+        self,
+        keys: Iterable[KeyType],
+        fn: Callable[[Sequence[KeyType]], Sequence[Any]],
+    ) -> list[Any]:
+        keys = list(keys)
+        values = list(self.local.get_multi(keys))
+        missing = [i for i, value in enumerate(values) if value is NO_VALUE]
+        if missing:
+            found = {}
+            for i, value in zip(missing, fn([keys[i] for i in missing])):
+                if value is not NO_VALUE:
+                    values[i] = found[keys[i]] = value
+            self.local.set_multi(found)
+        return values
+
+    def set(self, key: KeyType, value: BackendSetType) -> None:
+        self.proxied.set(key, value)
+        self.local.set(key, value)
+        self._publish([key])
+
+    def set_multi(self, mapping: Mapping[KeyType, BackendSetType]) -> None:
+        self.proxied.set_multi(mapping)
+        self.local.set_multi(mapping)
+        self._publish(list(mapping))
+
+    def set_serialized(self, key: KeyType, value: bytes) -> None:
+        self.proxied.set_serialized(key, value)
+        self.local.set(key, value)
+        self._publish([key])
+
+    def set_serialized_multi(self, mapping: Mapping[KeyType, bytes]) -> None:
+        self.proxied.set_serialized_multi(mapping)
+        self.local.set_multi(mapping)
+        self._publish(list(mapping))
+
+    def delete(self, key: KeyType) -> None:
+        self.proxied.delete(key)
+        self.local.delete(key)
+        self._publish([key])
+
+    def delete_multi(self, keys: Iterable[KeyType]) -> None:
+        keys = list(keys)
+        self.proxied.delete_multi(keys)
+        self.local.delete_multi(keys)
+        self._publish(keys)
+
+    def invalidate_local(self, keys: Iterable[KeyType]) -> None:
+        """Remove the given keys from the in-process cache only."""
+
+        self.local.delete_multi(keys)
@@ -11,7 +11,10 @@ from functools import partial
 from functools import wraps
 import json
 import logging
+import math
 from numbers import Number
+import random
+import struct
 import threading
 import time
 from typing import Any
@@ -22,12 +25,15 @@ from typing import TYPE_CHECKING
 from decorator import decorate
 
 from . import exception
+from .api import AsyncCacheBackend
 from .api import BackendArguments
 from .api import BackendFormatted
+from .api import CachedMetadata
 from .api import CachedValue
 from .api import CacheMutex
 from .api import CacheReturnType
 from .api import CantDeserializeException
+from .api import Deserializer
 from .api import KeyType
 from .api import MetaDataType
 from .api import NO_VALUE
@@ -38,6 +44,10 @@ from .api import ValuePayload
 from .backends import _backend_loader
 from .backends import register_backend  # noqa
 from .proxy import ProxyBackend
+from .serializers import Codec
+from .serializers import get_codec
+from .stats import _namespace
+from .stats import StatsObserver
 from .util import function_key_generator
 from .util import function_multi_key_generator
 from .util import repr_obj
@@ -58,6 +68,126 @@ values from a previous, backwards-incompatible version.
 
 log = logging.getLogger(__name__)
 
+_BINARY_MAGIC = 0xD0
+"""First byte of a serialized value with a binary metadata header; JSON
+headers start with ``{``."""
+
+_BINARY_FORMAT_VERSION = 1
+
+# magic, format version, value version, number of extensions, creation time
+_BINARY_HEADER = struct.Struct("<BBBBd")
+
+# extension tag, length of extension data
+_BINARY_EXTENSION = struct.Struct("<BH")
+
+_BINARY_JSON_EXTENSION = 0
+"""Extension holding a JSON object of metadata keys which don't have an
+extension of their own."""
+
+_binary_metadata_extensions: dict[str, tuple[int, struct.Struct]] = {
+    # creation duration, when early_expiration_beta is used
+    "d": (1, struct.Struct("<d")),
+    # retry time and number of failed regenerations, when stale_on_error
+    # is used
+    "rt": (2, struct.Struct("<d")),
+    "rf": (3, struct.Struct("<I")),
+    # negative value flag
+    "nx": (4, struct.Struct("<B")),
+    # id of the codec which serialized the payload
+    "c": (5, struct.Struct("<B")),
+}
+"""Metadata keys stored in binary headers as fixed-width extensions,
+mapped to their extension tag and format."""
+
+_binary_metadata_tags = {
+    tag: (key, format_)
+    for key, (tag, format_) in _binary_metadata_extensions.items()
+}
+
+
+def _pack_binary_metadata(metadata: MetaDataType) -> bytes:
+    if isinstance(metadata, CachedMetadata):
+        ct, v, extra = metadata.ct, metadata.v, metadata._extra
+    else:
+        extra = dict(metadata)
+        ct, v = extra.pop("ct"), extra.pop("v")
+
+    if not extra:
+        return _BINARY_HEADER.pack(
+            _BINARY_MAGIC, _BINARY_FORMAT_VERSION, v, 0, ct
+        )
+
+    extensions = []
+    other = {}
+    for key, value in extra.items():
+        if key in _binary_metadata_extensions:
+            tag, format_ = _binary_metadata_extensions[key]
+            extensions.append(
+                _BINARY_EXTENSION.pack(tag, format_.size) + format_.pack(value)
+            )
+        else:
+            other[key] = value
+    if other:
+        data = json.dumps(other).encode("ascii")
+        extensions.append(
+            _BINARY_EXTENSION.pack(_BINARY_JSON_EXTENSION, len(data)) + data
+        )
+    return b"".join(
+        [
+            _BINARY_HEADER.pack(
+                _BINARY_MAGIC, _BINARY_FORMAT_VERSION, v, len(extensions), ct
+            ),
+            *extensions,
+        ]
+    )
+
+
+def _unpack_binary_metadata(value: bytes) -> tuple[CachedMetadata, int]:
+    """Return the metadata of a serialized value with a binary header, and
+    the offset of its payload.
+
+    Raises :class:`.api.CantDeserializeException` for a header of a format
+    version this version doesn't support.
+
+    """
+
+    magic, format_version, v, count, ct = _BINARY_HEADER.unpack_from(value)
+    if format_version != _BINARY_FORMAT_VERSION:
+        raise CantDeserializeException()
+    offset = _BINARY_HEADER.size
+    if not count:
+        return CachedMetadata(ct, v), offset
+
+    extra = {}
+    for _ in range(count):
+        tag, length = _BINARY_EXTENSION.unpack_from(value, offset)
+        offset += _BINARY_EXTENSION.size
+        if tag == _BINARY_JSON_EXTENSION:
+            extra.update(json.loads(value[offset : offset + length]))
+        elif tag in _binary_metadata_tags:
+            key, format_ = _binary_metadata_tags[tag]
+            extra[key] = format_.unpack_from(value, offset)[0]
+        # extensions unknown to this version are skipped
+        offset += length
+    return CachedMetadata(ct, v, extra), offset
+
+
+class _SerializedPayload:
+    """The payload of a :class:`.CachedValue` read from the backend which
+    has not yet been deserialized.
+
+    The region checks the metadata of a value before deserializing its
+    payload, so that values which are expired or invalidated are never
+    deserialized.
+
+    """
+
+    __slots__ = ("data", "codec")
+
+    def __init__(self, data: bytes, codec: int | None = None):
+        self.data = data
+        self.codec = codec
+
 
 AsyncCreator = Callable[
     ["CacheRegion", KeyType, Callable[[], ValuePayload], CacheMutex], None
@@ -72,6 +202,42 @@ FunctionKeyGenerator = Callable[..., Callable[..., KeyType]]
 FunctionMultiKeyGenerator = Callable[..., Callable[..., Sequence[KeyType]]]
 
 
+class _TimedMutex(CacheMutex):
+    """Wraps the mutex of a key, reporting the time spent waiting to
+    acquire it to the :class:`.StatsObserver` of a region."""
+
+    __slots__ = ("mutex", "region")
+
+    def __init__(self, mutex: CacheMutex, region: CacheRegion):
+        self.mutex = mutex
+        self.region = region
+
+    def acquire(self, wait: bool = True) -> bool:
+        if not wait:
+            return self.mutex.acquire(False)
+        start_time = time.perf_counter()
+        acquired = self.mutex.acquire(True)
+        cast(StatsObserver, self.region.stats).record_mutex_wait(
+            self.region.name,
+            _namespace.get(),
+            time.perf_counter() - start_time,
+        )
+        return acquired
+
+    def release(self) -> None:
+        self.mutex.release()
+
+    def locked(self) -> bool:
+        return self.mutex.locked()
+
+
+def _stats_namespace(namespace: str | None, fn: Callable[..., Any]) -> str:
+    if namespace is None:
+        return "%s:%s" % (fn.__module__, fn.__name__)
+    else:
+        return "%s:%s|%s" % (fn.__module__, fn.__name__, namespace)
+
+
 class RegionInvalidationStrategy:
     """Region invalidation strategy interface
 
@@ -391,9 +557,103 @@ class CacheRegion:
      By default the async_creation_runner is disabled and is set
      to ``None``.
 
+     The :class:`.ThreadPoolCreationRunner` provides a runner which
+     uses a bounded pool of threads, rather than a new thread for each
+     regeneration as above.
+
      .. versionadded:: 0.4.2 added the async_creation_runner
         feature.
 
+    :param binary_metadata: When a serializer is in use, write the metadata
+     of each value, such as its creation time, as a fixed-width binary
+     header in front of the serialized payload, rather than as JSON.  The
+     binary header is smaller and faster to parse.  Values with either
+     form of header are read regardless of this setting, so that the
+     setting may be enabled while values written with JSON headers remain
+     in the cache, provided all processes reading the cache are running a
+     version of dogpile.cache which can read binary headers.  Defaults to
+     ``False``.
+
+     .. versionadded:: 1.5.1
+
+    :param early_expiration_beta: Enables probabilistic early expiration,
+     using the "XFetch" algorithm.  The time taken by the creation function
+     is stored along with each value created by
+     :meth:`.CacheRegion.get_or_create` or
+     :meth:`.CacheRegion.get_or_create_multi`, and each retrieval of the
+     value by these methods may then treat it as expired ahead of the
+     expiration time, with a probability which increases as the expiration
+     time approaches, and for values which take longer to create.  A single
+     caller thereby regenerates a frequently used value ahead of time,
+     rather than every process finding it expired at the same moment,
+     without requiring a distributed lock.  The value is a multiplier of
+     how early values may expire; ``1.0`` is a typical setting, with
+     larger values expiring earlier.  Has no effect without an expiration
+     time.  Defaults to ``None``.
+
+     .. versionadded:: 1.5.1
+
+    :param stale_on_error: Enables returning an expired value when the
+     creation function raises an exception while regenerating it within
+     :meth:`.CacheRegion.get_or_create`, rather than propagating the
+     exception.  The value is the number of seconds past its expiration
+     time for which a value may continue to be returned this way; once a
+     value is older, the exception is raised.  When a regeneration fails,
+     the expired value is written back to the cache along with a marker
+     recording the failure, so that other threads and processes continue
+     to return it rather than retrying the creation function until a
+     retry time is reached.  The retry interval doubles with each
+     consecutive failure, starting at ``stale_on_error_retry`` seconds, up
+     to ``stale_on_error_max_retry`` seconds.  Has no effect without an
+     expiration time.  May be overridden for individual calls using the
+     :paramref:`.CacheRegion.get_or_create.stale_on_error` parameter.
+     Defaults to ``None``.
+
+     .. versionadded:: 1.5.1
+
+    :param stale_on_error_retry: Number of seconds after a first failed
+     regeneration before the value is regenerated again, when
+     ``stale_on_error`` is in use.  Defaults to ``1``.
+
+     .. versionadded:: 1.5.1
+
+    :param stale_on_error_max_retry: Maximum number of seconds between
+     retries of a failing regeneration, when ``stale_on_error`` is in use.
+     Defaults to ``60``.
+
+     .. versionadded:: 1.5.1
+
+    :param negative_expiration_time: Expiration time, in seconds, of
+     "negative" values, such as the result of looking up an entity which
+     doesn't exist, as identified by the
+     :paramref:`.CacheRegion.get_or_create.negative_fn` parameter.  This is
+     typically shorter than the expiration time of the region.  May be
+     overridden for individual calls to :meth:`.CacheRegion.get_or_create`.
+     Defaults to ``None``, in which case negative values expire along with
+     other values.
+
+     .. versionadded:: 1.5.1
+
+    :param stats: A :class:`.StatsObserver`, such as
+     :class:`.CacheStats`, which receives counts of hits, misses and
+     regenerations, and timings of creation functions, waits on the
+     dogpile lock and serialization, for this region.  Defaults to
+     ``None``, in which case nothing is measured.
+
+     .. versionadded:: 1.5.1
+
+    :param codec: The name of a :class:`.Codec` registered using
+     :func:`.register_codec`, such as ``"pickle"``, ``"json"`` or
+     ``"msgpack"``, or a :class:`.Codec` object, used to serialize values
+     in place of ``serializer`` and ``deserializer``.  The id of the codec
+     is stored in the metadata of each value, and values are deserialized
+     by the registered codec with that id, so that the codec of a region
+     may be changed without clearing the cache.  Values stored without a
+     codec are deserialized by the deserializer of the backend.  Defaults
+     to ``None``.
+
+     .. versionadded:: 1.5.1
+
     """
 
     def __init__(
@@ -405,6 +665,14 @@ class CacheRegion:
         serializer: Callable[[ValuePayload], bytes] | None = None,
         deserializer: Callable[[bytes], ValuePayload] | None = None,
         async_creation_runner: AsyncCreator | None = None,
+        binary_metadata: bool = False,
+        early_expiration_beta: float | None = None,
+        stale_on_error: float | None = None,
+        stale_on_error_retry: float = 1,
+        stale_on_error_max_retry: float = 60,
+        negative_expiration_time: float | None = None,
+        stats: StatsObserver | None = None,
+        codec: str | Codec | None = None,
     ):
         """Construct a new :class:`.CacheRegion`."""
         self.name = name
@@ -414,6 +682,19 @@ class CacheRegion:
         self.serializer = self._user_defined_serializer = serializer
         self.deserializer = self._user_defined_deserializer = deserializer
         self.async_creation_runner = async_creation_runner
+        self.binary_metadata = binary_metadata
+        self.early_expiration_beta = early_expiration_beta
+        self.stale_on_error = stale_on_error
+        self.stale_on_error_retry = stale_on_error_retry
+        self.stale_on_error_max_retry = stale_on_error_max_retry
+        self.negative_expiration_time = negative_expiration_time
+        self.stats = stats
+        if codec is not None and (serializer or deserializer):
+            raise exception.ValidationError(
+                "codec can't be combined with serializer or deserializer"
+            )
+        self.codec = get_codec(codec) if isinstance(codec, str) else codec
+        self._default_deserializer: Deserializer | None = None
         self.region_invalidator: RegionInvalidationStrategy = (
             DefaultInvalidationStrategy()
         )
@@ -496,6 +777,17 @@ class CacheRegion:
                 "Couldn't find cache plugin to load: %s" % backend
             )
 
+        if issubclass(backend_cls, AsyncCacheBackend):
+            if not self._async_backend:
+                raise exception.ValidationError(
+                    "Backend %s is an asyncio backend; use it with "
+                    "AsyncCacheRegion" % backend
+                )
+        elif self._async_backend:
+            raise exception.ValidationError(
+                "Backend %s is not an asyncio backend" % backend
+            )
+
         if _config_argument_dict:
             self.backend = backend_cls.from_config_dict(
                 _config_argument_dict, _config_prefix
@@ -523,6 +815,13 @@ class CacheRegion:
         if not self._user_defined_deserializer:
             self.deserializer = self.backend.deserializer
 
+        if self.codec is not None:
+            # values stored without a codec are read using the
+            # deserializer of the backend
+            self._default_deserializer = self.deserializer
+            self.serializer = self.codec.dumps
+            self.deserializer = self.codec.loads
+
         self._lock_registry = NameRegistry(self._create_mutex)
 
         if getattr(wrap, "__iter__", False):
@@ -553,6 +852,8 @@ class CacheRegion:
         self.backend = proxy_instance.wrap(self.backend)
 
     def _mutex(self, key):
+        if self.stats is not None:
+            return _TimedMutex(self._lock_registry.get(key), self)
         return self._lock_registry.get(key)
 
     class _LockWrapper(CacheMutex):
@@ -580,6 +881,9 @@ class CacheRegion:
     # cached value
     _actual_backend = None
 
+    # set by the region underlying an AsyncCacheRegion
+    _async_backend = False
+
     @property
     def actual_backend(self):
         """Return the ultimate backend underneath any proxies.
@@ -781,6 +1085,8 @@ class CacheRegion:
 
         """
         value = self._get_cache_value(key, expiration_time, ignore_expiration)
+        if self.stats is not None:
+            self._record_lookups([value])
         return value.payload
 
     def get_value_metadata(
@@ -822,7 +1128,7 @@ class CacheRegion:
         value = self._unexpired_value_fn(expiration_time, ignore_expiration)(
             value
         )
-        return value
+        return self._deserialized(value)
 
     def _unexpired_value_fn(
         self, expiration_time: float | None, ignore_expiration: bool
@@ -895,13 +1201,34 @@ class CacheRegion:
         _unexpired_value_fn = self._unexpired_value_fn(
             expiration_time, ignore_expiration
         )
+        if self.stats is not None:
+            values = [
+                self._deserialized(_unexpired_value_fn(value))
+                for value in backend_values
+            ]
+            self._record_lookups(values)
+            return [value.payload for value in values]
+
         return [
-            value.payload if value is not NO_VALUE else value
-            for value in (
-                _unexpired_value_fn(value) for value in backend_values
-            )
+            self._deserialized(_unexpired_value_fn(value)).payload
+            for value in backend_values
         ]
 
+    def _record_lookups(self, values: Sequence[CacheReturnType]) -> None:
+        hits = negative_hits = 0
+        for value in values:
+            if value is not NO_VALUE:
+                hits += 1
+                if value.metadata.get("nx"):
+                    negative_hits += 1
+
+        stats = cast(StatsObserver, self.stats)
+        namespace = _namespace.get()
+        if hits:
+            stats.record_hits(self.name, namespace, hits, negative_hits)
+        if hits < len(values):
+            stats.record_misses(self.name, namespace, len(values) - hits)
+
     @contextlib.contextmanager
     def _log_time(self, keys: Iterable[str]) -> Generator[None, None, None]:
         start_time = time.time()
@@ -943,6 +1270,9 @@ class CacheRegion:
         expiration_time: float | None = None,
         should_cache_fn: Callable[[ValuePayload], bool] | None = None,
         creator_args: tuple[Any, Mapping[str, Any]] | None = None,
+        stale_on_error: float | None = None,
+        negative_fn: Callable[[ValuePayload], bool] | None = None,
+        negative_expiration_time: float | None = None,
     ) -> ValuePayload:
         """Return a cached value based on the given key.
 
@@ -1014,6 +1344,36 @@ class CacheRegion:
 
          .. versionadded:: 0.4.3
 
+        :param stale_on_error: optional number of seconds past its
+         expiration time for which an expired value is returned when the
+         creation function raises an exception, which will override
+         :paramref:`.CacheRegion.stale_on_error` if not None.
+
+         .. versionadded:: 1.5.1
+
+        :param negative_fn: optional callable function which will receive
+         the value returned by the "creator", and will then return True if
+         the value is "negative", such as the result of looking up an entity
+         which doesn't exist.  Negative values are cached and returned as
+         any other value, however they are marked as negative in their
+         metadata, and expire after the negative expiration time rather
+         than the expiration time.  E.g.::
+
+            value = region.get_or_create(
+                "user %d" % user_id,
+                lambda: session.get(User, user_id),
+                negative_fn=lambda user: user is None,
+                negative_expiration_time=30,
+            )
+
+         .. versionadded:: 1.5.1
+
+        :param negative_expiration_time: optional expiration time of
+         negative values, which will override
+         :paramref:`.CacheRegion.negative_expiration_time` if not None.
+
+         .. versionadded:: 1.5.1
+
         .. seealso::
 
             :meth:`.CacheRegion.get`
@@ -1029,12 +1389,67 @@ class CacheRegion:
         if self.key_mangler:
             key = self.key_mangler(key)
 
+        if expiration_time is None:
+            expiration_time = self.expiration_time
+
+        if expiration_time == -1:
+            expiration_time = None
+
+        if negative_expiration_time is None:
+            negative_expiration_time = self.negative_expiration_time
+
+        # a fresh value is returned after a single read from the backend;
+        # the dogpile lock is set up only if the value is to be regenerated
+        value = self._get_from_backend(key)
+
+        # whether the value expires early is drawn once, here, and the
+        # same decision is used by get_value() below
+        early_expired: bool | None = (
+            expiration_time is not None
+            and value is not NO_VALUE
+            and self._is_early_expired(
+                value, value.metadata["ct"], expiration_time
+            )
+        )
+        fresh = (
+            NO_VALUE
+            if early_expired
+            else self._fresh_value(
+                value, expiration_time, negative_expiration_time
+            )
+        )
+        if fresh is not NO_VALUE:
+            if self.stats is not None:
+                self._record_lookups([fresh])
+            return fresh.payload
+        prefetched: CacheReturnType | None = value
+
+        # the payload of an expired value is deserialized only if the lock
+        # returns it, rather than generating a new value
+        deserialize_expired = False
+
+        if stale_on_error is None:
+            stale_on_error = self.stale_on_error
+
+        # the last value retrieved, returned if the creator fails
+        stale_value: CachedValue | None = None
+
+        # whether this call ran the creator, for statistics
+        created = False
+
         def get_value():
-            value = self._get_from_backend(key)
+            nonlocal stale_value, prefetched, early_expired
+
+            if prefetched is not None:
+                value, prefetched = prefetched, None
+            else:
+                value = self._get_from_backend(key)
+                early_expired = None
             if self._is_cache_miss(value, orig_key):
                 raise NeedRegenerationException()
 
-            ct = cast(CachedValue, value).metadata["ct"]
+            stale_value = cast(CachedValue, value)
+            ct = stale_value.metadata["ct"]
             if self.region_invalidator.is_soft_invalidated(ct):
                 if expiration_time is None:
                     raise exception.DogpileCacheException(
@@ -1042,18 +1457,91 @@ class CacheRegion:
                         "for soft invalidation"
                     )
                 ct = time.time() - expiration_time - 0.0001
+            elif (
+                expiration_time is not None
+                and stale_on_error is not None
+                and self._is_regeneration_deferred(
+                    value, ct, expiration_time, stale_on_error
+                )
+            ):
+                log.debug("Regeneration deferred for key: %r", orig_key)
+                ct = time.time()
+            elif (
+                negative_expiration_time is not None
+                and stale_value.metadata.get("nx")
+                and time.time() - ct > negative_expiration_time
+            ):
+                log.debug("Negative value expired for key: %r", orig_key)
+                if expiration_time is None:
+                    raise NeedRegenerationException()
+                ct = time.time() - expiration_time - 0.0001
+            elif expiration_time is not None and (
+                early_expired
+                if early_expired is not None
+                else self._is_early_expired(value, ct, expiration_time)
+            ):
+                log.debug("Early expiration for key: %r", orig_key)
+                ct = time.time() - expiration_time - 0.0001
+
+            if (
+                deserialize_expired
+                or expiration_time is None
+                or time.time() - ct <= expiration_time
+            ):
+                value = self._deserialized(value)
+                if value is NO_VALUE:
+                    raise NeedRegenerationException()
 
             return value.payload, ct
 
         def gen_value():
-            with self._log_time(orig_key):
-                if creator_args:
-                    created_value = creator(
-                        *creator_args[0], **creator_args[1]
+            nonlocal created
+
+            created = True
+            start_time = time.time()
+            try:
+                with self._log_time(orig_key):
+                    if creator_args:
+                        created_value = creator(
+                            *creator_args[0], **creator_args[1]
+                        )
+                    else:
+                        created_value = creator()
+            except Exception:
+                if self.stats is not None:
+                    self.stats.record_regeneration(
+                        self.name,
+                        _namespace.get(),
+                        time.time() - start_time,
+                        failed=True,
                     )
-                else:
-                    created_value = creator()
-            value = self._value(created_value)
+                if stale_on_error is None or stale_value is None:
+                    raise
+                stale = self._stale_value_on_error(
+                    key, stale_value, expiration_time, stale_on_error
+                )
+                if stale is None:
+                    raise
+                log.warning(
+                    "Error regenerating value for key %r; returning "
+                    "expired value",
+                    orig_key,
+                    exc_info=True,
+                )
+                return stale.payload, stale.metadata["ct"]
+
+            creation_duration = time.time() - start_time
+            if self.stats is not None:
+                self.stats.record_regeneration(
+                    self.name, _namespace.get(), creation_duration
+                )
+            value = self._value(
+                created_value,
+                self._gen_metadata(
+                    creation_duration,
+                    bool(negative_fn and negative_fn(created_value)),
+                ),
+            )
 
             if (
                 expiration_time is None
@@ -1069,12 +1557,6 @@ class CacheRegion:
 
             return value.payload, value.metadata["ct"]
 
-        if expiration_time is None:
-            expiration_time = self.expiration_time
-
-        if expiration_time == -1:
-            expiration_time = None
-
         async_creator: Callable[[CacheMutex], AsyncCreator] | None
         if self.async_creation_runner:
             acr = self.async_creation_runner
@@ -1094,14 +1576,33 @@ class CacheRegion:
         else:
             async_creator = None
 
-        with Lock(
-            self._mutex(key),
-            gen_value,
-            get_value,
-            expiration_time,
-            async_creator,
-        ) as value:
-            return value
+        while True:
+            with Lock(
+                self._mutex(key),
+                gen_value,
+                get_value,
+                expiration_time,
+                async_creator,
+            ) as value:
+                if type(value) is not _SerializedPayload:
+                    break
+
+            # an expired value is being returned while a new one is
+            # generated elsewhere
+            assert self.deserializer
+            try:
+                value = self._loads(value)
+                break
+            except CantDeserializeException:
+                # wait for the new value instead
+                deserialize_expired = True
+
+        if self.stats is not None:
+            if created:
+                self.stats.record_misses(self.name, _namespace.get(), 1)
+            else:
+                self._record_lookups([cast(CachedValue, stale_value)])
+        return value
 
     def get_or_create_multi(
         self,
@@ -1158,12 +1659,7 @@ class CacheRegion:
         def get_value(key):
             value = values.get(key, NO_VALUE)
 
-            if self._is_cache_miss(value, orig_key):
-                # dogpile.core understands a 0 here as
-                # "the value is not available", e.g.
-                # _has_value() will return False.
-                return value.payload, 0
-            else:
+            if not self._is_cache_miss(value, orig_key):
                 ct = cast(CachedValue, value).metadata["ct"]
                 if self.region_invalidator.is_soft_invalidated(ct):
                     if expiration_time is None:
@@ -1172,8 +1668,24 @@ class CacheRegion:
                             "for soft invalidation"
                         )
                     ct = time.time() - expiration_time - 0.0001
+                elif expiration_time is not None and self._is_early_expired(
+                    value, ct, expiration_time
+                ):
+                    log.debug("Early expiration for key: %r", orig_key)
+                    ct = time.time() - expiration_time - 0.0001
 
-                return value.payload, ct
+                if (
+                    expiration_time is None
+                    or time.time() - ct <= expiration_time
+                ):
+                    value = values[key] = self._deserialized(value)
+                if value is not NO_VALUE:
+                    return value.payload, ct
+
+            # dogpile.core understands a 0 here as
+            # "the value is not available", e.g.
+            # _has_value() will return False.
+            return value.payload, 0
 
         def gen_value() -> ValuePayload:
             raise NotImplementedError()
@@ -1219,11 +1731,28 @@ class CacheRegion:
                 # though haven't been able to simulate one anyway.
                 keys_to_get = sorted(mutexes)
 
-                with self._log_time(keys_to_get):
-                    new_values = creator(*keys_to_get)
+                start_time = time.time()
+                try:
+                    with self._log_time(keys_to_get):
+                        new_values = creator(*keys_to_get)
+                except Exception:
+                    if self.stats is not None:
+                        self.stats.record_regeneration(
+                            self.name,
+                            _namespace.get(),
+                            time.time() - start_time,
+                            failed=True,
+                        )
+                    raise
+                creation_duration = time.time() - start_time
+                if self.stats is not None:
+                    self.stats.record_regeneration(
+                        self.name, _namespace.get(), creation_duration
+                    )
+                metadata = self._gen_metadata(creation_duration)
 
                 values_w_created = {
-                    orig_to_mangled[k]: self._value(v)
+                    orig_to_mangled[k]: self._value(v, metadata)
                     for k, v in zip(keys_to_get, new_values)
                 }
 
@@ -1249,11 +1778,42 @@ class CacheRegion:
                     )
 
                 values.update(values_w_created)
-            return [values[orig_to_mangled[k]].payload for k in keys]
+            result = []
+            # positions of expired values, returned while a new value is
+            # generated elsewhere, which couldn't be deserialized
+            undeserialized = []
+            for index, k in enumerate(keys):
+                value = self._deserialized(values[orig_to_mangled[k]])
+                if value is NO_VALUE:
+                    undeserialized.append((index, k))
+                result.append(value.payload)
+            if self.stats is not None:
+                self._record_lookups(
+                    [
+                        values[mangled_key]
+                        for orig_key, mangled_key in orig_to_mangled.items()
+                        if orig_key not in mutexes
+                    ]
+                )
+                if mutexes:
+                    self.stats.record_misses(
+                        self.name, _namespace.get(), len(mutexes)
+                    )
         finally:
             for mutex in mutexes.values():
                 mutex.release()
 
+        # wait for the new values of those which couldn't be deserialized
+        multi_creator = cast(Callable[..., Sequence[ValuePayload]], creator)
+        for index, k in undeserialized:
+            result[index] = self.get_or_create(
+                k,
+                lambda k=k: multi_creator(k)[0],
+                -1 if expiration_time is None else expiration_time,
+                should_cache_fn,
+            )
+        return result
+
     def _value(
         self, value: Any, metadata: MetaDataType | None = None
     ) -> CachedValue:
@@ -1266,26 +1826,124 @@ class CacheRegion:
     def _parse_serialized_from_backend(
         self, value: SerializedReturnType
     ) -> CacheReturnType:
+        return self._deserialized(self._parse_serialized_metadata(value))
+
+    def _parse_serialized_metadata(
+        self, value: SerializedReturnType
+    ) -> CacheReturnType:
+        """Parse the metadata of a serialized value, returning a
+        :class:`.CachedValue` with a payload that's deserialized by
+        :meth:`._deserialized`."""
+
         if value in (None, NO_VALUE):
             return NO_VALUE
 
-        assert self.deserializer
         byte_value = cast(bytes, value)
+        if self.stats is not None:
+            self.stats.record_read(
+                self.name, _namespace.get(), len(byte_value)
+            )
 
-        bytes_metadata, _, bytes_payload = byte_value.partition(b"|")
-        metadata = json.loads(bytes_metadata)
+        metadata: MetaDataType
+        if byte_value[0] == _BINARY_MAGIC:
+            try:
+                metadata, offset = _unpack_binary_metadata(byte_value)
+            except CantDeserializeException:
+                # written by a version using another header format
+                return NO_VALUE
+            bytes_payload = byte_value[offset:]
+        else:
+            bytes_metadata, _, bytes_payload = byte_value.partition(b"|")
+            metadata = json.loads(bytes_metadata)
+        return CachedValue(
+            _SerializedPayload(bytes_payload, metadata.get("c")), metadata
+        )
+
+    def _loads(self, payload: _SerializedPayload) -> ValuePayload:
+        """Deserialize the payload of a value read from the backend, using
+        the codec which serialized it, if any."""
+
+        if payload.codec is None:
+            if self.codec is None:
+                return cast(Deserializer, self.deserializer)(payload.data)
+            if self._default_deserializer is None:
+                raise CantDeserializeException()
+            return self._default_deserializer(payload.data)
+        if self.codec is not None and payload.codec == self.codec.id:
+            return cast(Deserializer, self.deserializer)(payload.data)
         try:
-            payload = self.deserializer(bytes_payload)
+            codec = get_codec(payload.codec)
+        except KeyError as err:
+            raise CantDeserializeException() from err
+        return codec.loads(payload.data)
+
+    def _deserialized(self, value: CacheReturnType) -> CacheReturnType:
+        """Deserialize the payload of a value returned by
+        :meth:`._get_from_backend`, returning ``NO_VALUE`` if it can't be
+        deserialized."""
+
+        if value is NO_VALUE:
+            return value
+        payload = value.payload
+        if type(payload) is not _SerializedPayload:
+            return value
+
+        assert self.deserializer
+        if self.stats is not None:
+            start_time = time.perf_counter()
+        try:
+            deserialized = CachedValue(self._loads(payload), value.metadata)
         except CantDeserializeException:
             return NO_VALUE
-        else:
-            return CachedValue(payload, metadata)
+        if self.stats is not None:
+            self.stats.record_deserialization(
+                self.name, _namespace.get(), time.perf_counter() - start_time
+            )
+        return deserialized
 
     def _serialize_cached_value_elements(
         self, payload: ValuePayload, metadata: MetaDataType
+    ) -> bytes:
+        if self.stats is None:
+            return self._serialize_elements(payload, metadata)
+
+        start_time = time.perf_counter()
+        serialized = self._serialize_elements(payload, metadata)
+        self.stats.record_serialization(
+            self.name,
+            _namespace.get(),
+            time.perf_counter() - start_time,
+            len(serialized),
+        )
+        return serialized
+
+    def _serialize_elements(
+        self, payload: ValuePayload, metadata: MetaDataType
     ) -> bytes:
         serializer = cast(Serializer, self.serializer)
 
+        if self.codec is not None and metadata.get("c") != self.codec.id:
+            # the metadata of a value read back from the cache, such as
+            # one written back by stale_on_error, may name another codec
+            metadata = CachedMetadata(
+                metadata["ct"],
+                metadata["v"],
+                {
+                    **{
+                        k: v
+                        for k, v in metadata.items()
+                        if k not in ("ct", "v")
+                    },
+                    "c": self.codec.id,
+                },
+            )
+
+        if self.binary_metadata:
+            return _pack_binary_metadata(metadata) + serializer(payload)
+
+        if isinstance(metadata, CachedMetadata):
+            metadata = metadata.as_dict()
+
         return b"%b|%b" % (
             json.dumps(metadata).encode("ascii"),
             serializer(payload),
@@ -1320,8 +1978,10 @@ class CacheRegion:
         )
 
     def _get_from_backend(self, key: KeyType) -> CacheReturnType:
+        # payloads of values returned from here are deserialized by
+        # self._deserialized()
         if self.deserializer:
-            return self._parse_serialized_from_backend(
+            return self._parse_serialized_metadata(
                 self.backend.get_serialized(key)
             )
         else:
@@ -1332,7 +1992,7 @@ class CacheRegion:
     ) -> Sequence[CacheReturnType]:
         if self.deserializer:
             return [
-                self._parse_serialized_from_backend(v)
+                self._parse_serialized_metadata(v)
                 for v in self.backend.get_serialized_multi(keys)
             ]
         else:
@@ -1366,8 +2026,128 @@ class CacheRegion:
         else:
             self.backend.set_multi(mapping)
 
-    def _gen_metadata(self) -> MetaDataType:
-        return {"ct": time.time(), "v": value_version}
+    def _gen_metadata(
+        self, creation_duration: float | None = None, negative: bool = False
+    ) -> MetaDataType:
+        extra: dict[str, Any] = {}
+        if creation_duration is not None and self.early_expiration_beta:
+            extra["d"] = creation_duration
+        if negative:
+            extra["nx"] = 1
+        if self.codec is not None:
+            extra["c"] = self.codec.id
+        return CachedMetadata(time.time(), value_version, extra)
+
+    def _fresh_value(
+        self,
+        value: CacheReturnType,
+        expiration_time: float | None,
+        negative_expiration_time: float | None,
+    ) -> CacheReturnType:
+        """Return a value read by :meth:`.CacheRegion.get_or_create`,
+        deserialized, if it can be returned without involving the dogpile
+        lock, else ``NO_VALUE``.  Early expiration is checked by the
+        caller."""
+
+        if value is NO_VALUE:
+            return NO_VALUE
+        metadata = value.metadata
+        ct = metadata["ct"]
+        if metadata["v"] != value_version:
+            return NO_VALUE
+        if self.region_invalidator.is_invalidated(ct):
+            return NO_VALUE
+        if expiration_time is not None and time.time() - ct > expiration_time:
+            return NO_VALUE
+        if (
+            negative_expiration_time is not None
+            and metadata.get("nx")
+            and time.time() - ct > negative_expiration_time
+        ):
+            return NO_VALUE
+        return self._deserialized(value)
+
+    def _is_early_expired(
+        self, value: CacheReturnType, ct: float, expiration_time: float
+    ) -> bool:
+        """Return True if an unexpired value is to be regenerated early,
+        using the XFetch algorithm."""
+
+        if not self.early_expiration_beta:
+            return False
+        duration: float | None = cast(CachedValue, value).metadata.get("d")
+        if not duration:
+            return False
+
+        # -log(u) for u in (0, 1] is exponentially distributed, so that the
+        # probability of early expiration increases towards the expiration
+        # time, and with the time taken to create the value
+        return (
+            time.time()
+            - duration
+            * self.early_expiration_beta
+            * math.log(1.0 - random.random())
+            >= ct + expiration_time
+        )
+
+    def _is_regeneration_deferred(
+        self,
+        value: CacheReturnType,
+        ct: float,
+        expiration_time: float,
+        stale_on_error: float,
+    ) -> bool:
+        """Return True if a failed regeneration of a value is not to be
+        retried yet, so that the expired value is returned."""
+
+        retry_time = cast(CachedValue, value).metadata.get("rt")
+        if retry_time is None:
+            return False
+        now = time.time()
+        return bool(
+            now < retry_time and now - ct - expiration_time <= stale_on_error
+        )
+
+    def _stale_value_on_error(
+        self,
+        key: KeyType,
+        value: CachedValue,
+        expiration_time: float | None,
+        stale_on_error: float,
+    ) -> CachedValue | None:
+        """Given the value which failed to be regenerated, return it if
+        it's not too old to be returned in place of the new value, after
+        writing it back to the backend with the time at which to retry.
+
+        """
+        metadata = value.metadata
+        now = time.time()
+        if (
+            expiration_time is None
+            or now - metadata["ct"] - expiration_time > stale_on_error
+        ):
+            return None
+
+        deserialized = self._deserialized(value)
+        if deserialized is NO_VALUE:
+            return None
+        value = deserialized
+
+        failures = metadata.get("rf", 0) + 1
+        retry_interval = min(
+            self.stale_on_error_retry * 2 ** (failures - 1),
+            self.stale_on_error_max_retry,
+        )
+        extra = {k: v for k, v in metadata.items() if k not in ("ct", "v")}
+        extra.update(rf=failures, rt=now + retry_interval)
+        self._set_cached_value_to_backend(
+            key,
+            CachedValue(
+                value.payload,
+                CachedMetadata(metadata["ct"], metadata["v"], extra),
+            ),
+        )
+        return value
 
     def set(self, key: KeyType, value: ValuePayload) -> None:
         """Place a new value in the cache under the given key."""
@@ -1449,6 +2229,9 @@ class CacheRegion:
         should_cache_fn: Callable[[ValuePayload], bool] | None = None,
         to_str: Callable[[Any], str] = str,
         function_key_generator: FunctionKeyGenerator | None = None,
+        stale_on_error: float | None = None,
+        negative_fn: Callable[[ValuePayload], bool] | None = None,
+        negative_expiration_time: float | None = None,
     ) -> Callable[[Callable[..., ValuePayload]], Callable[..., ValuePayload]]:
         """A function decorator that will cache the return
         value of the function using a key derived from the
@@ -1612,6 +2395,19 @@ class CacheRegion:
          "cache key". This function will supersede the one configured on the
          :class:`.CacheRegion` itself.
 
+        :param stale_on_error: passed to :meth:`.CacheRegion.get_or_create`.
+
+         .. versionadded:: 1.5.1
+
+        :param negative_fn: passed to :meth:`.CacheRegion.get_or_create`.
+
+         .. versionadded:: 1.5.1
+
+        :param negative_expiration_time: passed to
+         :meth:`.CacheRegion.get_or_create`.
+
+         .. versionadded:: 1.5.1
+
         .. seealso::
 
             :meth:`.CacheRegion.cache_multi_on_arguments`
@@ -1634,9 +2430,25 @@ class CacheRegion:
                 if expiration_time_is_callable
                 else cast(float | None, expiration_time)
             )
-            return self.get_or_create(
-                key, user_func, timeout, should_cache_fn, (arg, kw)
+            token = (
+                _namespace.set(_stats_namespace(namespace, user_func))
+                if self.stats is not None
+                else None
             )
+            try:
+                return self.get_or_create(
+                    key,
+                    user_func,
+                    timeout,
+                    should_cache_fn,
+                    (arg, kw),
+                    stale_on_error,
+                    negative_fn,
+                    negative_expiration_time,
+                )
+            finally:
+                if token is not None:
+                    _namespace.reset(token)
 
         def cache_decorator(user_func):
             if to_str is cast(Callable[[Any], str], str):
@@ -1839,34 +2651,43 @@ class CacheRegion:
 
             result: Sequence[ValuePayload] | Mapping[KeyType, ValuePayload]
 
-            if asdict:
-
-                def dict_create(*keys):
-                    d_values = creator(*keys)
-                    return [
-                        d_values.get(key_lookup[k], NO_VALUE) for k in keys
-                    ]
-
-                def wrap_cache_fn(value):
-                    if value is NO_VALUE:
-                        return False
-                    elif not should_cache_fn:
-                        return True
-                    else:
-                        return should_cache_fn(value)
+            token = (
+                _namespace.set(_stats_namespace(namespace, user_func))
+                if self.stats is not None
+                else None
+            )
+            try:
+                if asdict:
 
-                result = self.get_or_create_multi(
-                    keys, dict_create, timeout, wrap_cache_fn
-                )
-                result = dict(
-                    (k, v)
-                    for k, v in zip(cache_keys, result)
-                    if v is not NO_VALUE
-                )
-            else:
-                result = self.get_or_create_multi(
-                    keys, creator, timeout, should_cache_fn
-                )
+                    def dict_create(*keys):
+                        d_values = creator(*keys)
+                        return [
+                            d_values.get(key_lookup[k], NO_VALUE) for k in keys
+                        ]
+
+                    def wrap_cache_fn(value):
+                        if value is NO_VALUE:
+                            return False
+                        elif not should_cache_fn:
+                            return True
+                        else:
+                            return should_cache_fn(value)
+
+                    result = self.get_or_create_multi(
+                        keys, dict_create, timeout, wrap_cache_fn
+                    )
+                    result = dict(
+                        (k, v)
+                        for k, v in zip(cache_keys, result)
+                        if v is not NO_VALUE
+                    )
+                else:
+                    result = self.get_or_create_multi(
+                        keys, creator, timeout, should_cache_fn
+                    )
+            finally:
+                if token is not None:
+                    _namespace.reset(token)
 
             return result
 
@@ -0,0 +1,197 @@
+"""
+Creation Runners
+----------------
+
+Implementations of the ``async_creation_runner`` hook of
+:class:`.CacheRegion`, which regenerate expired values in the background
+while the expired value is returned.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+from typing import Callable
+from typing import TYPE_CHECKING
+
+from .api import CacheMutex
+from .api import KeyType
+from .api import ValuePayload
+
+if TYPE_CHECKING:
+    from .region import CacheRegion
+
+__all__ = ["ThreadPoolCreationRunner"]
+
+log = logging.getLogger(__name__)
+
+
+class ThreadPoolCreationRunner:
+    """An ``async_creation_runner`` which regenerates values using a
+    bounded pool of threads.
+
+    E.g.::
+
+        from dogpile.cache import make_region
+        from dogpile.cache.runners import ThreadPoolCreationRunner
+
+        region = make_region(
+            async_creation_runner=ThreadPoolCreationRunner(
+                max_workers=4, max_queue=100
+            )
+        ).configure(
+            'dogpile.cache.memcached',
+            expiration_time=5,
+            arguments={
+                'url': '127.0.0.1:11211',
+                'distributed_lock': True,
+            }
+        )
+
+    Each regeneration runs the creation function and places the new value
+    in the region using :meth:`.CacheRegion.set`, releasing the dogpile
+    mutex afterwards whether or not the creation function succeeded; an
+    exception raised by the creation function is logged.  A regeneration
+    for a key which is already queued or running in the same region isn't
+    queued again.
+
+    When ``max_queue`` regenerations are already waiting for a thread, the
+    pool is saturated, and the ``on_saturated`` argument determines what
+    happens to further regenerations:
+
+    * ``"stale"`` - the default; the regeneration is skipped and the
+      mutex released, so that the expired value continues to be returned
+      and a later request for the key regenerates it.
+
+    * ``"sync"`` - the regeneration runs in the calling thread, before the
+      expired value is returned to it.  This only provides back-pressure,
+      slowing down the callers which would otherwise add to the backlog;
+      as with any ``async_creation_runner``, the caller still receives
+      the expired value, and the new value is returned to later requests.
+
+    The :attr:`.ThreadPoolCreationRunner.queue_length` and
+    :attr:`.ThreadPoolCreationRunner.in_flight` attributes report the
+    backlog of regenerations.
+
+    :param max_workers: maximum number of threads.  Defaults to 4.
+
+    :param max_queue: maximum number of regenerations waiting for a
+     thread.  Defaults to 100.
+
+    :param on_saturated: ``"stale"`` or ``"sync"``, as above.
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 100,
+        on_saturated: str = "stale",
+    ):
+        if on_saturated not in ("stale", "sync"):
+            raise ValueError(
+                "on_saturated must be one of 'stale' or 'sync'; got %r"
+                % (on_saturated,)
+            )
+        self.max_queue = max_queue
+        self.on_saturated = on_saturated
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dogpile-creation"
+        )
+        self._lock = threading.Lock()
+        self._pending: set[tuple[int, KeyType]] = set()
+        self.queue_length = 0
+        """Number of regenerations waiting for a thread."""
+
+        self.in_flight = 0
+        """Number of regenerations currently running."""
+
+    def __call__(
+        self,
+        cache: CacheRegion,
+        key: KeyType,
+        creator: Callable[[], ValuePayload],
+        mutex: CacheMutex,
+    ) -> None:
+        ident = (id(cache), key)
+        with self._lock:
+            if ident in self._pending:
+                action = "pending"
+            elif self.queue_length >= self.max_queue:
+                action = self.on_saturated
+            else:
+                action = "queue"
+                self._pending.add(ident)
+                self.queue_length += 1
+
+        if action == "queue":
+            try:
+                self._executor.submit(
+                    self._run_queued, ident, cache, key, creator, mutex
+                )
+            except BaseException:
+                # the lock releases the mutex when the runner raises
+                with self._lock:
+                    self._pending.discard(ident)
+                    self.queue_length -= 1
+                raise
+        elif action == "sync":
+            log.debug("Creation runner saturated, regenerating key %r", key)
+            self._run(cache, key, creator, mutex)
+        elif action == "stale":
+            log.debug("Creation runner saturated, skipping key %r", key)
+            mutex.release()
+        else:
+            log.debug("Regeneration already queued for key %r", key)
+            mutex.release()
+
+    def _run_queued(
+        self,
+        ident: tuple[int, KeyType],
+        cache: CacheRegion,
+        key: KeyType,
+        creator: Callable[[], ValuePayload],
+        mutex: CacheMutex,
+    ) -> None:
+        with self._lock:
+            self.queue_length -= 1
+            self.in_flight += 1
+        try:
+            self._run(cache, key, creator, mutex)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self._pending.discard(ident)
+
+    def _run(
+        self,
+        cache: CacheRegion,
+        key: KeyType,
+        creator: Callable[[], ValuePayload],
+        mutex: CacheMutex,
+    ) -> None:
+        try:
+            cache.set(key, creator())
+        except Exception:
+            log.exception("Error regenerating value for key %r", key)
+        finally:
+            mutex.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool of threads.
+
+        :param wait: if True, wait for queued regenerations to complete.
+
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __repr__(self) -> str:
+        return "<%s queue_length=%d in_flight=%d>" % (
+            self.__class__.__name__,
+            self.queue_length,
+            self.in_flight,
+        )
@@ -0,0 +1,401 @@
+"""
+Serializers
+-----------
+
+Serializer and deserializer functions which may be passed to
+:class:`.CacheRegion` as alternatives to the default of ``pickle.dumps``
+and ``pickle.loads``, and the named :class:`.Codec` objects which may be
+selected using :paramref:`.CacheRegion.codec`.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Callable
+from collections.abc import Sequence
+import dataclasses
+import json
+import marshal
+import operator
+import pickle
+import struct
+from typing import Any
+
+from .api import CantDeserializeException
+
+__all__ = [
+    "pickle_buffers",
+    "dumps_out_of_band",
+    "loads_out_of_band",
+    "Codec",
+    "PickleCodec",
+    "JSONCodec",
+    "MsgpackCodec",
+    "StructCodec",
+    "register_codec",
+    "get_codec",
+]
+
+_MAGIC = b"DPB5"
+
+# magic, number of buffers, length of the pickle stream
+_HEADER = struct.Struct("<4sIQ")
+_LENGTH = struct.Struct("<Q")
+
+
+def pickle_buffers(value: Any) -> tuple[bytes, list[memoryview]]:
+    """Pickle a value using pickle protocol 5, returning the pickle stream
+    separately from the out-of-band buffers of the value.
+
+    Objects supporting out-of-band buffers, such as NumPy arrays, contribute
+    their contiguous memory as a buffer rather than being copied into the
+    pickle stream.  The buffers returned refer to the
+    memory of the original value, and are restored using
+    ``pickle.loads(data, buffers=buffers)``.
+
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    return data, [buffer.raw() for buffer in buffers]
+
+
+def dumps_out_of_band(value: Any) -> bytes:
+    """Serialize a value to bytes using pickle protocol 5 out-of-band
+    buffers.
+
+    The buffers of the value are appended to the pickle stream in a single
+    join, rather than being copied into the stream as it is written.  Use
+    with :func:`.loads_out_of_band`::
+
+        from dogpile.cache import make_region
+        from dogpile.cache import serializers
+
+        region = make_region(
+            serializer=serializers.dumps_out_of_band,
+            deserializer=serializers.loads_out_of_band,
+        ).configure("dogpile.cache.redis")
+
+    """
+    data, buffers = pickle_buffers(value)
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, len(buffers), len(data)),
+            *(_LENGTH.pack(buffer.nbytes) for buffer in buffers),
+            data,
+            *buffers,
+        ]
+    )
+
+
+def loads_out_of_band(data: bytes) -> Any:
+    """Deserialize a value serialized by :func:`.dumps_out_of_band`.
+
+    Out-of-band buffers are passed to ``pickle.loads()`` as slices of
+    ``data`` without being copied; objects which can refer to the buffer
+    given, such as NumPy arrays, do so, and are therefore read-only.
+
+    Raises :class:`.CantDeserializeException` if ``data`` was not produced
+    by :func:`.dumps_out_of_band`.
+
+    """
+    view = memoryview(data)
+    try:
+        magic, count, length = _HEADER.unpack_from(view)
+    except struct.error as err:
+        raise CantDeserializeException() from err
+    if magic != _MAGIC:
+        raise CantDeserializeException()
+
+    position = _HEADER.size
+    lengths = [
+        _LENGTH.unpack_from(view, position + index * _LENGTH.size)[0]
+        for index in range(count)
+    ]
+    position += count * _LENGTH.size
+    stream = view[position : position + length]
+    position += length
+
+    buffers = []
+    for buffer_length in lengths:
+        buffers.append(view[position : position + buffer_length])
+        position += buffer_length
+    return pickle.loads(stream, buffers=buffers)
+
+
+class Codec(abc.ABC):
+    """A named serializer and deserializer pair, which may be selected for
+    a region using :paramref:`.CacheRegion.codec`.
+
+    Each codec has a :attr:`.Codec.id` which the region stores in the
+    metadata of each value, so that values are deserialized by the codec
+    that serialized them.  Codecs are made available by name and id using
+    :func:`.register_codec`; ids 1 through 15 are reserved for the codecs
+    included with dogpile.cache, and custom codecs should use an id from
+    16 to 255.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    name: str
+    """Name of the codec, as given to :paramref:`.CacheRegion.codec`."""
+
+    id: int
+    """Identifies values serialized by the codec; an integer from 1 to
+    255."""
+
+    @abc.abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value to bytes."""
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize a value returned by :meth:`.Codec.dumps`.
+
+        May raise :class:`.CantDeserializeException` if the value can't be
+        deserialized, in which case the region regenerates it.
+
+        """
+
+        raise NotImplementedError()
+
+
+class PickleCodec(Codec):
+    """Serializes values using :mod:`pickle`, as do regions with no
+    codec.
+
+    :param protocol: the pickle protocol used to serialize values.  Values
+     pickled with any protocol are deserialized.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    name = "pickle"
+    id = 1
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL):
+        self.protocol = protocol
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, self.protocol)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class JSONCodec(Codec):
+    """Serializes values as JSON, using `orjson
+    <https://pypi.org/project/orjson/>`_ if it is installed, or the
+    :mod:`json` module otherwise.
+
+    Only values made of dictionaries, lists, strings, numbers, booleans and
+    ``None`` may be serialized, and tuples are deserialized as lists.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    name = "json"
+    id = 2
+
+    def __init__(self) -> None:
+        self._dumps: Callable[[Any], bytes]
+        self._loads: Callable[[bytes], Any]
+        try:
+            import orjson
+        except ImportError:
+            self._dumps = self._json_dumps
+            self._loads = json.loads
+        else:
+            self._dumps = orjson.dumps
+            self._loads = orjson.loads
+
+    def _json_dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def dumps(self, value: Any) -> bytes:
+        return self._dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgpackCodec(Codec):
+    """Serializes values using `msgpack
+    <https://pypi.org/project/msgpack/>`_, which must be installed to use
+    the codec.
+
+    Only values made of dictionaries, lists, strings, bytes, numbers,
+    booleans and ``None`` may be serialized, and tuples are deserialized
+    as lists.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    name = "msgpack"
+    id = 3
+
+    def __init__(self) -> None:
+        self._msgpack: Any = None
+
+    def _imports(self) -> Any:
+        if self._msgpack is None:
+            import msgpack
+
+            self._msgpack = msgpack
+        return self._msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        data: bytes = self._imports().packb(value, use_bin_type=True)
+        return data
+
+    def loads(self, data: bytes) -> Any:
+        return self._imports().unpackb(data, raw=False)
+
+
+class StructCodec(Codec):
+    """Serializes instances of dataclasses and named tuples, or lists of
+    them, as tuples of their field values using :mod:`marshal`, which is
+    considerably faster than pickle for such values.
+
+    The classes to be serialized are given up front, and are recorded in
+    each value by their qualified name::
+
+        from dogpile.cache import serializers
+
+        serializers.register_codec(serializers.StructCodec([User, Address]))
+
+        region = make_region(codec="struct").configure(
+            "dogpile.cache.redis"
+        )
+
+    Fields must hold values supported by :mod:`marshal`, such as strings,
+    numbers, bytes, ``None`` and tuples, lists, sets and dictionaries of
+    these; dataclasses are constructed from their fields positionally.
+    Other values, such as a plain dictionary, are serialized using
+    :mod:`marshal` directly, or :mod:`pickle` if :mod:`marshal` doesn't
+    support them.  The :mod:`marshal` format may change between
+    Python versions, in which case values are regenerated.
+
+    :param types: dataclasses and named tuple classes to be serialized.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    name = "struct"
+    id = 4
+
+    def __init__(self, types: Sequence[type]):
+        self.types = {self._type_name(type_): type_ for type_ in types}
+        self._names = {type_: name for name, type_ in self.types.items()}
+        self._getters = {type_: self._getter(type_) for type_ in types}
+
+    @staticmethod
+    def _type_name(type_: type) -> str:
+        return "%s.%s" % (type_.__module__, type_.__qualname__)
+
+    @staticmethod
+    def _getter(type_: Any) -> Callable[[Any], tuple[Any, ...]]:
+        if issubclass(type_, tuple):
+            return tuple
+        names = [field.name for field in dataclasses.fields(type_)]
+        if len(names) == 1:
+            getter = operator.attrgetter(names[0])
+            return lambda value: (getter(value),)
+        return operator.attrgetter(*names)
+
+    def _encode(self, value: Any) -> tuple[Any, ...]:
+        name = self._names.get(type(value))
+        if name is not None:
+            return (1, name, self._getters[type(value)](value))
+        if (
+            type(value) is list
+            and value
+            and type(value[0]) in self._names
+            and all(type(element) is type(value[0]) for element in value)
+        ):
+            getter = self._getters[type(value[0])]
+            return (
+                2,
+                self._names[type(value[0])],
+                [getter(element) for element in value],
+            )
+        return (0, value)
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return marshal.dumps(self._encode(value))
+        except ValueError:
+            return marshal.dumps(
+                (3, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            )
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            kind, *rest = marshal.loads(data)
+            if kind == 0:
+                return rest[0]
+            elif kind == 3:
+                return pickle.loads(rest[0])
+            name, fields = rest
+            type_ = self.types[name]
+        except (EOFError, ValueError, TypeError, KeyError) as err:
+            raise CantDeserializeException() from err
+        if kind == 1:
+            return type_(*fields)
+        return [type_(*element) for element in fields]
+
+
+_codecs_by_name: dict[str, Codec] = {}
+_codecs_by_id: dict[int, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """Make a :class:`.Codec` available by its name and id.
+
+    A codec replaces any codec previously registered with the same name
+    and id.  The pickle, json and msgpack codecs are registered by
+    default.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    existing = _codecs_by_id.get(codec.id)
+    if existing is not None and existing.name != codec.name:
+        raise ValueError(
+            "Codec id %d is already used by codec %r"
+            % (codec.id, existing.name)
+        )
+    previous = _codecs_by_name.get(codec.name)
+    if previous is not None and previous.id != codec.id:
+        del _codecs_by_id[previous.id]
+    _codecs_by_name[codec.name] = codec
+    _codecs_by_id[codec.id] = codec
+
+
+def get_codec(name_or_id: str | int) -> Codec:
+    """Return a registered :class:`.Codec` given its name or id.
+
+    Raises ``KeyError`` if there's no such codec.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    if isinstance(name_or_id, int):
+        return _codecs_by_id[name_or_id]
+    return _codecs_by_name[name_or_id]
+
+
+register_codec(PickleCodec())
+register_codec(JSONCodec())
+register_codec(MsgpackCodec())
@@ -0,0 +1,440 @@
+"""
+Statistics
+----------
+
+Provides the :class:`.StatsObserver` interface, through which a
+:class:`.CacheRegion` reports hits, misses, regenerations and timings,
+along with :class:`.CacheStats`, which accumulates counters and latency
+histograms, and exporters for Prometheus and OpenTelemetry.
+
+E.g.::
+
+    from dogpile.cache import make_region
+    from dogpile.cache.stats import CacheStats
+
+    stats = CacheStats()
+
+    region = make_region("users", stats=stats).configure(
+        "dogpile.cache.redis", expiration_time=3600
+    )
+
+    # ...
+
+    print(stats.prometheus_text())
+
+Measurements are broken down by the name of the region, and for values
+retrieved using :meth:`.CacheRegion.cache_on_arguments` or
+:meth:`.CacheRegion.cache_multi_on_arguments`, by the namespace of the
+decorated function, which is the same prefix used by
+:func:`.function_key_generator` for its keys, e.g.
+``"myapp.users:get_user"``.
+
+.. versionadded:: 1.5.1
+
+"""
+
+from __future__ import annotations
+
+import bisect
+from contextvars import ContextVar
+import threading
+from typing import Any
+
+__all__ = [
+    "StatsObserver",
+    "CacheStats",
+    "Histogram",
+    "OpenTelemetryObserver",
+]
+
+_namespace: ContextVar[str | None] = ContextVar(
+    "dogpile.cache.stats namespace", default=None
+)
+"""Namespace of the decorated function being called, set by the cache
+decorators of a region which has a :class:`.StatsObserver`."""
+
+
+class StatsObserver:
+    """Receives measurements from a :class:`.CacheRegion`.
+
+    An instance is passed to the region using the
+    :paramref:`.CacheRegion.stats` parameter.  The methods here do
+    nothing; subclasses override those for the measurements they're
+    interested in.  Methods are called in the thread performing the cache
+    operation, so should return quickly.
+
+    Each method receives the name of the region, which is ``None`` for
+    an unnamed region, and the namespace of the decorated function, which
+    is ``None`` when the region is used directly.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def record_hits(
+        self,
+        region: str | None,
+        namespace: str | None,
+        hits: int,
+        negative_hits: int = 0,
+    ) -> None:
+        """Record values returned from the cache.
+
+        ``negative_hits`` is the number of those values which were
+        cached as negative values, as identified by the
+        :paramref:`.CacheRegion.get_or_create.negative_fn` parameter.
+
+        """
+
+    def record_misses(
+        self, region: str | None, namespace: str | None, misses: int
+    ) -> None:
+        """Record values which weren't present in the cache, or had
+        expired, and were either created or not returned."""
+
+    def record_regeneration(
+        self,
+        region: str | None,
+        namespace: str | None,
+        seconds: float,
+        failed: bool = False,
+    ) -> None:
+        """Record a call to a creation function, and the time it took."""
+
+    def record_mutex_wait(
+        self, region: str | None, namespace: str | None, seconds: float
+    ) -> None:
+        """Record time spent waiting on the dogpile lock of a key, while
+        another thread or process created its value."""
+
+    def record_serialization(
+        self,
+        region: str | None,
+        namespace: str | None,
+        seconds: float,
+        size: int,
+    ) -> None:
+        """Record the serialization of a value to be written to the
+        backend, and its size in bytes including metadata."""
+
+    def record_deserialization(
+        self,
+        region: str | None,
+        namespace: str | None,
+        seconds: float,
+    ) -> None:
+        """Record the deserialization of a value."""
+
+    def record_read(
+        self, region: str | None, namespace: str | None, size: int
+    ) -> None:
+        """Record the size in bytes of a serialized value read from the
+        backend, including metadata."""
+
+
+_counters = {
+    "hits": "Number of values returned from the cache.",
+    "negative_hits": "Number of negative values returned from the cache.",
+    "misses": "Number of values not present in the cache, or expired.",
+    "regenerations": "Number of calls to creation functions.",
+    "regeneration_errors": "Number of creation functions which failed.",
+    "bytes_read": "Bytes of serialized values read from the backend.",
+    "bytes_written": "Bytes of serialized values written to the backend.",
+}
+
+_histograms = {
+    "creator_seconds": "Time taken by creation functions.",
+    "mutex_wait_seconds": "Time spent waiting on dogpile locks.",
+    "serialize_seconds": "Time taken to serialize values.",
+    "deserialize_seconds": "Time taken to deserialize values.",
+}
+
+
+class Histogram:
+    """A histogram of durations, with cumulative counts per bucket as
+    used by Prometheus.
+
+    :param buckets: ascending upper bounds of the buckets, in seconds.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    default_buckets = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self, buckets: tuple[float, ...] = default_buckets):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Return ``(upper bound, count)`` tuples, including values up to
+        each bound, ending with an infinite bound."""
+
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+_Labels = tuple[str | None, str | None]
+
+
+class CacheStats(StatsObserver):
+    """A :class:`.StatsObserver` which accumulates counters and latency
+    histograms in memory.
+
+    Counters are ``hits``, ``negative_hits``, ``misses``,
+    ``regenerations``, ``regeneration_errors``, ``bytes_read`` and
+    ``bytes_written``; histograms are ``creator_seconds``,
+    ``mutex_wait_seconds``, ``serialize_seconds`` and
+    ``deserialize_seconds``.  The same instance may be shared by multiple
+    regions.
+
+    :param buckets: upper bounds of the buckets of the histograms.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = Histogram.default_buckets):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[_Labels, int]] = {
+            name: {} for name in _counters
+        }
+        self._histograms: dict[str, dict[_Labels, Histogram]] = {
+            name: {} for name in _histograms
+        }
+
+    def counter(
+        self, name: str, region: str | None, namespace: str | None = None
+    ) -> int:
+        """Return the value of a counter."""
+
+        return self._counters[name].get((region, namespace), 0)
+
+    def histogram(
+        self, name: str, region: str | None, namespace: str | None = None
+    ) -> Histogram | None:
+        """Return a histogram, or ``None`` if nothing has been recorded
+        for it."""
+
+        return self._histograms[name].get((region, namespace))
+
+    def _add(self, name: str, labels: _Labels, value: int) -> None:
+        counters = self._counters[name]
+        with self._lock:
+            counters[labels] = counters.get(labels, 0) + value
+
+    def _observe(self, name: str, labels: _Labels, value: float) -> None:
+        histograms = self._histograms[name]
+        with self._lock:
+            histogram = histograms.get(labels)
+            if histogram is None:
+                histogram = histograms[labels] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def record_hits(self, region, namespace, hits, negative_hits=0):
+        self._add("hits", (region, namespace), hits)
+        if negative_hits:
+            self._add("negative_hits", (region, namespace), negative_hits)
+
+    def record_misses(self, region, namespace, misses):
+        self._add("misses", (region, namespace), misses)
+
+    def record_regeneration(self, region, namespace, seconds, failed=False):
+        self._add("regenerations", (region, namespace), 1)
+        if failed:
+            self._add("regeneration_errors", (region, namespace), 1)
+        self._observe("creator_seconds", (region, namespace), seconds)
+
+    def record_mutex_wait(self, region, namespace, seconds):
+        self._observe("mutex_wait_seconds", (region, namespace), seconds)
+
+    def record_serialization(self, region, namespace, seconds, size):
+        self._add("bytes_written", (region, namespace), size)
+        self._observe("serialize_seconds", (region, namespace), seconds)
+
+    def record_deserialization(self, region, namespace, seconds):
+        self._observe("deserialize_seconds", (region, namespace), seconds)
+
+    def record_read(self, region, namespace, size):
+        self._add("bytes_read", (region, namespace), size)
+
+    def prometheus_text(self, prefix: str = "dogpile_cache") -> str:
+        """Return the statistics in the Prometheus text exposition
+        format, with ``region`` and ``namespace`` labels.
+
+        :param prefix: prefix of the metric names.
+
+        """
+        lines = []
+        with self._lock:
+            for name, help_ in _counters.items():
+                metric = "%s_%s_total" % (prefix, name)
+                lines.append("# HELP %s %s" % (metric, help_))
+                lines.append("# TYPE %s counter" % metric)
+                for labels, value in sorted(
+                    self._counters[name].items(), key=_sort_key
+                ):
+                    lines.append(
+                        "%s{%s} %d" % (metric, _format_labels(labels), value)
+                    )
+
+            for name, help_ in _histograms.items():
+                metric = "%s_%s" % (prefix, name)
+                lines.append("# HELP %s %s" % (metric, help_))
+                lines.append("# TYPE %s histogram" % metric)
+                for labels, histogram in sorted(
+                    self._histograms[name].items(), key=_sort_key
+                ):
+                    label_text = _format_labels(labels)
+                    for bound, count in histogram.cumulative_counts():
+                        lines.append(
+                            '%s_bucket{%s,le="%s"} %d'
+                            % (metric, label_text, _format_bound(bound), count)
+                        )
+                    lines.append(
+                        "%s_sum{%s} %r" % (metric, label_text, histogram.sum)
+                    )
+                    lines.append(
+                        "%s_count{%s} %d"
+                        % (metric, label_text, histogram.count)
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def _sort_key(item: tuple[_Labels, Any]) -> tuple[str, str]:
+    region, namespace = item[0]
+    return region or "", namespace or ""
+
+
+def _escape_label(value: str | None) -> str:
+    if value is None:
+        return ""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: _Labels) -> str:
+    region, namespace = labels
+    return 'region="%s",namespace="%s"' % (
+        _escape_label(region),
+        _escape_label(namespace),
+    )
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class OpenTelemetryObserver(StatsObserver):
+    """A :class:`.StatsObserver` which records measurements using
+    OpenTelemetry instruments.
+
+    E.g.::
+
+        from opentelemetry import metrics
+
+        from dogpile.cache import make_region
+        from dogpile.cache.stats import OpenTelemetryObserver
+
+        region = make_region(
+            "users",
+            stats=OpenTelemetryObserver(metrics.get_meter("myapp")),
+        )
+
+    Counters and histograms are created using the ``create_counter()``
+    and ``create_histogram()`` methods of the given meter, with
+    ``region`` and ``namespace`` attributes, and are named as those of
+    :class:`.CacheStats`, e.g. ``dogpile.cache.hits`` and
+    ``dogpile.cache.creator_seconds``.  Any object providing these methods
+    may be used as the meter; the ``opentelemetry-api`` package isn't
+    otherwise required.
+
+    :param meter: an OpenTelemetry ``Meter``.
+
+    :param prefix: prefix of the instrument names.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    def __init__(self, meter: Any, prefix: str = "dogpile.cache"):
+        self._counters = {
+            name: meter.create_counter(
+                "%s.%s" % (prefix, name),
+                unit="By" if name.startswith("bytes") else "1",
+                description=description,
+            )
+            for name, description in _counters.items()
+        }
+        self._histograms = {
+            name: meter.create_histogram(
+                "%s.%s" % (prefix, name), unit="s", description=description
+            )
+            for name, description in _histograms.items()
+        }
+
+    def _attributes(
+        self, region: str | None, namespace: str | None
+    ) -> dict[str, str]:
+        return {"region": region or "", "namespace": namespace or ""}
+
+    def record_hits(self, region, namespace, hits, negative_hits=0):
+        attributes = self._attributes(region, namespace)
+        self._counters["hits"].add(hits, attributes)
+        if negative_hits:
+            self._counters["negative_hits"].add(negative_hits, attributes)
+
+    def record_misses(self, region, namespace, misses):
+        self._counters["misses"].add(
+            misses, self._attributes(region, namespace)
+        )
+
+    def record_regeneration(self, region, namespace, seconds, failed=False):
+        attributes = self._attributes(region, namespace)
+        self._counters["regenerations"].add(1, attributes)
+        if failed:
+            self._counters["regeneration_errors"].add(1, attributes)
+        self._histograms["creator_seconds"].record(seconds, attributes)
+
+    def record_mutex_wait(self, region, namespace, seconds):
+        self._histograms["mutex_wait_seconds"].record(
+            seconds, self._attributes(region, namespace)
+        )
+
+    def record_serialization(self, region, namespace, seconds, size):
+        attributes = self._attributes(region, namespace)
+        self._counters["bytes_written"].add(size, attributes)
+        self._histograms["serialize_seconds"].record(seconds, attributes)
+
+    def record_deserialization(self, region, namespace, seconds):
+        self._histograms["deserialize_seconds"].record(
+            seconds, self._attributes(region, namespace)
+        )
+
+    def record_read(self, region, namespace, size):
+        self._counters["bytes_read"].add(
+            size, self._attributes(region, namespace)
+        )
@@ -132,7 +132,7 @@ class Lock:
             self.mutex.acquire()
 
         try:
-            log.debug("value creation lock %r acquired" % self.mutex)
+            log.debug("value creation lock %r acquired", self.mutex)
 
             if not has_value:
                 # we entered without a value, or at least with "creationtime ==
@@ -186,3 +186,126 @@ class Lock:
 
     def __exit__(self, type_, value, traceback):
         pass
+
+
+class AsyncLock(Lock):
+    """asyncio version of the dogpile lock.
+
+    Works as :class:`.Lock` does, using an asyncio mutex which provides
+    awaitable ``acquire()`` and ``release()`` methods, and is used
+    as an ``async with`` block::
+
+        async with AsyncLock(
+            mutex, creator, value_and_created_fn, expiretime
+        ) as value:
+            return value
+
+    Coroutines which find no value wait on the mutex for the one
+    coroutine which is creating it, rather than each calling upon the
+    creator.
+
+    :param mutex: A mutex object that provides awaitable ``acquire()``
+     and ``release()`` methods, such as an :class:`.AsyncCacheMutex`.
+    :param creator: Coroutine function which returns a tuple of the form
+     (new_value, creation_time), as that of :class:`.Lock`.
+    :param value_and_created_fn: Coroutine function which returns
+     a tuple of the form (existing_value, creation_time), as that of
+     :class:`.Lock`.
+    :param expiretime: Expiration time in seconds.  Set to
+     ``None`` for never expires.
+    :param async_creator: A coroutine function.  If specified, it will be
+     passed the mutex as an argument and is responsible for releasing the
+     mutex after it finishes some deferred value creation, such as within
+     a task created by ``asyncio.create_task()``.
+
+    .. versionadded:: 1.5.1
+
+    """
+
+    async def _enter(self):
+        value_fn = self.value_and_created_fn
+
+        try:
+            value = await value_fn()
+            value, createdtime = value
+        except NeedRegenerationException:
+            log.debug("NeedRegenerationException")
+            value = NOT_REGENERATED
+            createdtime = -1
+
+        generated = await self._enter_create(value, createdtime)
+
+        if generated is not NOT_REGENERATED:
+            generated, createdtime = generated
+            return generated
+        elif value is NOT_REGENERATED:
+            try:
+                value, createdtime = await value_fn()
+                return value
+            except NeedRegenerationException:
+                raise Exception(
+                    "Generation function should "
+                    "have just been called by a concurrent "
+                    "coroutine."
+                )
+        else:
+            return value
+
+    async def _enter_create(self, value, createdtime):
+        if not self._is_expired(createdtime):
+            return NOT_REGENERATED
+
+        _async = False
+
+        if self._has_value(createdtime):
+            has_value = True
+            if not await self.mutex.acquire(False):
+                log.debug("creation function in progress elsewhere, returning")
+                return NOT_REGENERATED
+        else:
+            has_value = False
+            log.debug("no value, waiting for create lock")
+            await self.mutex.acquire()
+
+        try:
+            log.debug("value creation lock %r acquired", self.mutex)
+
+            if not has_value:
+                # see Lock._enter_create(); another coroutine may have
+                # generated the value while we waited on the mutex
+                try:
+                    value, createdtime = await self.value_and_created_fn()
+                except NeedRegenerationException:
+                    pass
+                else:
+                    has_value = True
+                    if not self._is_expired(createdtime):
+                        log.debug("Concurrent coroutine created the value")
+                        return value, createdtime
+
+            if has_value and self.async_creator:
+                log.debug("Passing creation lock to async runner")
+
+                await self.async_creator(self.mutex)
+                _async = True
+
+                return value, createdtime
+
+            log.debug(
+                "Calling creation function for %s value",
+                "not-yet-present" if not has_value else "previously expired",
+            )
+            return await self.creator()
+        finally:
+            if not _async:
+                await self.mutex.release()
+                log.debug("Released creation lock")
+
+    def __enter__(self):
+        raise TypeError("AsyncLock is used with 'async with'")
+
+    async def __aenter__(self):
+        return await self._enter()
+
+    async def __aexit__(self, type_, value, traceback):
+        pass
@@ -1,5 +1,6 @@
 # mypy: ignore-errors
 
+import asyncio
 import collections
 import itertools
 import json
@@ -11,6 +12,7 @@ import uuid
 
 import pytest
 
+from dogpile.cache import AsyncCacheRegion
 from dogpile.cache import CacheRegion
 from dogpile.cache import register_backend
 from dogpile.cache.api import CacheBackend
@@ -564,6 +566,371 @@ class _GenericMutexTestSuite(_GenericBackendFixture):
         eq_(reg.get_or_create("foo", create_foo), "foobar")
 
 
+class _GenericAsyncBackendFixture:
+    @classmethod
+    def setup_class(cls):
+        backend_cls = _backend_loader.load(cls.backend)
+        try:
+            arguments = cls.config_args.get("arguments", {})
+            backend = backend_cls(arguments)
+        except ImportError:
+            pytest.skip("Backend %s not installed" % cls.backend)
+        cls._check_backend_available(backend)
+
+    @classmethod
+    def _check_backend_available(cls, backend):
+        pass
+
+    async def _close_backend(self, backend):
+        pass
+
+    backend: str
+    region_args = {}
+    config_args = {}
+
+    _region_inst = None
+    _backend_inst = None
+
+    def setup_method(self, method):
+        self._region_inst = None
+        self._backend_inst = None
+        self._keys = set()
+
+    def _run(self, fn, *arg):
+        """Run a test coroutine in a new event loop, deleting the keys
+        used by the test in the same loop."""
+
+        async def go():
+            try:
+                return await fn(*arg)
+            finally:
+                if self._region_inst:
+                    for key in self._keys:
+                        await self._region_inst.backend.delete(key)
+                    await self._close_backend(self._region_inst.backend)
+                if self._backend_inst:
+                    await self._close_backend(self._backend_inst)
+
+        return asyncio.run(go())
+
+    def _region(self, region_args={}, config_args={}):
+        _region_args = {}
+        for cls in reversed(self.__class__.__mro__):
+            if "region_args" in cls.__dict__:
+                _region_args.update(cls.__dict__["region_args"])
+        _region_args.update(**region_args)
+        _config_args = self.config_args.copy()
+        _config_args.update(config_args)
+
+        def _store_keys(key):
+            if existing_key_mangler:
+                key = existing_key_mangler(key)
+            self._keys.add(key)
+            return key
+
+        self._region_inst = reg = AsyncCacheRegion(**_region_args)
+        reg.configure(self.backend, **_config_args)
+
+        existing_key_mangler = reg.key_mangler
+        reg._region.key_mangler = _store_keys
+        return reg
+
+    def _backend(self):
+        backend_cls = _backend_loader.load(self.backend)
+        arguments = self.config_args.get("arguments", {})
+        self._backend_inst = backend_cls(arguments)
+        return self._backend_inst
+
+
+class _GenericAsyncBackendTestSuite(_GenericAsyncBackendFixture):
+    def test_backend_get_nothing(self):
+        async def go():
+            backend = self._backend()
+            eq_(await backend.get_serialized(gen_some_key()), NO_VALUE)
+
+        self._run(go)
+
+    def test_backend_set_get_delete(self):
+        async def go():
+            backend = self._backend()
+            some_key = gen_some_key()
+            await backend.set_serialized(some_key, b"some value")
+            eq_(await backend.get_serialized(some_key), b"some value")
+            await backend.delete(some_key)
+            eq_(await backend.get_serialized(some_key), NO_VALUE)
+
+        self._run(go)
+
+    def test_region_is_key_locked(self):
+        async def go():
+            reg = self._region()
+            random_key = str(uuid.uuid1())
+            assert not await reg.get(random_key)
+            eq_(await reg.key_is_locked(random_key), False)
+            eq_(await reg.key_is_locked(random_key), False)
+
+            mutex = reg.backend.get_mutex(random_key)
+            if mutex:
+                await mutex.acquire()
+                eq_(await reg.key_is_locked(random_key), True)
+                await mutex.release()
+                eq_(await reg.key_is_locked(random_key), False)
+
+        self._run(go)
+
+    def test_region_set_get_value(self):
+        async def go():
+            reg = self._region()
+            some_key = gen_some_key()
+            await reg.set(some_key, "some value")
+            eq_(await reg.get(some_key), "some value")
+
+        self._run(go)
+
+    def test_region_get_value_metadata(self):
+        async def go():
+            reg = self._region()
+            some_key = gen_some_key()
+            eq_(await reg.get_value_metadata(some_key), None)
+            await reg.set(some_key, "some value")
+            value = await reg.get_value_metadata(some_key)
+            eq_(value.payload, "some value")
+            assert value.age < 60
+
+        self._run(go)
+
+    def test_region_set_get_multiple_values(self):
+        async def go():
+            reg = self._region()
+            eq_(await reg.get_multi([]), [])
+            await reg.set_multi({})
+            await reg.set_multi({"key1": "value1", "key3": "value3"})
+            eq_(
+                await reg.get_multi(["key1", "key2", "key3"]),
+                ["value1", NO_VALUE, "value3"],
+            )
+
+        self._run(go)
+
+    def test_region_delete_multiple(self):
+        async def go():
+            reg = self._region()
+            values = {"key1": "value1", "key2": "value2", "key3": "value3"}
+            await reg.set_multi(values)
+            await reg.delete_multi(["key2", "key10"])
+            eq_(
+                await reg.get_multi(["key1", "key2", "key3", "key10"]),
+                ["value1", NO_VALUE, "value3", NO_VALUE],
+            )
+
+        self._run(go)
+
+    def test_region_delete(self):
+        async def go():
+            reg = self._region()
+            some_key = gen_some_key()
+            await reg.set(some_key, "some value")
+            await reg.delete(some_key)
+            await reg.delete(some_key)
+            eq_(await reg.get(some_key), NO_VALUE)
+
+        self._run(go)
+
+    def test_region_creator(self):
+        async def go():
+            reg = self._region()
+
+            async def creator():
+                return "some value"
+
+            eq_(await reg.get_or_create(gen_some_key(), creator), "some value")
+
+        self._run(go)
+
+    def test_region_get_or_create_multi(self):
+        async def go():
+            reg = self._region()
+            await reg.set("key2", "existing")
+
+            async def creator(*keys):
+                canary.append(keys)
+                return ["new %s" % key for key in keys]
+
+            canary = []
+            eq_(
+                await reg.get_or_create_multi(
+                    ["key1", "key2", "key3"], creator
+                ),
+                ["new key1", "existing", "new key3"],
+            )
+            eq_(canary, [("key1", "key3")])
+            eq_(await reg.get_or_create_multi([], creator), [])
+
+        self._run(go)
+
+    def test_region_get_or_create_multi_w_should_cache_none(self):
+        async def go():
+            reg = self._region()
+
+            async def creator(*keys):
+                return [None for key in keys]
+
+            values = await reg.get_or_create_multi(
+                ["key1", "key2", "key3"],
+                creator,
+                should_cache_fn=lambda v: v is not None,
+            )
+            eq_(values, [None, None, None])
+            eq_(
+                await reg.get_multi(["key1", "key2", "key3"]),
+                [NO_VALUE, NO_VALUE, NO_VALUE],
+            )
+
+        self._run(go)
+
+    def test_concurrent_dogpile(self):
+        async def go():
+            reg = self._region()
+            some_key = gen_some_key()
+            canary = []
+
+            async def creator():
+                canary.append(1)
+                await asyncio.sleep(0.1)
+                return "some value"
+
+            values = await asyncio.gather(
+                *[reg.get_or_create(some_key, creator) for i in range(10)]
+            )
+            eq_(values, ["some value"] * 10)
+            if not reg.backend.has_lock_timeout():
+                eq_(len(canary), 1)
+
+        self._run(go)
+
+    def test_concurrent_regenerate_returns_expired(self):
+        async def go():
+            reg = self._region(config_args={"expiration_time": 300})
+            some_key = gen_some_key()
+            counter = itertools.count(1)
+
+            async def creator():
+                await asyncio.sleep(0.1)
+                return "some value %d" % next(counter)
+
+            eq_(await reg.get_or_create(some_key, creator), "some value 1")
+            reg.invalidate(hard=False)
+
+            values = await asyncio.gather(
+                *[reg.get_or_create(some_key, creator) for i in range(5)]
+            )
+            eq_(
+                sorted(values),
+                ["some value 1"] * 4 + ["some value 2"],
+            )
+            eq_(await reg.get(some_key), "some value 2")
+
+        self._run(go)
+
+    def test_concurrent_get_or_create_multi(self):
+        """Test that when we get inside the "creator" for a certain key,
+        there are no other "creators" running at all for that key."""
+
+        async def go():
+            reg = self._region()
+            in_progress = set()
+            canary = []
+
+            async def creator(*keys):
+                canary.extend(in_progress.intersection(keys))
+                in_progress.update(keys)
+                await asyncio.sleep(0.1)
+                in_progress.difference_update(keys)
+                return ["some value %s" % k for k in keys]
+
+            results = await asyncio.gather(
+                reg.get_or_create_multi(["1", "2", "3"], creator),
+                reg.get_or_create_multi(["2", "3", "4"], creator),
+                reg.get_or_create_multi(["4", "5"], creator),
+            )
+            eq_(
+                results,
+                [
+                    ["some value 1", "some value 2", "some value 3"],
+                    ["some value 2", "some value 3", "some value 4"],
+                    ["some value 4", "some value 5"],
+                ],
+            )
+            if reg.backend.get_mutex("1") is None:
+                eq_(canary, [])
+
+        self._run(go)
+
+    @pytest.mark.time_intensive
+    def test_region_expire(self):
+        async def go():
+            some_key = gen_some_key()
+            expire_time = 1.00
+
+            reg = self._region(config_args={"expiration_time": expire_time})
+            counter = itertools.count(1)
+
+            async def creator():
+                return "some value %d" % next(counter)
+
+            eq_(await reg.get_or_create(some_key, creator), "some value 1")
+            await asyncio.sleep(expire_time + (0.2 * expire_time))
+            post_expiration = await reg.get(some_key, ignore_expiration=True)
+            if post_expiration is not NO_VALUE:
+                eq_(post_expiration, "some value 1")
+
+            eq_(await reg.get_or_create(some_key, creator), "some value 2")
+            eq_(await reg.get(some_key), "some value 2")
+
+        self._run(go)
+
+    def test_decorated_fn_functionality(self):
+        async def go():
+            reg = self._region()
+
+            counter = itertools.count(1)
+
+            @reg.async_cache_on_arguments()
+            async def my_function(x, y):
+                return next(counter) + x + y
+
+            await my_function.invalidate(3, 4)
+            await my_function.invalidate(5, 6)
+            await my_function.invalidate(4, 3)
+
+            eq_(await my_function(3, 4), 8)
+            eq_(await my_function(5, 6), 13)
+            eq_(await my_function(3, 4), 8)
+            eq_(await my_function(4, 3), 10)
+
+            await my_function.invalidate(4, 3)
+            eq_(await my_function(4, 3), 11)
+
+            await my_function.set(100, 4, 3)
+            eq_(await my_function.get(4, 3), 100)
+            eq_(await my_function.refresh(4, 3), 12)
+            eq_(await my_function(4, 3), 12)
+
+        self._run(go)
+
+    def test_exploding_value_fn(self):
+        async def go():
+            reg = self._region()
+
+            async def boom():
+                raise Exception("boom")
+
+            with pytest.raises(Exception, match="boom"):
+                await reg.get_or_create(gen_some_key(), boom)
+
+        self._run(go)
+
+
 class MockMutex(object):
     def __init__(self, key):
         self.key = key
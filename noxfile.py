@@ -36,6 +36,10 @@ TARGETS = [
     "valkey",
     "valkey_sentinel",
     "dbm",
+    "directory",
+    "log_structured",
+    "shared_memory",
+    "sqlite",
 ]
 FULL = ["_quick", "full"]
 
@@ -237,6 +241,16 @@ def _tests(
                 )
             case "dbm":
                 backend_cmd.append("tests/cache/test_dbm_backend.py")
+            case "directory":
+                backend_cmd.append("tests/cache/test_directory_backend.py")
+            case "log_structured":
+                backend_cmd.append(
+                    "tests/cache/test_log_structured_backend.py"
+                )
+            case "shared_memory":
+                backend_cmd.append("tests/cache/test_shared_memory_backend.py")
+            case "sqlite":
+                backend_cmd.append("tests/cache/test_sqlite_backend.py")
 
     posargs = apply_pytest_opts(
         session,
@@ -248,6 +262,38 @@ def _tests(
     session.run(*pifpaf_cmd, *cmd, *backend_cmd, *posargs)
 
 
+@nox.session(name="benchmark")
+def benchmark(session: nox.Session) -> None:
+    """Run the benchmark suite, including the server backends.
+
+    Redis, Valkey and memcached are spawned with pifpaf; arguments are
+    passed to the suite, e.g. ``nox -s benchmark -- --output after.json``.
+
+    """
+
+    session.install(".")
+    for group in ("tests_redis", "tests_valkey", "tests_memcached"):
+        session.install(*nox.project.dependency_groups(pyproject, group))
+
+    pifpaf_cmd: list[str] = []
+    ports = itertools.count(11212)
+    for module in ("redis", "valkey", "memcached"):
+        _pifpaf(
+            pifpaf_cmd,
+            module,
+            port_env=f"TOX_DOGPILE_{module.upper()}_PORT",
+            port=str(next(ports)),
+        )
+
+    session.run(
+        *pifpaf_cmd,
+        "python",
+        "-m",
+        "tools.benchmarks.suite",
+        *session.posargs,
+    )
+
+
 @nox.session(name="pep484")
 def mypy_check(session: nox.Session) -> None:
     """Run mypy type checking."""
@@ -0,0 +1,254 @@
+import asyncio
+import itertools
+import json
+from unittest import mock
+
+import pytest
+
+from dogpile.cache import AsyncCacheRegion
+from dogpile.cache import make_async_region
+from dogpile.cache import make_region
+from dogpile.cache.api import CachedMetadata
+from dogpile.cache.api import CachedValue
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.exception import RegionNotConfigured
+from dogpile.cache.exception import ValidationError
+from dogpile.cache.region import value_version
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+from dogpile.testing.fixtures import _GenericAsyncBackendTestSuite
+
+
+class AsyncMemoryBackendTest(_GenericAsyncBackendTestSuite):
+    backend = "dogpile.cache.memory_async"
+
+
+class AsyncMemoryPickleBackendTest(_GenericAsyncBackendTestSuite):
+    backend = "dogpile.cache.memory_async_pickle"
+
+
+class AsyncMemoryPickleBackendBinaryMetadataTest(AsyncMemoryPickleBackendTest):
+    region_args = {"binary_metadata": True}
+
+
+class AsyncMemoryBackendSerializerTest(AsyncMemoryBackendTest):
+    region_args = {
+        "serializer": lambda v: json.dumps(v).encode("ascii"),
+        "deserializer": json.loads,
+    }
+
+    def test_uses_serializer(self):
+        async def go():
+            region = self._region()
+            await region.set("xyz", {"a": 1})
+            eq_(
+                region.backend._backend._cache["xyz"].partition(b"|")[2],
+                b'{"a": 1}',
+            )
+
+        self._run(go)
+
+
+class AsyncRegionTest:
+    def _region(self, **kw):
+        return make_async_region().configure(
+            "dogpile.cache.memory_async", **kw
+        )
+
+    def test_make_async_region(self):
+        region = make_async_region("some region")
+        assert isinstance(region, AsyncCacheRegion)
+        eq_(region.name, "some region")
+        eq_(region.is_configured, False)
+
+    def test_not_configured(self):
+        region = make_async_region()
+        assert_raises_message(
+            RegionNotConfigured,
+            "No backend is configured on this region.",
+            getattr,
+            region,
+            "backend",
+        )
+
+    def test_sync_region_rejects_async_backend(self):
+        assert_raises_message(
+            ValidationError,
+            "Backend dogpile.cache.memory_async is an asyncio backend; "
+            "use it with AsyncCacheRegion",
+            make_region().configure,
+            "dogpile.cache.memory_async",
+        )
+
+    def test_async_region_rejects_sync_backend(self):
+        assert_raises_message(
+            ValidationError,
+            "Backend dogpile.cache.memory is not an asyncio backend",
+            make_async_region().configure,
+            "dogpile.cache.memory",
+        )
+
+    def test_configure_from_config(self):
+        region = make_async_region().configure_from_config(
+            {
+                "cache.example.backend": "dogpile.cache.memory_async_pickle",
+                "cache.example.expiration_time": "60",
+            },
+            "cache.example.",
+        )
+        eq_(region.expiration_time, 60)
+        eq_(region.backend.deserializer is not None, True)
+
+    def test_hard_invalidate(self):
+        async def go():
+            region = self._region()
+            counter = itertools.count(1)
+
+            async def creator():
+                return next(counter)
+
+            eq_(await region.get_or_create("some key", creator), 1)
+            region.invalidate()
+            eq_(await region.get("some key"), NO_VALUE)
+            eq_(await region.get_or_create("some key", creator), 2)
+
+        asyncio.run(go())
+
+    def test_soft_invalidate_requires_expiration_time(self):
+        async def go():
+            region = self._region()
+
+            async def creator():
+                return 1
+
+            await region.get_or_create("some key", creator)
+            region.invalidate(hard=False)
+            with pytest.raises(
+                Exception, match="Non-None expiration time required"
+            ):
+                await region.get_or_create("some key", creator)
+
+        asyncio.run(go())
+
+    def test_creator_args(self):
+        async def go():
+            region = self._region()
+
+            async def creator(x, y=0):
+                return x + y
+
+            eq_(
+                await region.get_or_create(
+                    "some key", creator, creator_args=((1,), {"y": 2})
+                ),
+                3,
+            )
+
+        asyncio.run(go())
+
+    def test_async_creation_runner(self):
+        canary = []
+
+        async def async_creation_runner(cache, key, creator, mutex):
+            async def runner():
+                try:
+                    canary.append(await mutex.locked())
+                    await cache.set(key, await creator())
+                finally:
+                    await mutex.release()
+
+            tasks.append(asyncio.create_task(runner()))
+
+        tasks = []
+
+        async def go():
+            region = make_async_region(
+                async_creation_runner=async_creation_runner
+            ).configure("dogpile.cache.memory_async", expiration_time=300)
+            counter = itertools.count(1)
+
+            async def creator():
+                return next(counter)
+
+            eq_(await region.get_or_create("some key", creator), 1)
+            region.invalidate(hard=False)
+
+            # the expired value is returned, while the new value is
+            # created by the task
+            eq_(await region.get_or_create("some key", creator), 1)
+            await asyncio.gather(*tasks)
+            eq_(await region.get_or_create("some key", creator), 2)
+
+        asyncio.run(go())
+        eq_(canary, [True])
+
+    def test_should_cache_fn(self):
+        async def go():
+            region = self._region()
+
+            async def creator():
+                return None
+
+            eq_(
+                await region.get_or_create(
+                    "some key",
+                    creator,
+                    should_cache_fn=lambda value: value is not None,
+                ),
+                None,
+            )
+            eq_(await region.get("some key"), NO_VALUE)
+
+        asyncio.run(go())
+
+    def test_get_or_create_multi_no_value_not_regenerated(self):
+        async def go():
+            region = self._region()
+            calls = []
+
+            async def creator(*keys):
+                calls.append(keys)
+                return [NO_VALUE if key == "k2" else key for key in keys]
+
+            eq_(
+                await region.get_or_create_multi(
+                    ["k1", "k2"],
+                    creator,
+                    should_cache_fn=lambda value: value is not NO_VALUE,
+                ),
+                ["k1", NO_VALUE],
+            )
+            eq_(calls, [("k1", "k2")])
+
+        asyncio.run(go())
+
+    def test_early_expiration(self):
+        async def go():
+            region = make_async_region(early_expiration_beta=1.0).configure(
+                "dogpile.cache.memory_async", expiration_time=10
+            )
+
+            async def creator():
+                return "new value"
+
+            await region._set_cached_value_to_backend(
+                "some key",
+                CachedValue(
+                    "old value", CachedMetadata(100, value_version, {"d": 2.0})
+                ),
+            )
+            with mock.patch("time.time", return_value=105):
+                with mock.patch("random.random", return_value=0.5):
+                    eq_(
+                        await region.get_or_create("some key", creator),
+                        "old value",
+                    )
+                with mock.patch("random.random", return_value=0.95):
+                    eq_(
+                        await region.get_or_create("some key", creator),
+                        "new value",
+                    )
+                value = await region.get_value_metadata("some key")
+                assert value.metadata["d"] >= 0
+
+        asyncio.run(go())
@@ -0,0 +1,146 @@
+import os
+
+import pytest
+
+from dogpile.cache import make_region
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.compression import CompressionProxy
+from dogpile.cache.compression import LzmaCompressor
+from dogpile.cache.compression import ZlibCompressor
+from dogpile.cache.compression import ZstdCompressor
+from dogpile.testing import eq_
+
+LARGE_VALUE = "<p>some compressible text</p>" * 100
+
+
+class CompressionProxyTest:
+    def _compressor(self):
+        return ZlibCompressor()
+
+    def _region(self, cache_dict, **proxy_args):
+        proxy = CompressionProxy(**proxy_args)
+        region = make_region().configure(
+            "dogpile.cache.memory_pickle",
+            arguments={"cache_dict": cache_dict},
+            wrap=[proxy],
+        )
+        return region, proxy
+
+    def test_large_value_compressed(self):
+        cache_dict = {}
+        compressor = self._compressor()
+        region, proxy = self._region(cache_dict, compressor=compressor)
+        region.set("some key", LARGE_VALUE)
+
+        stored = cache_dict["some key"]
+        eq_(stored[0:2], bytes((0xDC, compressor.tag)))
+        assert len(stored) < len(LARGE_VALUE) / 10
+        eq_(region.get("some key"), LARGE_VALUE)
+
+    def test_multi(self):
+        cache_dict = {}
+        region, proxy = self._region(cache_dict, compressor=self._compressor())
+        region.set_multi({"k1": LARGE_VALUE, "k2": "small"})
+        eq_(cache_dict["k1"][0], 0xDC)
+        assert cache_dict["k2"][0] != 0xDC
+        eq_(
+            region.get_multi(["k1", "k2", "k3"]),
+            [LARGE_VALUE, "small", NO_VALUE],
+        )
+
+    def test_threshold(self):
+        cache_dict = {}
+        region, proxy = self._region(cache_dict, threshold=10000)
+        region.set("some key", LARGE_VALUE)
+        assert cache_dict["some key"][0] != 0xDC
+        eq_(region.get("some key"), LARGE_VALUE)
+
+    def test_incompressible_value_stored_uncompressed(self):
+        cache_dict = {}
+        region, proxy = self._region(cache_dict)
+        value = os.urandom(4096)
+        region.set("some key", value)
+        assert cache_dict["some key"][0] != 0xDC
+        eq_(region.get("some key"), value)
+        eq_(proxy.stats.uncompressed, 1)
+        eq_(proxy.stats.compressed, 0)
+
+    def test_existing_values_read(self):
+        cache_dict = {}
+        region = make_region().configure(
+            "dogpile.cache.memory_pickle",
+            arguments={"cache_dict": cache_dict},
+        )
+        region.set("some key", LARGE_VALUE)
+
+        compressed_region, proxy = self._region(cache_dict)
+        eq_(compressed_region.get("some key"), LARGE_VALUE)
+
+    def test_change_compressor(self):
+        cache_dict = {}
+        region, proxy = self._region(cache_dict)
+        region.set("some key", LARGE_VALUE)
+
+        region, proxy = self._region(
+            cache_dict,
+            compressor=LzmaCompressor(),
+            decompressors=[ZlibCompressor()],
+        )
+        eq_(region.get("some key"), LARGE_VALUE)
+
+        region, proxy = self._region(cache_dict, compressor=LzmaCompressor())
+        eq_(region.get("some key"), NO_VALUE)
+
+    def test_corrupt_value_is_miss(self):
+        cache_dict = {}
+        region, proxy = self._region(cache_dict, compressor=self._compressor())
+        region.set("some key", LARGE_VALUE)
+        cache_dict["some key"] = cache_dict["some key"][0:20]
+        eq_(region.get("some key"), NO_VALUE)
+        eq_(region.get_or_create("some key", lambda: "new value"), "new value")
+
+    def test_stats(self):
+        region, proxy = self._region({}, compressor=self._compressor())
+        region.set("k1", LARGE_VALUE)
+        region.set("k2", "small")
+        region.get("k1")
+        region.get("k2")
+
+        stats = proxy.stats
+        eq_(stats.compressed, 1)
+        eq_(stats.uncompressed, 0)
+        eq_(stats.decompressed, 1)
+        assert stats.ratio > 10
+        assert stats.compress_seconds > 0
+        assert stats.decompress_seconds > 0
+
+        stats.reset()
+        eq_(stats.compressed, 0)
+        eq_(stats.ratio, 1.0)
+
+
+class LzmaCompressionProxyTest(CompressionProxyTest):
+    def _compressor(self):
+        return LzmaCompressor(preset=1)
+
+
+class ZstdCompressionProxyTest(CompressionProxyTest):
+    def _compressor(self):
+        try:
+            return ZstdCompressor()
+        except ImportError:
+            pytest.skip("zstd is not available")
+
+    def test_dictionary(self):
+        self._compressor()
+        samples = [
+            b'{"id": %d, "name": "user %d", "email": "user%d@example.com"}'
+            % (i, i, i)
+            for i in range(1000)
+        ]
+        dictionary = ZstdCompressor.train_dictionary(samples, 1024)
+        compressor = ZstdCompressor(dictionary=dictionary)
+        value = b'{"id": 5000, "name": "user 5000", "email": "x@example.com"}'
+        compressed = compressor.compress(value)
+        assert len(compressed) < len(ZstdCompressor().compress(value))
+        eq_(compressor.decompress(compressed), value)
@@ -1,9 +1,17 @@
+import gc
 import os
 import sys
+import threading
+from unittest import mock
 
+import pytest
+
+from dogpile.cache.api import NO_VALUE
 from dogpile.cache.backends.file import AbstractFileLock
+from dogpile.cache.backends.file import DBMBackend
 from dogpile.cache.proxy import ProxyBackend
 from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
 from dogpile.testing.fixtures import _GenericBackendTestSuite
 from dogpile.testing.fixtures import _GenericMutexTestSuite
 from dogpile.testing.fixtures import _GenericSerializerTestSuite
@@ -111,12 +119,153 @@ if has_fcntl:
         config_args = {"arguments": {"filename": test_fname}}
 
 
+if has_fcntl:
+
+    class DBMStripedMutexTest(_GenericMutexTestSuite):
+        backend = "dogpile.cache.dbm"
+        config_args = {
+            "arguments": {
+                "filename": test_fname,
+                "dogpile_lockfile_stripes": 4,
+            }
+        }
+
+        def _acquire_in_thread(self, mutex):
+            result = []
+
+            def acquire():
+                result.append(mutex.acquire(False))
+                if result[0]:
+                    mutex.release()
+
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            thread.join()
+            return result[0]
+
+        def test_stripes_locked_independently(self):
+            backend = self._backend()
+            # "foo" and "k1" share a stripe, "bar" has another
+            mutex = backend.get_mutex("foo")
+            mutex.acquire()
+            try:
+                assert self._acquire_in_thread(backend.get_mutex("bar"))
+                assert not self._acquire_in_thread(backend.get_mutex("k1"))
+                assert backend.get_mutex("k1").acquire(False)
+                backend.get_mutex("k1").release()
+            finally:
+                mutex.release()
+            assert self._acquire_in_thread(backend.get_mutex("k1"))
+
+        def test_lockfiles(self):
+            backend = self._backend()
+            for key in ("foo", "bar", "k1", "k2", "k3", "k4"):
+                mutex = backend.get_mutex(key)
+                mutex.acquire()
+                mutex.release()
+            eq_(
+                sorted(
+                    fname
+                    for fname in os.listdir(os.curdir)
+                    if fname.startswith(test_fname + ".dogpile.lock.")
+                ),
+                [
+                    test_fname + ".dogpile.lock.%d" % stripe
+                    for stripe in (1, 2, 3)
+                ],
+            )
+
+
 class DBMMutexConditionTest(_DBMMutexTestSuite):
     config_args = {
         "arguments": {"filename": test_fname, "lock_factory": MutexLock}
     }
 
 
+class DBMReaderTest:
+    @pytest.fixture(autouse=True)
+    def _filename(self, tmp_path):
+        # a file of its own, which other tests' threads don't write to
+        self.filename = str(tmp_path / "test.db")
+
+    def _backend(self):
+        return DBMBackend(
+            {"filename": self.filename, "lock_factory": MutexLock}
+        )
+
+    def test_reader_kept_open(self):
+        backend = self._backend()
+        backend.set_serialized("k1", b"v1")
+        with mock.patch.object(
+            backend, "_open_reader", wraps=backend._open_reader
+        ) as open_reader:
+            for _ in range(3):
+                eq_(backend.get_serialized("k1"), b"v1")
+            eq_(backend.get_serialized_multi(["k1", "k2"]), [b"v1", NO_VALUE])
+        eq_(len(open_reader.mock_calls), 1)
+
+    def test_writes_seen(self):
+        # two backends on the same file stand in for two processes
+        reader, writer = self._backend(), self._backend()
+        writer.set_serialized("k1", b"v1")
+        eq_(reader.get_serialized("k1"), b"v1")
+
+        writer.set_serialized_multi({"k1": b"v2", "k2": b"v3"})
+        eq_(reader.get_serialized_multi(["k1", "k2"]), [b"v2", b"v3"])
+
+        writer.delete("k1")
+        eq_(reader.get_serialized("k1"), NO_VALUE)
+
+        reader.set_serialized("k1", b"v4")
+        eq_(reader.get_serialized("k1"), b"v4")
+        eq_(writer.get_serialized("k1"), b"v4")
+
+    def test_close(self):
+        backend = self._backend()
+        backend.set_serialized("k1", b"v1")
+
+        handles = []
+        read, closed = threading.Event(), threading.Event()
+
+        def read_in_thread():
+            with backend._dbm_reader() as dbm_obj:
+                handles.append(dbm_obj)
+            read.set()
+            closed.wait(5)
+
+        thread = threading.Thread(target=read_in_thread)
+        thread.start()
+        read.wait(5)
+        with backend._dbm_reader() as dbm_obj:
+            handles.append(dbm_obj)
+        eq_(len(backend._all_readers), 2)
+
+        generation_fd = backend._generation_fd
+        with mock.patch("os.close", wraps=os.close) as close:
+            backend.close()
+        eq_(close.mock_calls, [mock.call(generation_fd)])
+        closed.set()
+        thread.join()
+        eq_(len(backend._all_readers), 0)
+        for dbm_obj in handles:
+            with pytest.raises(Exception):
+                dbm_obj.keys()
+
+        # closing again is harmless
+        backend.close()
+
+    def test_reader_released_with_thread(self):
+        backend = self._backend()
+        backend.set_serialized("k1", b"v1")
+        thread = threading.Thread(target=backend.get_serialized, args=("k1",))
+        thread.start()
+        thread.join()
+        del thread
+        gc.collect()
+        eq_(len(backend._all_readers), 0)
+        backend.close()
+
+
 def teardown():
     for fname in os.listdir(os.curdir):
         if fname.startswith(test_fname):
@@ -596,6 +596,19 @@ class CacheDecoratorTest(_GenericBackendFixture):
         generate.set({7: 18, 10: 15})
         eq_(generate(2, 7, 10), {2: "2 4", 7: 18, 10: 15})
 
+    def test_multi_asdict_keys_missing_creator_called_once(self):
+        reg = self._region()
+
+        calls = []
+
+        @reg.cache_multi_on_arguments(asdict=True)
+        def generate(*args):
+            calls.append(args)
+            return {arg: "%d" % arg for arg in args if arg != 2}
+
+        eq_(generate(1, 2, 3), {1: "1", 3: "3"})
+        eq_(calls, [(1, 2, 3)])
+
     def test_multi_asdict_keys_missing_existing_cache_fn(self):
         reg = self._region()
 
@@ -0,0 +1,179 @@
+import os
+import shutil
+import sys
+import threading
+import time
+from unittest import mock
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends.file import DirectoryBackend
+from dogpile.testing import eq_
+from dogpile.testing.fixtures import _GenericBackendTestSuite
+from dogpile.testing.fixtures import _GenericMutexTestSuite
+from dogpile.testing.fixtures import _GenericSerializerTestSuite
+
+try:
+    import fcntl  # noqa
+
+    has_fcntl = True
+except ImportError:
+    has_fcntl = False
+
+
+test_dirname = "test_%s.dir" % sys.hexversion
+
+if has_fcntl:
+
+    class DirectoryBackendTest(_GenericBackendTestSuite):
+        backend = "dogpile.cache.directory"
+
+        config_args = {"arguments": {"directory": test_dirname}}
+
+    class DirectoryBackendSerializerTest(
+        _GenericSerializerTestSuite, DirectoryBackendTest
+    ):
+        pass
+
+    class DirectoryMutexTest(_GenericMutexTestSuite):
+        backend = "dogpile.cache.directory"
+
+        config_args = {"arguments": {"directory": test_dirname}}
+
+
+class DirectoryBackendBehaviorTest:
+    def _backend(self, tmp_path, **arguments):
+        return DirectoryBackend(
+            {
+                "directory": str(tmp_path / "cache"),
+                "dogpile_lockfile": False,
+                **arguments,
+            }
+        )
+
+    def _files(self, backend):
+        return sorted(
+            os.path.relpath(os.path.join(dirpath, name), backend.directory)
+            for dirpath, dirnames, filenames in os.walk(backend.directory)
+            for name in filenames
+        )
+
+    def test_sharded_path(self, tmp_path):
+        backend = self._backend(tmp_path, levels=3)
+        backend.set_serialized("some key", b"value")
+        (path,) = self._files(backend)
+        parts = path.split(os.sep)
+        eq_(len(parts), 4)
+        eq_(parts[0:3], [parts[3][0:2], parts[3][2:4], parts[3][4:6]])
+        eq_(
+            path, os.path.relpath(backend._path("some key"), backend.directory)
+        )
+
+    def test_no_levels(self, tmp_path):
+        backend = self._backend(tmp_path, levels=0)
+        backend.set_serialized("some key", b"value")
+        eq_(len(self._files(backend)), 1)
+        eq_(backend.get_serialized("some key"), b"value")
+
+    def test_large_value(self, tmp_path):
+        backend = self._backend(tmp_path)
+        value = os.urandom(5 * 1024 * 1024)
+        backend.set_serialized("key", value)
+        eq_(backend.get_serialized("key"), value)
+
+    def test_failed_write_keeps_old_value(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("key", b"old value")
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            try:
+                backend.set_serialized("key", b"new value")
+            except OSError:
+                pass
+            else:
+                assert False
+        eq_(backend.get_serialized("key"), b"old value")
+        eq_(len(self._files(backend)), 1)
+
+    def test_concurrent_writers(self, tmp_path):
+        backend = self._backend(tmp_path)
+        values = [bytes([i]) * 100000 for i in range(8)]
+
+        def write():
+            for i in range(20):
+                for value in values:
+                    backend.set_serialized("key", value)
+
+        threads = [threading.Thread(target=write) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert backend.get_serialized("key") in values
+        eq_(len(self._files(backend)), 1)
+
+    def test_evict_least_recently_used(self, tmp_path):
+        backend = self._backend(
+            tmp_path, max_size=3000, eviction_interval=False
+        )
+        # times within the last day, with the access time after the
+        # modification time, so that a "relatime" mount doesn't update
+        # the access time when a file is read
+        now = time.time()
+        for i, key in enumerate(["k1", "k2", "k3", "k4"]):
+            backend.set_serialized(key, b"x" * 1000)
+            os.utime(backend._path(key), (now - 1000 + i, now - 2000))
+
+        eq_(backend.get_serialized("k1"), b"x" * 1000)
+        assert os.stat(backend._path("k1")).st_atime > now - 10
+
+        backend.evict()
+        eq_(
+            backend.get_serialized_multi(["k1", "k2", "k3", "k4"]),
+            [b"x" * 1000, NO_VALUE, b"x" * 1000, b"x" * 1000],
+        )
+
+    def test_read_within_touch_interval_not_written(self, tmp_path):
+        backend = self._backend(
+            tmp_path, max_size=3000, eviction_interval=False
+        )
+        backend.set_serialized("key", b"value")
+        now = time.time()
+        os.utime(backend._path("key"), (now - 30, now - 100))
+        with mock.patch("os.utime") as utime:
+            eq_(backend.get_serialized("key"), b"value")
+        eq_(utime.mock_calls, [])
+
+    def test_evict_removes_stale_tmp_files(self, tmp_path):
+        backend = self._backend(
+            tmp_path, max_size=3000, eviction_interval=False
+        )
+        backend.set_serialized("key", b"value")
+        path = backend._path("key")
+        for name in ("stale", "recent"):
+            with open("%s.%s.tmp" % (path, name), "wb") as file_:
+                file_.write(b"partial")
+        os.utime("%s.stale.tmp" % path, (1000, 1000))
+
+        backend.evict()
+        name = os.path.basename(path)
+        eq_(
+            [os.path.basename(path) for path in self._files(backend)],
+            [name, name + ".recent.tmp"],
+        )
+
+    def test_evictor_thread(self, tmp_path):
+        backend = self._backend(
+            tmp_path, max_size=1000, eviction_interval=0.01
+        )
+        evicted = threading.Event()
+        with mock.patch.object(
+            DirectoryBackend,
+            "evict",
+            side_effect=lambda self: evicted.set(),
+            autospec=True,
+        ):
+            assert evicted.wait(5)
+        del backend
+
+
+def teardown_module():
+    shutil.rmtree(test_dirname, ignore_errors=True)
@@ -0,0 +1,235 @@
+import random
+
+import pytest
+
+from dogpile.cache import eviction
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+from dogpile.testing import is_
+
+
+class _PolicyTestSuite:
+    policy_cls: type
+
+    def test_get_set_pop(self):
+        cache = self.policy_cls(10)
+        eq_(cache.set("a", 1), [])
+        eq_(cache.get("a"), 1)
+        is_(cache.get("b"), None)
+        eq_(cache.get("b", "default"), "default")
+        assert "a" in cache
+        eq_(cache.pop("a"), 1)
+        eq_(cache.pop("a", "default"), "default")
+        assert "a" not in cache
+        eq_(len(cache), 0)
+
+    def test_replace_value(self):
+        cache = self.policy_cls(10)
+        cache.set("a", 1)
+        eq_(cache.set("a", 2), [])
+        eq_(cache.get("a"), 2)
+        eq_(len(cache), 1)
+
+    def test_bounded(self):
+        cache = self.policy_cls(50)
+        evicted = []
+        for i in range(500):
+            evicted.extend(cache.set(i, i))
+            assert len(cache) <= 50
+        eq_(len(cache), 50)
+        eq_(len(evicted), 450)
+        for key in evicted:
+            assert key not in cache
+
+    def test_random_workload_consistent(self):
+        cache = self.policy_cls(20)
+        shadow = {}
+        rand = random.Random(5)
+        for i in range(5000):
+            key = rand.randint(0, 60)
+            op = rand.random()
+            if op < 0.5:
+                value = cache.get(key)
+                if value is not None:
+                    eq_(value, shadow[key])
+            elif op < 0.9:
+                shadow[key] = i
+                for evicted in cache.set(key, i):
+                    shadow.pop(evicted, None)
+            else:
+                cache.pop(key)
+                shadow.pop(key, None)
+            assert len(cache) <= 20
+            eq_(len(cache), len(shadow))
+        for key, value in shadow.items():
+            eq_(cache.get(key), value)
+
+    def test_clear(self):
+        cache = self.policy_cls(5)
+        for i in range(10):
+            cache.set(i, i)
+        cache.clear()
+        eq_(len(cache), 0)
+        cache.set("x", 1)
+        eq_(cache.get("x"), 1)
+
+
+class LRUPolicyTest(_PolicyTestSuite):
+    policy_cls = eviction.LRUPolicy
+
+    def test_evicts_least_recent(self):
+        cache = self.policy_cls(3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")
+        eq_(cache.set("d", 4), ["b"])
+
+
+class LFUPolicyTest(_PolicyTestSuite):
+    policy_cls = eviction.LFUPolicy
+
+    def test_evicts_least_frequent(self):
+        cache = self.policy_cls(3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")
+        cache.get("a")
+        cache.get("c")
+        eq_(cache.set("d", 4), ["b"])
+        eq_(cache.set("e", 5), ["d"])
+
+    def test_evict_after_pop_of_min_bucket(self):
+        cache = self.policy_cls(2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.set("b", 2)
+        cache.pop("b")
+        cache.set("c", 3)
+        cache.get("c")
+        eq_(cache.set("d", 4), ["a"])
+
+
+class ARCPolicyTest(_PolicyTestSuite):
+    policy_cls = eviction.ARCPolicy
+
+    def test_frequent_survives_scan(self):
+        cache = self.policy_cls(10)
+        for key in range(5):
+            cache.set(key, key)
+            cache.get(key)
+        for key in range(100, 200):
+            cache.set(key, key)
+        for key in range(5):
+            eq_(cache.get(key), key)
+
+
+class TinyLFUPolicyTest(_PolicyTestSuite):
+    policy_cls = eviction.TinyLFUPolicy
+
+    def test_bounded(self):
+        # the candidate itself may be rejected, so the number of
+        # evictions only matches the overflow, not the keys inserted
+        cache = self.policy_cls(50)
+        evicted = []
+        for i in range(500):
+            evicted.extend(cache.set(i, i))
+            assert len(cache) <= 50
+        eq_(len(cache), 50)
+        eq_(len(evicted), 450)
+
+    def test_frequent_survives_scan(self):
+        cache = self.policy_cls(100)
+        for key in range(20):
+            cache.set(key, key)
+            for _ in range(5):
+                cache.get(key)
+        for key in range(1000, 1300):
+            cache.get(key)
+            cache.set(key, key)
+        for key in range(20):
+            eq_(cache.get(key), key)
+
+
+class PolicyForNameTest:
+    @pytest.mark.parametrize("name", ["lru", "lfu", "arc", "tinylfu"])
+    def test_names(self, name):
+        eq_(eviction.policy_for_name(name).name, name)
+
+    @pytest.mark.parametrize("name", ["lru", "lfu"])
+    def test_weighted_names(self, name):
+        cls = eviction.policy_for_name(name, weighted=True)
+        assert issubclass(cls, eviction.policy_for_name(name))
+        assert cls.__name__.startswith("Weighted")
+
+    def test_class(self):
+        is_(eviction.policy_for_name(eviction.LRUPolicy), eviction.LRUPolicy)
+
+    def test_unknown(self):
+        assert_raises_message(
+            ValueError,
+            "Unknown eviction policy 'nope'",
+            eviction.policy_for_name,
+            "nope",
+        )
+
+    def test_capacity(self):
+        assert_raises_message(
+            ValueError,
+            "capacity must be a positive integer",
+            eviction.LRUPolicy,
+            0,
+        )
+
+
+class _WeightedPolicyTestSuite:
+    policy_cls: type
+
+    def test_weight_bound(self):
+        cache = self.policy_cls(100)
+        evicted = []
+        for i in range(50):
+            evicted.extend(cache.set(i, i, weight=(i % 7) + 1))
+            assert cache.weight <= 100
+        eq_(
+            cache.weight,
+            sum((key % 7) + 1 for key in range(50))
+            - sum((key % 7) + 1 for key in evicted),
+        )
+
+    def test_pop_and_replace(self):
+        cache = self.policy_cls(100)
+        cache.set("a", 1, weight=40)
+        cache.set("b", 2, weight=40)
+        cache.set("a", 3, weight=10)
+        eq_(cache.weight, 50)
+        cache.pop("b")
+        eq_(cache.weight, 10)
+        cache.clear()
+        eq_(cache.weight, 0)
+
+    def test_oversized(self):
+        cache = self.policy_cls(100)
+        cache.set("a", 1, weight=10)
+        eq_(cache.set("b", 2, weight=200), [])
+        eq_(cache.weight, 10)
+        eq_(cache.get("a"), 1)
+        assert "b" not in cache
+
+    def test_oversized_replaces_existing(self):
+        cache = self.policy_cls(100)
+        cache.set("a", 1, weight=10)
+        cache.set("b", 2, weight=20)
+        eq_(cache.set("b", 3, weight=200), ["b"])
+        eq_(cache.weight, 10)
+        eq_(cache.get("a"), 1)
+        assert "b" not in cache
+
+
+class WeightedLRUPolicyTest(_WeightedPolicyTestSuite):
+    policy_cls = eviction.WeightedLRUPolicy
+
+
+class WeightedLFUPolicyTest(_WeightedPolicyTestSuite):
+    policy_cls = eviction.WeightedLFUPolicy
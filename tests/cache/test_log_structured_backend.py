@@ -0,0 +1,272 @@
+import gc
+import multiprocessing
+import os
+import shutil
+import sys
+from unittest import mock
+
+import pytest
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends import log_structured
+from dogpile.cache.backends.log_structured import LogStructuredBackend
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+from dogpile.testing.fixtures import _GenericBackendTestSuite
+from dogpile.testing.fixtures import _GenericSerializerTestSuite
+
+try:
+    import fcntl  # noqa
+
+    has_fcntl = True
+except ImportError:
+    has_fcntl = False
+
+
+test_dirname = "test_%s.log" % sys.hexversion
+
+pytestmark = pytest.mark.skipif(not has_fcntl, reason="requires fcntl")
+
+
+def _set_in_child(backend, queue):
+    try:
+        backend.set_serialized("key", b"from child")
+    except RuntimeError as err:
+        queue.put(str(err))
+    else:
+        queue.put(None)
+
+
+class LogStructuredBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.log_structured"
+
+    config_args = {"arguments": {"directory": test_dirname}}
+
+    def teardown_method(self, method):
+        super().teardown_method(method)
+        # only one backend may use the directory at a time
+        if self._region_inst:
+            self._region_inst.backend.close()
+        elif self._backend_inst:
+            self._backend_inst.close()
+        # releases backends of regions created by the test itself, which
+        # are part of reference cycles
+        gc.collect()
+
+
+class LogStructuredBackendSerializerTest(
+    _GenericSerializerTestSuite, LogStructuredBackendTest
+):
+    pass
+
+
+class LogStructuredBackendBehaviorTest:
+    def _backend(self, tmp_path, **arguments):
+        return LogStructuredBackend(
+            {
+                "directory": str(tmp_path / "log"),
+                "compaction_interval": False,
+                **arguments,
+            }
+        )
+
+    def _data_files(self, backend):
+        return sorted(
+            name
+            for name in os.listdir(backend.directory)
+            if name.endswith(".data")
+        )
+
+    def test_values_survive_reopen(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized_multi({"k1": b"one", "k2": b"two"})
+        backend.set_serialized("k1", b"three")
+        backend.delete("k2")
+        backend.close()
+
+        backend = self._backend(tmp_path)
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"three", NO_VALUE])
+        backend.set_serialized("k3", b"four")
+        eq_(backend.get_serialized("k3"), b"four")
+
+    def test_reopen_uses_hint_files(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("key", b"value")
+        backend.close()
+
+        with mock.patch.object(
+            LogStructuredBackend, "_scan", side_effect=AssertionError
+        ):
+            backend = self._backend(tmp_path)
+        eq_(backend.get_serialized("key"), b"value")
+
+    def test_reopen_after_crash(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("k1", b"one")
+        backend.set_serialized("k2", b"two")
+        (data_file,) = self._data_files(backend)
+
+        # a crash leaves no hint file and may leave a partial record
+        path = os.path.join(backend.directory, data_file)
+        with open(path, "r+b") as file_:
+            file_.truncate(os.path.getsize(path) - 1)
+        del backend
+
+        backend = self._backend(tmp_path)
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"one", NO_VALUE])
+        backend.set_serialized("k2", b"three")
+        backend.close()
+
+        backend = self._backend(tmp_path)
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"one", b"three"])
+
+    def test_failed_write(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("k1", b"one")
+
+        def write_part(fd, data):
+            os.write(fd, data[0:10])
+            raise OSError("disk full")
+
+        with mock.patch.object(log_structured, "_write_all", write_part):
+            with pytest.raises(OSError):
+                backend.set_serialized_multi({"k1": b"two", "k2": b"three"})
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"one", NO_VALUE])
+        backend.set_serialized("k2", b"four")
+        backend.close()
+
+        backend = self._backend(tmp_path)
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"one", b"four"])
+
+    def test_segments_rolled(self, tmp_path):
+        backend = self._backend(tmp_path, segment_size=1000)
+        for i in range(100):
+            backend.set_serialized("key%d" % i, b"x" * 100)
+        eq_(len(self._data_files(backend)) > 10, True)
+        eq_(
+            backend.get_serialized_multi(["key0", "key99"]),
+            [b"x" * 100] * 2,
+        )
+
+    def test_compaction(self, tmp_path):
+        backend = self._backend(tmp_path, segment_size=1000)
+        for i in range(10):
+            backend.set_serialized_multi(
+                {"key%d" % j: b"%d" % i * 100 for j in range(10)}
+            )
+        backend.delete("key0")
+        size = sum(segment.size for segment in backend._segments.values())
+
+        backend.compact()
+        eq_(
+            sum(segment.size for segment in backend._segments.values())
+            < size / 5,
+            True,
+        )
+        eq_(
+            backend.get_serialized_multi(["key0", "key1", "key9"]),
+            [NO_VALUE, b"9" * 100, b"9" * 100],
+        )
+        backend.close()
+
+        backend = self._backend(tmp_path)
+        eq_(
+            backend.get_serialized_multi(["key0", "key1", "key9"]),
+            [NO_VALUE, b"9" * 100, b"9" * 100],
+        )
+
+    def test_write_during_compaction(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized_multi({"k1": b"one", "k2": b"two"})
+
+        write_file = log_structured._write_file
+
+        def write_during_compaction(path, data):
+            if path.endswith(log_structured._COMPACTION_FILE):
+                backend.set_serialized("k1", b"three")
+                backend.delete("k2")
+            write_file(path, data)
+
+        with mock.patch.object(
+            log_structured, "_write_file", write_during_compaction
+        ):
+            backend.compact()
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"three", NO_VALUE])
+        backend.close()
+
+        backend = self._backend(tmp_path)
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"three", NO_VALUE])
+
+    def test_interrupted_compaction_completed_on_reopen(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("k1", b"one")
+        backend.set_serialized("k2", b"two")
+        backend._roll()
+        backend.delete("k2")
+        merged = self._data_files(backend)
+
+        with mock.patch.object(
+            LogStructuredBackend,
+            "_remove_files",
+            side_effect=KeyboardInterrupt,
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                backend.compact()
+        eq_(set(merged) <= set(self._data_files(backend)), True)
+        backend.close()
+
+        backend = self._backend(tmp_path)
+        eq_(set(merged) & set(self._data_files(backend)), set())
+        eq_(backend.get_serialized_multi(["k1", "k2"]), [b"one", NO_VALUE])
+
+    def test_expiration(self, tmp_path):
+        backend = self._backend(tmp_path, expiration_time=10)
+        with mock.patch("time.time", return_value=1000.0):
+            backend.set_serialized("k1", b"one")
+        with mock.patch("time.time", return_value=1005.0):
+            backend.set_serialized("k2", b"two")
+        with mock.patch("time.time", return_value=1011.0):
+            eq_(backend.get_serialized_multi(["k1", "k2"]), [NO_VALUE, b"two"])
+            backend.compact()
+        eq_(list(backend._index), ["k2"])
+
+    def test_maybe_compact(self, tmp_path):
+        backend = self._backend(tmp_path, compaction_ratio=0.5)
+        backend.set_serialized_multi({"k1": b"x" * 100, "k2": b"x" * 100})
+        backend._roll()
+        with mock.patch.object(backend, "compact") as compact:
+            backend._maybe_compact()
+        eq_(compact.mock_calls, [])
+
+        backend.set_serialized("k1", b"y" * 100)
+        with mock.patch.object(backend, "compact") as compact:
+            backend._maybe_compact()
+        eq_(compact.mock_calls, [mock.call()])
+
+    def test_directory_locked(self, tmp_path):
+        backend = self._backend(tmp_path)
+        assert_raises_message(
+            RuntimeError,
+            "is in use by another process",
+            self._backend,
+            tmp_path,
+        )
+        backend.close()
+        self._backend(tmp_path)
+
+    def test_forked_process_cant_write(self, tmp_path):
+        backend = self._backend(tmp_path)
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(target=_set_in_child, args=(backend, queue))
+        process.start()
+        eq_(
+            queue.get(timeout=10),
+            "LogStructuredBackend can't be used by a forked process",
+        )
+        process.join()
+        eq_(backend.get_serialized("key"), NO_VALUE)
+
+
+def teardown_module():
+    shutil.rmtree(test_dirname, ignore_errors=True)
@@ -1,3 +1,13 @@
+import pickle
+import time
+from unittest import mock
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends import memory
+from dogpile.cache.backends.memory import ByteBoundedMemoryBackend
+from dogpile.cache.region import _backend_loader
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
 from dogpile.testing.fixtures import _GenericBackendTestSuite
 from dogpile.testing.fixtures import _GenericSerializerTestSuite
 
@@ -15,3 +25,323 @@ class MemoryBackendSerializerTest(
 
 class MemoryPickleBackendTest(MemoryBackendTest):
     backend = "dogpile.cache.memory_pickle"
+
+
+class MemoryPickleBackendBinaryMetadataTest(MemoryPickleBackendTest):
+    region_args = {"binary_metadata": True}
+
+
+class MemoryPickleBackendOutOfBandTest(MemoryPickleBackendTest):
+    config_args = {"arguments": {"out_of_band": True}}
+
+    def test_buffers_stored_separately(self):
+        reg = self._region()
+        memory = bytearray(b"x" * 10000)
+        reg.set("some key", {"array": pickle.PickleBuffer(memory)})
+        stored = reg.backend._cache["some key"]
+        eq_(len(stored.data) < 100, True)
+        eq_(stored.buffers, [b"x" * 10000])
+
+        memory[0:1] = b"y"
+        eq_(reg.get("some key"), {"array": b"x" * 10000})
+        eq_(reg.get("some key")["array"] is stored.buffers[0], True)
+        eq_(reg.get_multi(["some key"]), [{"array": b"x" * 10000}])
+
+
+class BoundedMemoryBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.memory_bounded"
+    config_args = {"arguments": {"max_entries": 1000}}
+
+    def test_max_entries(self):
+        backend = self._backend()
+        for i in range(1500):
+            backend.set("key%d" % i, i)
+        eq_(len(backend._cache), 1000)
+        eq_(backend.get("key1499"), 1499)
+        eq_(backend.get("key0"), NO_VALUE)
+
+    def test_multi(self):
+        backend = self._backend()
+        backend.set_multi({"a": 1, "b": 2, "c": 3})
+        eq_(backend.get_multi(["a", "x", "c"]), [1, NO_VALUE, 3])
+        backend.delete_multi(["a", "c", "x"])
+        eq_(backend.get_multi(["a", "b", "c"]), [NO_VALUE, 2, NO_VALUE])
+
+
+class BoundedMemoryBackendLFUTest(BoundedMemoryBackendTest):
+    config_args = {
+        "arguments": {"max_entries": 1000, "eviction_policy": "lfu"}
+    }
+
+
+class BoundedMemoryBackendARCTest(BoundedMemoryBackendTest):
+    config_args = {
+        "arguments": {"max_entries": 1000, "eviction_policy": "arc"}
+    }
+
+
+class BoundedMemoryBackendTinyLFUTest(BoundedMemoryBackendTest):
+    config_args = {
+        "arguments": {"max_entries": 1000, "eviction_policy": "tinylfu"}
+    }
+
+    def test_max_entries(self):
+        backend = self._backend()
+        for i in range(1500):
+            backend.set("key%d" % i, i)
+        eq_(len(backend._cache), 1000)
+
+
+class BoundedMemoryPickleBackendTest(BoundedMemoryBackendTest):
+    backend = "dogpile.cache.memory_bounded_pickle"
+
+
+class BoundedMemoryBackendSerializerTest(
+    _GenericSerializerTestSuite, BoundedMemoryBackendTest
+):
+    pass
+
+
+class ByteBoundedMemoryBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.memory_bytes_bounded"
+    config_args = {
+        "arguments": {
+            "max_bytes": 100000,
+            "weigher": lambda value: len(repr(value)),
+        }
+    }
+
+    def test_weigher_required(self):
+        assert_raises_message(
+            ValueError,
+            "The 'weigher' argument is required",
+            ByteBoundedMemoryBackend,
+            {"max_bytes": 1000},
+        )
+
+    def test_max_bytes(self):
+        backend = ByteBoundedMemoryBackend({"max_bytes": 1000, "weigher": len})
+        for i in range(10):
+            backend.set("key%d" % i, "x" * 300)
+        eq_(backend.current_bytes, 900)
+        eq_(backend.peak_bytes, 900)
+        eq_(backend.get("key0"), NO_VALUE)
+        eq_(backend.get("key9"), "x" * 300)
+
+        backend.delete_multi(["key7", "key8"])
+        eq_(backend.current_bytes, 300)
+        eq_(backend.peak_bytes, 900)
+
+        backend.set_multi({"a": "y" * 100, "b": "y" * 200})
+        eq_(backend.current_bytes, 600)
+
+    def test_oversized_value(self):
+        backend = ByteBoundedMemoryBackend({"max_bytes": 1000, "weigher": len})
+        backend.set("small", "x" * 10)
+        backend.set("big", "x" * 1001)
+        eq_(backend.get("big"), NO_VALUE)
+        eq_(backend.get("small"), "x" * 10)
+        eq_(backend.current_bytes, 10)
+
+    def test_replace_reweighs(self):
+        backend = ByteBoundedMemoryBackend(
+            {"max_bytes": 1000, "weigher": len, "eviction_policy": "lfu"}
+        )
+        backend.set("a", "x" * 500)
+        backend.set("a", "x" * 100)
+        eq_(backend.current_bytes, 100)
+
+
+class ByteBoundedMemoryPickleBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.memory_bytes_bounded_pickle"
+    config_args = {"arguments": {"max_bytes": 100000}}
+
+    def test_weighs_serialized_length(self):
+        reg = self._region()
+        reg.set("some key", "some value")
+        raw = reg.backend.get_serialized("some key")
+        eq_(reg.backend.current_bytes, len(raw))
+
+
+class _ExpiryTestSuite:
+    def _clock(self):
+        return mock.patch.object(
+            memory.time, "time", mock.Mock(return_value=1000.0)
+        )
+
+    def test_expired_on_get(self):
+        backend = self._backend()
+        with self._clock() as clock:
+            backend.set("a", 1)
+            backend.set_multi({"b": 2, "c": 3})
+            clock.return_value = 1009.0
+            eq_(backend.get_multi(["a", "b"]), [1, 2])
+            clock.return_value = 1010.0
+            eq_(backend.get("a"), NO_VALUE)
+            eq_(backend.get_multi(["b", "c"]), [NO_VALUE, NO_VALUE])
+        eq_(len(backend._cache), 0)
+
+    def test_reset_extends_deadline(self):
+        backend = self._backend()
+        with self._clock() as clock:
+            backend.set("a", 1)
+            clock.return_value = 1005.0
+            backend.set("a", 2)
+            clock.return_value = 1012.0
+            eq_(backend.get("a"), 2)
+            clock.return_value = 1015.0
+            eq_(backend.get("a"), NO_VALUE)
+
+    def test_reap_cold_keys_on_read(self):
+        backend = self._backend()
+        with self._clock() as clock:
+            for i in range(10):
+                backend.set("cold%d" % i, i)
+            clock.return_value = 1020.0
+            backend.set("hot", 1)
+            eq_(backend.get("hot"), 1)
+        eq_(len(backend._cache), 1)
+
+    def test_sweep(self):
+        backend = self._backend()
+        with self._clock() as clock:
+            for i in range(10):
+                backend.set("cold%d" % i, i)
+            backend.delete("cold0")
+            clock.return_value = 1020.0
+            backend.sweep()
+        eq_(len(backend._cache), 0)
+        eq_(backend._expiry._deadlines, {})
+
+    def test_sweeper_thread(self):
+        arguments = dict(self.config_args["arguments"])
+        arguments.update(expiration_time=0.01, sweep_interval=0.01)
+        backend = _backend_loader.load(self.backend)(arguments)
+        for i in range(10):
+            backend.set("cold%d" % i, i)
+        for _ in range(100):
+            if not len(backend._cache):
+                break
+            time.sleep(0.01)
+        eq_(len(backend._cache), 0)
+
+
+class MemoryBackendExpiryTest(_ExpiryTestSuite, MemoryBackendTest):
+    config_args = {"arguments": {"expiration_time": 10}}
+
+
+class BoundedMemoryBackendExpiryTest(
+    _ExpiryTestSuite, BoundedMemoryBackendTest
+):
+    config_args = {"arguments": {"max_entries": 1000, "expiration_time": 10}}
+
+    def test_evicted_keys_untracked(self):
+        backend = _backend_loader.load(self.backend)(
+            {"max_entries": 5, "expiration_time": 10}
+        )
+        for i in range(20):
+            backend.set("key%d" % i, i)
+        eq_(len(backend._expiry._deadlines), 5)
+
+
+class ByteBoundedMemoryPickleBackendExpiryTest(
+    ByteBoundedMemoryPickleBackendTest
+):
+    config_args = {"arguments": {"max_bytes": 100000, "expiration_time": 10}}
+
+    def test_expired_releases_bytes(self):
+        backend = self._backend()
+        with mock.patch.object(
+            memory.time, "time", mock.Mock(return_value=1000.0)
+        ) as clock:
+            backend.set("a", b"1")
+            eq_(backend.current_bytes, 1)
+            clock.return_value = 1010.0
+            eq_(backend.get("a"), NO_VALUE)
+        eq_(backend.current_bytes, 0)
+
+
+class ShardedMemoryBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.memory_sharded"
+    config_args = {"arguments": {"shards": 4}}
+
+    def test_keys_distributed(self):
+        backend = self._backend()
+        for i in range(100):
+            backend.set("key%d" % i, i)
+        eq_(sum(len(shard._cache) for shard in backend._shards), 100)
+        eq_(all(shard._cache for shard in backend._shards), True)
+
+    def test_multi_preserves_order(self):
+        backend = self._backend()
+        keys = ["key%d" % i for i in range(50)]
+        backend.set_multi({key: key.upper() for key in keys[::2]})
+        eq_(
+            backend.get_multi(keys),
+            [
+                key.upper() if i % 2 == 0 else NO_VALUE
+                for i, key in enumerate(keys)
+            ],
+        )
+        backend.delete_multi(keys[:10])
+        eq_(backend.get_multi(keys[:10]), [NO_VALUE] * 10)
+        eq_(backend.get(keys[10]), keys[10].upper())
+
+    def test_multi_touches_each_shard_once(self):
+        backend = self._backend()
+        keys = ["key%d" % i for i in range(100)]
+        for shard in backend._shards:
+            shard.get_multi = mock.Mock(side_effect=shard.get_multi)
+        backend.get_multi(keys)
+        for shard in backend._shards:
+            eq_(shard.get_multi.call_count, 1)
+
+
+class ShardedMemoryPickleBackendTest(ShardedMemoryBackendTest):
+    backend = "dogpile.cache.memory_sharded_pickle"
+
+
+class ShardedMemoryBackendSerializerTest(
+    _GenericSerializerTestSuite, ShardedMemoryBackendTest
+):
+    pass
+
+
+class BoundedShardedMemoryBackendTest(ShardedMemoryBackendTest):
+    config_args = {
+        "arguments": {
+            "shards": 4,
+            "max_entries": 1000,
+            "eviction_policy": "lfu",
+        }
+    }
+
+    def test_capacity_divided(self):
+        backend = _backend_loader.load(self.backend)(
+            {"shards": 4, "max_entries": 10}
+        )
+        for i in range(100):
+            backend.set("key%d" % i, i)
+        eq_([shard._cache.capacity for shard in backend._shards], [3] * 4)
+        eq_(sum(len(shard._cache) for shard in backend._shards) <= 12, True)
+
+    def test_expiration(self):
+        backend = _backend_loader.load(self.backend)(
+            {"shards": 4, "max_entries": 100, "expiration_time": 10}
+        )
+        with mock.patch.object(
+            memory.time, "time", mock.Mock(return_value=1000.0)
+        ) as clock:
+            for i in range(20):
+                backend.set("key%d" % i, i)
+            clock.return_value = 1020.0
+            backend.sweep()
+        eq_(sum(len(shard._cache) for shard in backend._shards), 0)
+
+    def test_invalid_shards(self):
+        assert_raises_message(
+            ValueError,
+            "shards must be a positive integer",
+            _backend_loader.load(self.backend),
+            {"shards": 0},
+        )
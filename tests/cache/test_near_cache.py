@@ -0,0 +1,175 @@
+import time
+from unittest import mock
+
+import pytest
+
+from dogpile.cache import make_region
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.near_cache import LocalSocketInvalidationBus
+from dogpile.cache.near_cache import NearCacheProxy
+from dogpile.testing import eq_
+
+
+def _wait_for(fn, timeout=5):
+    deadline = time.time() + timeout
+    while not fn():
+        if time.time() > deadline:
+            raise AssertionError("condition not met in %s seconds" % timeout)
+        time.sleep(0.01)
+
+
+class NearCacheProxyTest:
+    backend = "dogpile.cache.memory"
+
+    def _region(self, cache_dict, **proxy_args):
+        proxy = NearCacheProxy(**proxy_args)
+        region = make_region().configure(
+            self.backend,
+            arguments={"cache_dict": cache_dict},
+            wrap=[proxy],
+        )
+        return region, proxy
+
+    def test_reads_served_locally(self):
+        region, proxy = self._region({})
+        region.set("some key", "some value")
+        with (
+            mock.patch.object(
+                proxy.proxied, "get", side_effect=AssertionError
+            ),
+            mock.patch.object(
+                proxy.proxied, "get_serialized", side_effect=AssertionError
+            ),
+        ):
+            eq_(region.get("some key"), "some value")
+            eq_(region.get_multi(["some key"]), ["some value"])
+
+    def test_remote_hits_promoted(self):
+        remote = {}
+        writer, _ = self._region(remote)
+        writer.set("k1", "v1")
+        writer.set("k2", "v2")
+
+        reader, proxy = self._region(remote)
+        eq_(proxy.local.get("k1"), NO_VALUE)
+        eq_(reader.get("k1"), "v1")
+        eq_(reader.get_multi(["k1", "k2", "k3"]), ["v1", "v2", NO_VALUE])
+        assert proxy.local.get("k1") is not NO_VALUE
+        eq_(proxy.local.get("k3"), NO_VALUE)
+
+        # promoted values are read from memory
+        remote["k1"] = remote["k2"] = "changed"
+        eq_(reader.get_multi(["k1", "k2"]), ["v1", "v2"])
+
+    def test_delete(self):
+        region, proxy = self._region({})
+        region.set_multi({"k1": "v1", "k2": "v2", "k3": "v3"})
+        region.delete("k1")
+        region.delete_multi(["k2"])
+        eq_(region.get_multi(["k1", "k2", "k3"]), [NO_VALUE, NO_VALUE, "v3"])
+        eq_(proxy.local.get("k2"), NO_VALUE)
+
+    def test_max_entries(self):
+        region, proxy = self._region({}, max_entries=2)
+        region.set_multi({"k1": "v1", "k2": "v2", "k3": "v3"})
+        eq_(len(proxy.local._cache), 2)
+        eq_(region.get_multi(["k1", "k2", "k3"]), ["v1", "v2", "v3"])
+
+    def test_expiration_time(self):
+        remote = {}
+        region, proxy = self._region(remote, expiration_time=10)
+        with mock.patch("time.time", return_value=100):
+            region.set("some key", "some value")
+        remote.clear()
+        with mock.patch("time.time", return_value=105):
+            eq_(region.get("some key"), "some value")
+        with mock.patch("time.time", return_value=111):
+            eq_(region.get("some key"), NO_VALUE)
+
+    def test_publishes_changes(self):
+        bus = mock.Mock()
+        region, proxy = self._region({}, bus=bus)
+        region.set("k1", "v1")
+        region.set_multi({"k2": "v2", "k3": "v3"})
+        region.delete("k1")
+        region.delete_multi(["k2"])
+        eq_(
+            bus.publish.mock_calls,
+            [
+                mock.call(["k1"]),
+                mock.call(["k2", "k3"]),
+                mock.call(["k1"]),
+                mock.call(["k2"]),
+            ],
+        )
+        eq_(bus.subscribe.mock_calls, [mock.call(proxy.invalidate_local)])
+
+
+class NearCacheProxySerializedTest(NearCacheProxyTest):
+    backend = "dogpile.cache.memory_pickle"
+
+
+class LocalSocketInvalidationBusTest:
+    @pytest.fixture
+    def buses(self, tmp_path):
+        buses = [LocalSocketInvalidationBus(str(tmp_path)) for i in range(3)]
+        yield buses
+        for bus in buses:
+            bus.close()
+
+    def test_publish(self, buses):
+        received = [[] for bus in buses]
+        for bus, canary in zip(buses, received):
+            bus.subscribe(canary.extend)
+
+        buses[0].publish(["k1", "k2"])
+        _wait_for(lambda: received[1] and received[2])
+        eq_(received, [[], ["k1", "k2"], ["k1", "k2"]])
+
+    def test_closed_bus_skipped(self, buses, tmp_path):
+        received = []
+        buses[2].subscribe(received.extend)
+        buses[1].close()
+        eq_(len(list(tmp_path.iterdir())), 2)
+
+        buses[0].publish(["k1"])
+        _wait_for(lambda: received)
+        eq_(received, ["k1"])
+
+    def test_publish_large_batch(self, buses):
+        received = []
+        buses[1].subscribe(received.extend)
+        keys = ["key %d" % i for i in range(50000)]
+
+        buses[0].publish(keys)
+        _wait_for(lambda: len(received) >= len(keys))
+        eq_(received, keys)
+
+    def test_send_error_logged(self, buses):
+        sock = mock.Mock(sendto=mock.Mock(side_effect=[OSError(), None]))
+        with (
+            mock.patch.object(buses[0], "_socket", sock),
+            mock.patch("dogpile.cache.near_cache.log") as log,
+        ):
+            buses[0].publish(["k1"])
+        eq_(sock.sendto.call_count, 2)
+        eq_(log.warning.call_count, 1)
+
+    def test_invalidates_other_processes(self, buses):
+        remote = {}
+        regions = [
+            make_region().configure(
+                "dogpile.cache.memory_pickle",
+                arguments={"cache_dict": remote},
+                wrap=[NearCacheProxy(bus=bus)],
+            )
+            for bus in buses[0:2]
+        ]
+        regions[0].set("some key", "old value")
+        eq_(regions[1].get("some key"), "old value")
+
+        regions[0].set("some key", "new value")
+        _wait_for(lambda: regions[1].get("some key") == "new value")
+
+        regions[0].delete("some key")
+        _wait_for(lambda: regions[1].get("some key") is NO_VALUE)
@@ -1,3 +1,4 @@
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import os
 from threading import Event
@@ -9,6 +10,7 @@ import pytest
 
 from dogpile.cache.region import _backend_loader
 from dogpile.testing import eq_
+from dogpile.testing.fixtures import _GenericAsyncBackendTestSuite
 from dogpile.testing.fixtures import _GenericBackendFixture
 from dogpile.testing.fixtures import _GenericBackendTestSuite
 from dogpile.testing.fixtures import _GenericMutexTestSuite
@@ -140,6 +142,55 @@ class RedisAsyncCreationTest(_TestRedisConn, _GenericBackendFixture):
 
 
 @patch("redis.StrictRedis", autospec=True)
+class _TestAsyncRedisConn:
+    @classmethod
+    def _check_backend_available(cls, backend):
+        async def go():
+            try:
+                await backend.set_serialized("x", b"y")
+                assert await backend.get_serialized("x") == b"y"
+                await backend.delete("x")
+            finally:
+                await backend.writer_client.aclose()
+
+        try:
+            asyncio.run(go())
+        except Exception:
+            if not expect_redis_running:
+                pytest.skip(
+                    "redis is not running or "
+                    "otherwise not functioning correctly"
+                )
+            else:
+                raise
+
+    async def _close_backend(self, backend):
+        await backend.writer_client.aclose()
+
+
+class AsyncRedisTest(_TestAsyncRedisConn, _GenericAsyncBackendTestSuite):
+    backend = "dogpile.cache.redis_async"
+    config_args = {
+        "arguments": {
+            "host": REDIS_HOST,
+            "port": REDIS_PORT,
+            "db": 0,
+        }
+    }
+
+
+class AsyncRedisDistributedMutexTest(AsyncRedisTest):
+    config_args = {
+        "arguments": {
+            "host": REDIS_HOST,
+            "port": REDIS_PORT,
+            "db": 0,
+            "distributed_lock": True,
+            "thread_local_lock": False,
+        }
+    }
+
+
 class RedisConnectionTest:
     backend = "dogpile.cache.redis"
 
@@ -3,6 +3,10 @@ import configparser
 import datetime
 import io
 import itertools
+import json
+import pickle
+import struct
+import threading
 import time
 from unittest import mock
 
@@ -11,8 +15,10 @@ from dogpile.cache import exception
 from dogpile.cache import make_region
 from dogpile.cache import util
 from dogpile.cache.api import CacheBackend
+from dogpile.cache.api import CachedMetadata
 from dogpile.cache.api import CachedValue
 from dogpile.cache.api import CacheMutex
+from dogpile.cache.api import CantDeserializeException
 from dogpile.cache.api import NO_VALUE
 from dogpile.cache.proxy import ProxyBackend
 from dogpile.cache.region import _backend_loader
@@ -33,6 +39,123 @@ class APITest:
         eq_(str(NO_VALUE), "NoValue.NO_VALUE")
 
 
+class CachedMetadataTest:
+    def test_mapping(self):
+        metadata = CachedMetadata(100.5, 2)
+        eq_(metadata["ct"], 100.5)
+        eq_(metadata["v"], 2)
+        eq_(metadata.get("nx"), None)
+        eq_(list(metadata), ["ct", "v"])
+        eq_(len(metadata), 2)
+        eq_(metadata, {"ct": 100.5, "v": 2})
+        eq_(repr(metadata), "{'ct': 100.5, 'v': 2}")
+
+    def test_extra(self):
+        metadata = CachedMetadata(100.5, 2, {"d": 0.25})
+        eq_(metadata["d"], 0.25)
+        eq_(len(metadata), 3)
+        eq_(metadata.as_dict(), {"ct": 100.5, "v": 2, "d": 0.25})
+
+    def test_pickles_as_dict(self):
+        metadata = pickle.loads(pickle.dumps(CachedMetadata(100.5, 2)))
+        is_(type(metadata), dict)
+        eq_(metadata, {"ct": 100.5, "v": 2})
+
+    def test_cached_value_accessors(self):
+        with mock.patch("dogpile.cache.api.time.time", return_value=105.5):
+            value = CachedValue("payload", CachedMetadata(100.5, 2))
+            eq_(value.cached_time, 100.5)
+            eq_(value.age, 5)
+
+    def test_region_value(self):
+        reg = make_region().configure("dogpile.cache.memory")
+        reg.set("some key", "some value")
+        value = reg.backend.get("some key")
+        is_(type(value.metadata), CachedMetadata)
+        eq_(value.metadata["v"], value_version)
+
+    def test_region_serialized(self):
+        reg = make_region().configure("dogpile.cache.memory_pickle")
+        reg.get_or_create("some key", lambda: "some value")
+        metadata = reg.backend.get("some key").partition(b"|")[0]
+        eq_(set(json.loads(metadata)), {"ct", "v"})
+
+
+class BinaryMetadataTest:
+    def _region(self, **init_args):
+        return make_region(**init_args).configure(
+            "dogpile.cache.memory_pickle"
+        )
+
+    def test_binary_header(self):
+        reg = self._region(binary_metadata=True)
+        with mock.patch("dogpile.cache.region.time.time", return_value=100.5):
+            reg.set("some key", "some value")
+        stored = reg.backend.get("some key")
+        eq_(stored[0:4], b"\xd0\x01\x02\x00")
+        eq_(pickle.loads(stored[12:]), "some value")
+
+        value = reg.get_value_metadata("some key")
+        eq_(value.payload, "some value")
+        eq_(value.cached_time, 100.5)
+        eq_(value.metadata, {"ct": 100.5, "v": value_version})
+
+    def test_reads_either_format(self):
+        json_reg = self._region()
+        binary_reg = self._region(binary_metadata=True)
+        binary_reg.backend = json_reg.backend
+
+        json_reg.set("json key", "json value")
+        binary_reg.set("binary key", "binary value")
+        for reg in (json_reg, binary_reg):
+            eq_(
+                reg.get_multi(["json key", "binary key"]),
+                ["json value", "binary value"],
+            )
+
+    def test_unknown_format_version(self):
+        reg = self._region(binary_metadata=True)
+        reg.set("some key", "some value")
+        stored = reg.backend.get("some key")
+        reg.backend.set("some key", stored[0:1] + b"\x02" + stored[2:])
+
+        eq_(reg.get("some key"), NO_VALUE)
+        eq_(reg.get_multi(["some key"]), [NO_VALUE])
+        eq_(reg.get_or_create("some key", lambda: "new value"), "new value")
+
+    def test_extensions(self):
+        reg = self._region(binary_metadata=True)
+        fields = {"x": (200, struct.Struct("<q"))}
+        with (
+            mock.patch.dict(
+                "dogpile.cache.region._binary_metadata_extensions", fields
+            ),
+            mock.patch.dict(
+                "dogpile.cache.region._binary_metadata_tags",
+                {200: ("x", fields["x"][1])},
+            ),
+        ):
+            reg._set_cached_value_to_backend(
+                "some key",
+                CachedValue(
+                    "some value",
+                    CachedMetadata(
+                        100.5, 2, {"d": 0.25, "x": 5, "other": [1]}
+                    ),
+                ),
+            )
+            eq_(
+                reg.get_value_metadata("some key").metadata,
+                {"ct": 100.5, "v": 2, "d": 0.25, "x": 5, "other": [1]},
+            )
+
+        # unknown extensions are skipped
+        eq_(
+            reg.get_value_metadata("some key").metadata,
+            {"ct": 100.5, "v": 2, "d": 0.25, "other": [1]},
+        )
+
+
 class RegionTest:
     def _region(self, init_args={}, config_args={}, backend="mock"):
         reg = CacheRegion(**init_args)
@@ -673,6 +796,542 @@ class MutexAPITest:
         assert isinstance(Foo(), CacheMutex)
 
 
+class LazyDeserializationTest:
+    def _region(self, **init_args):
+        self.deserializer = mock.Mock(side_effect=pickle.loads)
+        return make_region(
+            deserializer=self.deserializer, **init_args
+        ).configure("dogpile.cache.memory_pickle", expiration_time=10)
+
+    def test_get_expired_not_deserialized(self):
+        reg = self._region()
+        with mock.patch("time.time", return_value=100):
+            reg.set("some key", "some value")
+        with mock.patch("time.time", return_value=105):
+            eq_(reg.get("some key"), "some value")
+            eq_(reg.get_multi(["some key"]), ["some value"])
+        eq_(self.deserializer.call_count, 2)
+
+        with mock.patch("time.time", return_value=120):
+            eq_(reg.get("some key"), NO_VALUE)
+            eq_(reg.get_multi(["some key"]), [NO_VALUE])
+            eq_(reg.get_value_metadata("some key"), None)
+        eq_(self.deserializer.call_count, 2)
+
+    def test_get_or_create_invalidated_not_deserialized(self):
+        reg = self._region()
+        reg.set("some key", "some value")
+        reg.set("other key", "other value")
+        reg.invalidate()
+        eq_(reg.get_or_create("some key", lambda: "new value"), "new value")
+        eq_(
+            reg.get_or_create_multi(
+                ["other key"], lambda *keys: ["new other value"]
+            ),
+            ["new other value"],
+        )
+        eq_(self.deserializer.call_count, 0)
+
+    def test_get_or_create_fresh_deserialized(self):
+        reg = self._region()
+        reg.set("some key", "some value")
+        eq_(reg.get_or_create("some key", lambda: "new value"), "some value")
+        eq_(
+            reg.get_or_create_multi(["some key"], lambda *keys: ["new value"]),
+            ["some value"],
+        )
+        eq_(self.deserializer.call_count, 2)
+
+    def test_get_or_create_expired_returned(self):
+        def async_creation_runner(cache, somekey, creator, mutex):
+            mutex.release()
+
+        reg = self._region(async_creation_runner=async_creation_runner)
+        with mock.patch("time.time", return_value=100):
+            reg.set("some key", "some value")
+        with mock.patch("time.time", return_value=120):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"),
+                "some value",
+            )
+        eq_(self.deserializer.call_count, 1)
+
+    def test_get_or_create_expired_cant_deserialize(self):
+        def async_creation_runner(cache, somekey, creator, mutex):
+            mutex.release()
+
+        reg = self._region(async_creation_runner=async_creation_runner)
+        self.deserializer.side_effect = CantDeserializeException
+        with mock.patch("time.time", return_value=100):
+            reg.set("some key", "some value")
+            reg.set("other key", "other value")
+        with mock.patch("time.time", return_value=120):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"),
+                "new value",
+            )
+            eq_(
+                reg.get_or_create_multi(
+                    ["other key"], lambda *keys: ["new other value"]
+                ),
+                ["new other value"],
+            )
+
+    def test_get_or_create_multi_expired_cant_deserialize(self):
+        reg = self._region()
+        self.deserializer.side_effect = CantDeserializeException
+        with mock.patch("time.time", return_value=100):
+            reg.set("some key", "some value")
+
+        # another thread is generating the value
+        mutex = reg._mutex("some key")
+        mutex.acquire()
+        threading.Timer(0.1, mutex.release).start()
+
+        with mock.patch("time.time", return_value=120):
+            eq_(
+                reg.get_or_create_multi(
+                    ["some key"], lambda *keys: ["new value"]
+                ),
+                ["new value"],
+            )
+
+
+class GetOrCreateFastPathTest:
+    def _region(self, **init_args):
+        return make_region(**init_args).configure(
+            "dogpile.cache.memory", expiration_time=10
+        )
+
+    def test_hit_skips_lock(self):
+        reg = self._region()
+        reg.set("some key", "some value")
+        with (
+            mock.patch.object(
+                reg.backend, "get", wraps=reg.backend.get
+            ) as get,
+            mock.patch.object(reg, "_mutex", side_effect=AssertionError),
+            mock.patch(
+                "dogpile.cache.region.Lock", side_effect=AssertionError
+            ),
+        ):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"),
+                "some value",
+            )
+        eq_(get.mock_calls, [mock.call("some key")])
+
+    def test_expired_value_read_once(self):
+        reg = self._region()
+        with mock.patch("time.time", return_value=100):
+            reg.set("some key", "some value")
+        with (
+            mock.patch("time.time", return_value=111),
+            mock.patch.object(
+                reg.backend, "get", wraps=reg.backend.get
+            ) as get,
+        ):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"), "new value"
+            )
+        # the value read by the fast path is passed on to the lock
+        eq_(get.mock_calls, [mock.call("some key")])
+
+    def test_missing_value_read_again_under_mutex(self):
+        reg = self._region()
+        with mock.patch.object(
+            reg.backend, "get", wraps=reg.backend.get
+        ) as get:
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"), "new value"
+            )
+        eq_(get.mock_calls, [mock.call("some key"), mock.call("some key")])
+
+    def test_invalidated_value_regenerated(self):
+        reg = self._region()
+        reg.set("some key", "some value")
+        reg.invalidate()
+        eq_(reg.get_or_create("some key", lambda: "new value"), "new value")
+
+
+class EarlyExpirationTest:
+    def _region(self, **init_args):
+        return make_region(**init_args).configure(
+            "dogpile.cache.memory", expiration_time=10
+        )
+
+    def _set(self, reg, key, value, duration):
+        reg._set_cached_value_to_backend(
+            key,
+            CachedValue(
+                value, CachedMetadata(100, value_version, {"d": duration})
+            ),
+        )
+
+    def test_duration_not_stored_by_default(self):
+        reg = self._region()
+        reg.get_or_create("some key", lambda: "some value")
+        eq_(reg.get_value_metadata("some key").metadata.get("d"), None)
+
+    def test_duration_stored(self):
+        reg = self._region(early_expiration_beta=1.0)
+        reg.get_or_create("some key", lambda: "some value")
+        reg.get_or_create_multi(
+            ["k1", "k2"], lambda *keys: ["v%s" % key for key in keys]
+        )
+        reg.set("other key", "other value")
+        for key in ("some key", "k1", "k2"):
+            assert reg.get_value_metadata(key).metadata["d"] >= 0
+        eq_(reg.get_value_metadata("other key").metadata.get("d"), None)
+
+    def test_early_expiration(self):
+        reg = self._region(early_expiration_beta=1.0)
+        self._set(reg, "some key", "old value", 2.0)
+        with mock.patch("time.time", return_value=105):
+            # 105 - 2.0 * log(0.5) < 110
+            with mock.patch("random.random", side_effect=[0.5, 0.95]):
+                eq_(
+                    reg.get_or_create("some key", lambda: "new value"),
+                    "old value",
+                )
+            # 105 - 2.0 * log(0.05) >= 110
+            with mock.patch(
+                "random.random", side_effect=[0.95, 0.5]
+            ) as random:
+                eq_(
+                    reg.get_or_create("some key", lambda: "new value"),
+                    "new value",
+                )
+            # the decision is drawn once per call
+            eq_(random.call_count, 1)
+
+    def test_early_expiration_multi(self):
+        reg = self._region(early_expiration_beta=1.0)
+        self._set(reg, "k1", "old 1", 2.0)
+        self._set(reg, "k2", "old 2", 0.1)
+        with (
+            mock.patch("time.time", return_value=105),
+            mock.patch("random.random", return_value=0.95),
+        ):
+            eq_(
+                reg.get_or_create_multi(
+                    ["k1", "k2"], lambda *keys: ["new %s" % k for k in keys]
+                ),
+                ["new k1", "old 2"],
+            )
+
+    def test_no_early_expiration_without_beta(self):
+        reg = self._region()
+        self._set(reg, "some key", "old value", 2.0)
+        with (
+            mock.patch("time.time", return_value=105),
+            mock.patch("random.random", return_value=0.95),
+        ):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"),
+                "old value",
+            )
+
+    def test_no_early_expiration_without_expiration_time(self):
+        reg = make_region(early_expiration_beta=1.0).configure(
+            "dogpile.cache.memory"
+        )
+        self._set(reg, "some key", "old value", 2.0)
+        with (
+            mock.patch("time.time", return_value=105),
+            mock.patch("random.random", return_value=0.999),
+        ):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"),
+                "old value",
+            )
+
+
+class StaleOnErrorTest:
+    def _region(self, backend="dogpile.cache.memory", **init_args):
+        init_args.setdefault("stale_on_error", 100)
+        reg = make_region(**init_args).configure(backend, expiration_time=10)
+        with mock.patch("time.time", return_value=100):
+            reg.set("some key", "old value")
+        return reg
+
+    def _failing_creator(self):
+        return mock.Mock(side_effect=Exception("boom"))
+
+    def test_returns_stale_value(self):
+        reg = self._region()
+        creator = self._failing_creator()
+        with mock.patch("time.time", return_value=120):
+            eq_(reg.get_or_create("some key", creator), "old value")
+            value = reg.get_value_metadata("some key", ignore_expiration=True)
+        eq_(creator.call_count, 1)
+        eq_(value.payload, "old value")
+        eq_(
+            value.metadata, {"ct": 100, "v": value_version, "rf": 1, "rt": 121}
+        )
+
+    def test_retry_backoff(self):
+        reg = self._region()
+        creator = self._failing_creator()
+        with mock.patch("time.time", return_value=120):
+            eq_(reg.get_or_create("some key", creator), "old value")
+
+        # the failed regeneration isn't retried until the retry time
+        with mock.patch("time.time", return_value=120.5):
+            eq_(reg.get_or_create("some key", creator), "old value")
+        eq_(creator.call_count, 1)
+
+        with mock.patch("time.time", return_value=121):
+            eq_(reg.get_or_create("some key", creator), "old value")
+            value = reg.get_value_metadata("some key", ignore_expiration=True)
+        eq_(creator.call_count, 2)
+        eq_((value.metadata["rf"], value.metadata["rt"]), (2, 123))
+
+        with mock.patch("time.time", return_value=123):
+            eq_(reg.get_or_create("some key", creator), "old value")
+            value = reg.get_value_metadata("some key", ignore_expiration=True)
+        eq_(creator.call_count, 3)
+        eq_((value.metadata["rf"], value.metadata["rt"]), (3, 127))
+
+        # a successful regeneration replaces the failure marker
+        with mock.patch("time.time", return_value=127):
+            eq_(
+                reg.get_or_create("some key", lambda: "new value"),
+                "new value",
+            )
+            value = reg.get_value_metadata("some key")
+        eq_(value.metadata, {"ct": 127, "v": value_version})
+
+    def test_max_retry(self):
+        reg = self._region(stale_on_error_retry=5, stale_on_error_max_retry=8)
+        creator = self._failing_creator()
+        for now, retry_time in ((120, 125), (125, 133), (133, 141)):
+            with mock.patch("time.time", return_value=now):
+                eq_(reg.get_or_create("some key", creator), "old value")
+                value = reg.get_value_metadata(
+                    "some key", ignore_expiration=True
+                )
+            eq_(value.metadata["rt"], retry_time)
+
+    def test_max_staleness(self):
+        reg = self._region()
+        with mock.patch("time.time", return_value=210):
+            eq_(
+                reg.get_or_create("some key", self._failing_creator()),
+                "old value",
+            )
+
+        # the deferred retry is no longer honored past the maximum
+        # staleness either
+        creator = self._failing_creator()
+        with mock.patch("time.time", return_value=210.5):
+            assert_raises_message(
+                Exception, "boom", reg.get_or_create, "some key", creator
+            )
+        eq_(creator.call_count, 1)
+
+    def test_no_value_raises(self):
+        reg = self._region()
+        assert_raises_message(
+            Exception,
+            "boom",
+            reg.get_or_create,
+            "other key",
+            self._failing_creator(),
+        )
+
+    def test_hard_invalidated_raises(self):
+        reg = self._region()
+        reg.invalidate()
+        assert_raises_message(
+            Exception,
+            "boom",
+            reg.get_or_create,
+            "some key",
+            self._failing_creator(),
+        )
+
+    def test_soft_invalidated_returns_stale_value(self):
+        reg = self._region()
+        with mock.patch("time.time", return_value=105):
+            reg.invalidate(hard=False)
+        with mock.patch("time.time", return_value=106):
+            eq_(
+                reg.get_or_create("some key", self._failing_creator()),
+                "old value",
+            )
+
+    def test_disabled_by_default(self):
+        reg = self._region(stale_on_error=None)
+        with mock.patch("time.time", return_value=120):
+            assert_raises_message(
+                Exception,
+                "boom",
+                reg.get_or_create,
+                "some key",
+                self._failing_creator(),
+            )
+
+    def test_get_or_create_argument(self):
+        reg = self._region(stale_on_error=None)
+        with mock.patch("time.time", return_value=120):
+            eq_(
+                reg.get_or_create(
+                    "some key", self._failing_creator(), stale_on_error=20
+                ),
+                "old value",
+            )
+
+    def test_decorator(self):
+        reg = make_region().configure(
+            "dogpile.cache.memory", expiration_time=10
+        )
+        results = ["old value"]
+
+        @reg.cache_on_arguments(stale_on_error=20)
+        def go(x):
+            if not results:
+                raise Exception("boom")
+            return results.pop()
+
+        with mock.patch("time.time", return_value=100):
+            eq_(go(1), "old value")
+        with mock.patch("time.time", return_value=120):
+            eq_(go(1), "old value")
+        with mock.patch("time.time", return_value=131):
+            assert_raises_message(Exception, "boom", go, 1)
+
+    def test_binary_metadata(self):
+        reg = self._region(
+            backend="dogpile.cache.memory_pickle", binary_metadata=True
+        )
+        with mock.patch("time.time", return_value=120):
+            eq_(
+                reg.get_or_create("some key", self._failing_creator()),
+                "old value",
+            )
+            value = reg.get_value_metadata("some key", ignore_expiration=True)
+        eq_(
+            value.metadata, {"ct": 100, "v": value_version, "rf": 1, "rt": 121}
+        )
+
+
+class NegativeCachingTest:
+    def _region(self, backend="dogpile.cache.memory", **init_args):
+        return make_region(**init_args).configure(backend, expiration_time=100)
+
+    def _creator(self, *values):
+        return mock.Mock(side_effect=list(values))
+
+    def _is_none(self, value):
+        return value is None
+
+    def test_negative_metadata(self):
+        reg = self._region()
+        reg.get_or_create("some key", lambda: None, negative_fn=self._is_none)
+        reg.get_or_create("other key", lambda: 5, negative_fn=self._is_none)
+        eq_(reg.get_value_metadata("some key").metadata.get("nx"), 1)
+        eq_(reg.get_value_metadata("other key").metadata.get("nx"), None)
+
+    def test_negative_expiration_time(self):
+        reg = self._region()
+        creator = self._creator(None, "value")
+
+        def go():
+            return reg.get_or_create(
+                "some key",
+                creator,
+                negative_fn=self._is_none,
+                negative_expiration_time=10,
+            )
+
+        with mock.patch("time.time", return_value=100):
+            eq_(go(), None)
+        with mock.patch("time.time", return_value=110):
+            eq_(go(), None)
+        eq_(creator.call_count, 1)
+
+        with mock.patch("time.time", return_value=111):
+            eq_(go(), "value")
+        eq_(creator.call_count, 2)
+
+    def test_positive_values_use_expiration_time(self):
+        reg = self._region(negative_expiration_time=10)
+        creator = self._creator("value", "new value")
+        with mock.patch("time.time", return_value=100):
+            reg.get_or_create("some key", creator, negative_fn=self._is_none)
+        with mock.patch("time.time", return_value=150):
+            eq_(
+                reg.get_or_create(
+                    "some key", creator, negative_fn=self._is_none
+                ),
+                "value",
+            )
+        eq_(creator.call_count, 1)
+
+    def test_region_negative_expiration_time(self):
+        reg = self._region(negative_expiration_time=10)
+        creator = self._creator(None, "value")
+        with mock.patch("time.time", return_value=100):
+            reg.get_or_create("some key", creator, negative_fn=self._is_none)
+        with mock.patch("time.time", return_value=111):
+            eq_(
+                reg.get_or_create(
+                    "some key", creator, negative_fn=self._is_none
+                ),
+                "value",
+            )
+
+    def test_no_expiration_time(self):
+        reg = make_region(negative_expiration_time=10).configure(
+            "dogpile.cache.memory"
+        )
+        creator = self._creator(None, "value")
+        with mock.patch("time.time", return_value=100):
+            reg.get_or_create("some key", creator, negative_fn=self._is_none)
+        with mock.patch("time.time", return_value=111):
+            eq_(
+                reg.get_or_create(
+                    "some key", creator, negative_fn=self._is_none
+                ),
+                "value",
+            )
+
+    def test_decorator(self):
+        reg = self._region()
+        canary = []
+
+        @reg.cache_on_arguments(
+            negative_fn=lambda value: not value, negative_expiration_time=10
+        )
+        def go(x):
+            canary.append(x)
+            return []
+
+        with mock.patch("time.time", return_value=100):
+            eq_(go(1), [])
+            eq_(go(1), [])
+        with mock.patch("time.time", return_value=111):
+            eq_(go(1), [])
+        eq_(canary, [1, 1])
+
+    def test_binary_metadata(self):
+        reg = self._region(
+            backend="dogpile.cache.memory_pickle", binary_metadata=True
+        )
+        with mock.patch("time.time", return_value=100.5):
+            reg.get_or_create(
+                "some key", lambda: None, negative_fn=self._is_none
+            )
+        eq_(reg.backend.get("some key")[0:4], b"\xd0\x01\x02\x01")
+        eq_(
+            reg.get_value_metadata(
+                "some key", ignore_expiration=True
+            ).metadata,
+            {"ct": 100.5, "v": value_version, "nx": 1},
+        )
+
+
 class AsyncCreatorTest:
     def _fixture(self):
         def async_creation_runner(cache, somekey, creator, mutex):
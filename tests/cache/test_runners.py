@@ -0,0 +1,157 @@
+import threading
+
+import pytest
+
+from dogpile.cache import make_region
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.runners import ThreadPoolCreationRunner
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+
+
+class ThreadPoolCreationRunnerTest:
+    def _fixture(self, **kw):
+        runner = ThreadPoolCreationRunner(**kw)
+        region = make_region(async_creation_runner=runner).configure(
+            "dogpile.cache.memory", expiration_time=300
+        )
+        return runner, region
+
+    def _blocking_creator(self, value):
+        started = threading.Event()
+        proceed = threading.Event()
+
+        def creator():
+            started.set()
+            proceed.wait(5)
+            return value
+
+        return creator, started, proceed
+
+    def test_invalid_on_saturated(self):
+        assert_raises_message(
+            ValueError,
+            "on_saturated must be one of 'stale' or 'sync'; got 'nope'",
+            ThreadPoolCreationRunner,
+            on_saturated="nope",
+        )
+
+    def test_regenerates_in_background(self):
+        runner, region = self._fixture()
+        region.set("some key", "old value")
+        region.invalidate(hard=False)
+
+        creator, started, proceed = self._blocking_creator("new value")
+        eq_(region.get_or_create("some key", creator), "old value")
+        started.wait(5)
+        eq_(runner.in_flight, 1)
+        eq_(region.key_is_locked("some key"), True)
+
+        # the regeneration is in progress; the old value is returned
+        eq_(region.get_or_create("some key", creator), "old value")
+
+        proceed.set()
+        runner.shutdown()
+        eq_(runner.in_flight, 0)
+        eq_(runner.queue_length, 0)
+        eq_(region.key_is_locked("some key"), False)
+        eq_(region.get("some key"), "new value")
+
+    def test_mutex_released_on_error(self):
+        runner, region = self._fixture()
+        region.set("some key", "old value")
+        region.invalidate(hard=False)
+
+        def creator():
+            raise Exception("boom")
+
+        eq_(region.get_or_create("some key", creator), "old value")
+        runner.shutdown()
+        eq_(region.key_is_locked("some key"), False)
+        eq_(region.get("some key", ignore_expiration=True), "old value")
+
+    def test_pending_key_not_queued_again(self):
+        runner = ThreadPoolCreationRunner()
+        region = make_region().configure("dogpile.cache.memory")
+        creator, started, proceed = self._blocking_creator("new value")
+
+        first, second = threading.Lock(), threading.Lock()
+        first.acquire()
+        second.acquire()
+        runner(region, "some key", creator, first)
+        started.wait(5)
+        runner(region, "some key", creator, second)
+
+        # the second regeneration is skipped and its mutex released
+        eq_(second.locked(), False)
+        eq_(runner.in_flight, 1)
+
+        proceed.set()
+        runner.shutdown()
+        eq_(first.locked(), False)
+
+    @pytest.mark.parametrize("on_saturated", ["stale", "sync"])
+    def test_saturated(self, on_saturated):
+        runner = ThreadPoolCreationRunner(
+            max_workers=1, max_queue=1, on_saturated=on_saturated
+        )
+        region = make_region().configure("dogpile.cache.memory")
+        creator, started, proceed = self._blocking_creator("value")
+
+        mutexes = [threading.Lock() for i in range(3)]
+        for mutex in mutexes:
+            mutex.acquire()
+
+        # one regeneration running, one queued
+        runner(region, "key 1", creator, mutexes[0])
+        started.wait(5)
+        runner(region, "key 2", creator, mutexes[1])
+        eq_((runner.in_flight, runner.queue_length), (1, 1))
+
+        runner(region, "key 3", lambda: "value 3", mutexes[2])
+        eq_(mutexes[2].locked(), False)
+        if on_saturated == "sync":
+            eq_(region.get("key 3"), "value 3")
+        else:
+            eq_(region.get("key 3"), NO_VALUE)
+
+        proceed.set()
+        runner.shutdown()
+        eq_([mutex.locked() for mutex in mutexes], [False, False, False])
+        eq_(region.get_multi(["key 1", "key 2"]), ["value", "value"])
+
+    @pytest.mark.parametrize("on_saturated", ["stale", "sync"])
+    def test_saturated_caller_receives_expired_value(self, on_saturated):
+        runner, region = self._fixture(
+            max_workers=1, max_queue=1, on_saturated=on_saturated
+        )
+        region.set("key 1", "old value")
+        region.set("key 2", "old value")
+        region.set("key 3", "old value")
+        region.invalidate(hard=False)
+
+        creator, started, proceed = self._blocking_creator("new value")
+        eq_(region.get_or_create("key 1", creator), "old value")
+        started.wait(5)
+        eq_(region.get_or_create("key 2", creator), "old value")
+        eq_((runner.in_flight, runner.queue_length), (1, 1))
+
+        calling_thread = []
+
+        def saturated_creator():
+            calling_thread.append(threading.current_thread())
+            return "new value 3"
+
+        eq_(region.get_or_create("key 3", saturated_creator), "old value")
+        if on_saturated == "sync":
+            # regenerated in the calling thread, for the next request
+            eq_(calling_thread, [threading.current_thread()])
+            eq_(
+                region.get_or_create("key 3", saturated_creator), "new value 3"
+            )
+        else:
+            eq_(calling_thread, [])
+            eq_(region.get_or_create("key 3", saturated_creator), "old value")
+
+        proceed.set()
+        runner.shutdown()
@@ -0,0 +1,252 @@
+import dataclasses
+import marshal
+import pickle
+from typing import NamedTuple
+from unittest import mock
+
+import pytest
+
+from dogpile.cache import make_region
+from dogpile.cache.api import CantDeserializeException
+from dogpile.cache.exception import ValidationError
+from dogpile.cache.serializers import _codecs_by_id
+from dogpile.cache.serializers import _codecs_by_name
+from dogpile.cache.serializers import Codec
+from dogpile.cache.serializers import dumps_out_of_band
+from dogpile.cache.serializers import get_codec
+from dogpile.cache.serializers import JSONCodec
+from dogpile.cache.serializers import loads_out_of_band
+from dogpile.cache.serializers import MsgpackCodec
+from dogpile.cache.serializers import pickle_buffers
+from dogpile.cache.serializers import PickleCodec
+from dogpile.cache.serializers import register_codec
+from dogpile.cache.serializers import StructCodec
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+
+
+class _Buffered:
+    """An object which provides its memory as an out-of-band buffer, in the
+    same way as a NumPy array."""
+
+    def __init__(self, memory):
+        self.memory = memory
+
+    def __reduce_ex__(self, protocol):
+        return _Buffered, (pickle.PickleBuffer(self.memory),)
+
+    def __eq__(self, other):
+        return bytes(self.memory) == bytes(other.memory)
+
+
+class OutOfBandTest:
+    def test_pickle_buffers(self):
+        value = {"a": _Buffered(bytearray(b"x" * 1000)), "b": [1, 2, 3]}
+        data, buffers = pickle_buffers(value)
+        eq_(len(data) < 100, True)
+        eq_([buffer.tobytes() for buffer in buffers], [b"x" * 1000])
+        eq_(pickle.loads(data, buffers=buffers), value)
+
+    def test_round_trip(self):
+        value = {
+            "a": _Buffered(b"x" * 1000),
+            "b": _Buffered(bytearray(b"y" * 10)),
+            "c": "some value",
+        }
+        eq_(loads_out_of_band(dumps_out_of_band(value)), value)
+
+    def test_round_trip_no_buffers(self):
+        eq_(loads_out_of_band(dumps_out_of_band([1, "two"])), [1, "two"])
+
+    def test_loads_refers_to_data(self):
+        data = dumps_out_of_band(_Buffered(b"x" * 1000))
+        value = loads_out_of_band(data)
+        eq_(value.memory.obj, data)
+        eq_(value.memory.readonly, True)
+
+    def test_not_out_of_band(self):
+        assert_raises_message(
+            CantDeserializeException,
+            "",
+            loads_out_of_band,
+            pickle.dumps("some value"),
+        )
+
+    def test_region(self):
+        reg = make_region(
+            serializer=dumps_out_of_band, deserializer=loads_out_of_band
+        ).configure("dogpile.cache.memory_pickle")
+        reg.set("some key", _Buffered(b"x" * 1000))
+        eq_(reg.get("some key"), _Buffered(b"x" * 1000))
+
+
+@dataclasses.dataclass
+class _User:
+    id: int
+    name: str
+    tags: list
+
+
+class _Point(NamedTuple):
+    x: float
+    y: float
+
+
+class CodecTest:
+    @pytest.fixture(autouse=True)
+    def _restore_registry(self):
+        with (
+            mock.patch.dict(_codecs_by_name),
+            mock.patch.dict(_codecs_by_id),
+        ):
+            yield
+
+    @pytest.mark.parametrize(
+        "codec",
+        [PickleCodec(), PickleCodec(protocol=2), JSONCodec(), MsgpackCodec()],
+    )
+    def test_round_trip(self, codec):
+        if isinstance(codec, MsgpackCodec):
+            pytest.importorskip("msgpack")
+        value = {"a": [1, 2.5, "three", None, True], "b": {"c": "d"}}
+        eq_(codec.loads(codec.dumps(value)), value)
+
+    def test_json_without_orjson(self):
+        with mock.patch.dict("sys.modules", {"orjson": None}):
+            codec = JSONCodec()
+        eq_(codec.dumps({"a": [1, 2]}), b'{"a":[1,2]}')
+        eq_(codec.loads(b'{"a":[1,2]}'), {"a": [1, 2]})
+
+    def test_struct(self):
+        codec = StructCodec([_User, _Point])
+        for value in [
+            _User(5, "some user", ["a", "b"]),
+            _Point(1.5, 2.5),
+            [_Point(1, 2), _Point(3, 4)],
+            [_Point(1, 2), "not a point"],
+            [_Point(1, 2), _Point],
+            _User(5, "some user", [_Point]),
+            {"some": "dict"},
+            [],
+        ]:
+            eq_(codec.loads(codec.dumps(value)), value)
+
+    def test_struct_unknown_type(self):
+        data = StructCodec([_User]).dumps(_User(5, "some user", []))
+        assert_raises_message(
+            CantDeserializeException, "", StructCodec([_Point]).loads, data
+        )
+        assert_raises_message(
+            CantDeserializeException,
+            "",
+            StructCodec([_Point]).loads,
+            marshal.dumps("not a struct value"),
+        )
+
+    def test_registry(self):
+        eq_(get_codec("json").id, 2)
+        eq_(get_codec(2).name, "json")
+
+        codec = StructCodec([_Point])
+        register_codec(codec)
+        assert get_codec("struct") is codec
+        assert get_codec(4) is codec
+
+        class Other(PickleCodec):
+            name = "other"
+
+        assert_raises_message(
+            ValueError,
+            "Codec id 1 is already used by codec 'pickle'",
+            register_codec,
+            Other(),
+        )
+
+    def _region(self, cache_dict, codec, **init_args):
+        return make_region(codec=codec, **init_args).configure(
+            "dogpile.cache.memory_pickle", arguments={"cache_dict": cache_dict}
+        )
+
+    @pytest.mark.parametrize("binary_metadata", [False, True])
+    def test_region_change_codec(self, binary_metadata):
+        cache_dict = {}
+        reg = self._region(
+            cache_dict, "pickle", binary_metadata=binary_metadata
+        )
+        reg.set("k1", {"a": 1})
+        eq_(reg.get("k1"), {"a": 1})
+
+        reg = self._region(cache_dict, "json", binary_metadata=binary_metadata)
+        eq_(reg.get("k1"), {"a": 1})
+        reg.set("k2", {"b": 2})
+        eq_(reg.get_multi(["k1", "k2"]), [{"a": 1}, {"b": 2}])
+        eq_(
+            reg.get_or_create("k2", lambda: "new value"),
+            {"b": 2},
+        )
+
+        reg = self._region(cache_dict, PickleCodec())
+        eq_(reg.get("k2"), {"b": 2})
+
+    def test_region_without_codec_values(self):
+        cache_dict = {}
+        make_region().configure(
+            "dogpile.cache.memory_pickle", arguments={"cache_dict": cache_dict}
+        ).set("k1", ("a", "tuple"))
+
+        reg = self._region(cache_dict, "json")
+        eq_(reg.get("k1"), ("a", "tuple"))
+
+    @pytest.mark.parametrize("binary_metadata", [False, True])
+    def test_region_codec_removed(self, binary_metadata):
+        cache_dict = {}
+        self._region(cache_dict, "json", binary_metadata=binary_metadata).set(
+            "k1", {"a": 1}
+        )
+
+        reg = make_region(binary_metadata=binary_metadata).configure(
+            "dogpile.cache.memory_pickle", arguments={"cache_dict": cache_dict}
+        )
+        eq_(reg.get("k1"), {"a": 1})
+        reg.set("k2", {"b": 2})
+        eq_(reg.get_multi(["k1", "k2"]), [{"a": 1}, {"b": 2}])
+
+    def test_region_unknown_codec(self):
+        class Custom(PickleCodec):
+            name = "custom"
+            id = 200
+
+        cache_dict = {}
+        register_codec(Custom())
+        self._region(cache_dict, "custom").set("k1", "value")
+        del _codecs_by_id[200]
+
+        reg = self._region(cache_dict, "json")
+        eq_(reg.get("k1").__class__.__name__, "NoValue")
+        eq_(reg.get_or_create("k1", lambda: "new value"), "new value")
+
+    def test_region_custom_codec(self):
+        class Reversed(Codec):
+            name = "reversed"
+            id = 201
+
+            def dumps(self, value):
+                return value.encode("utf-8")[::-1]
+
+            def loads(self, data):
+                return data[::-1].decode("utf-8")
+
+        cache_dict = {}
+        reg = self._region(cache_dict, Reversed())
+        reg.set("k1", "value")
+        assert cache_dict["k1"].endswith(b"eulav")
+        eq_(reg.get("k1"), "value")
+
+    def test_region_serializer_conflict(self):
+        assert_raises_message(
+            ValidationError,
+            "codec can't be combined with serializer or deserializer",
+            make_region,
+            codec="json",
+            serializer=pickle.dumps,
+        )
@@ -0,0 +1,244 @@
+import multiprocessing
+import os
+import sys
+import threading
+
+import pytest
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends.shared_memory import _hash
+from dogpile.cache.backends.shared_memory import _SLOT
+from dogpile.cache.backends.shared_memory import SharedMemoryBackend
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+from dogpile.testing.fixtures import _GenericBackendTestSuite
+from dogpile.testing.fixtures import _GenericMutexTestSuite
+from dogpile.testing.fixtures import _GenericSerializerTestSuite
+
+try:
+    import fcntl  # noqa
+
+    has_fcntl = True
+except ImportError:
+    has_fcntl = False
+
+
+test_fname = "test_%s.shm" % sys.hexversion
+
+pytestmark = pytest.mark.skipif(not has_fcntl, reason="requires fcntl")
+
+
+def _set_in_child(filename, key, value):
+    SharedMemoryBackend({"filename": filename}).set_serialized(key, value)
+
+
+def _hold_mutex_in_child(filename, key, acquired, release):
+    mutex = SharedMemoryBackend({"filename": filename}).get_mutex(key)
+    mutex.acquire()
+    acquired.set()
+    release.wait(10)
+    mutex.release()
+
+
+class SharedMemoryBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.shared_memory"
+
+    config_args = {"arguments": {"filename": test_fname}}
+
+
+class SharedMemoryBackendSerializerTest(
+    _GenericSerializerTestSuite, SharedMemoryBackendTest
+):
+    pass
+
+
+class SharedMemoryMutexTest(_GenericMutexTestSuite):
+    backend = "dogpile.cache.shared_memory"
+
+    config_args = {"arguments": {"filename": test_fname}}
+
+
+class SharedMemoryBackendBehaviorTest:
+    def _backend(self, tmp_path, **arguments):
+        return SharedMemoryBackend(
+            {"filename": str(tmp_path / "cache.shm"), **arguments}
+        )
+
+    def test_ring_buffer_evicts_oldest(self, tmp_path):
+        backend = self._backend(tmp_path, size=4096, slots=64)
+        for i in range(100):
+            backend.set_serialized("key%d" % i, b"x" * 100)
+        eq_(backend.get_serialized("key0"), NO_VALUE)
+        eq_(backend.get_serialized("key99"), b"x" * 100)
+        head, tail, live, used = backend._read_header()
+        eq_(head - tail <= 4096, True)
+        eq_(
+            live,
+            sum(
+                backend.get_serialized("key%d" % i) is not NO_VALUE
+                for i in range(100)
+            ),
+        )
+
+    def test_slot_limit_evicts_oldest(self, tmp_path):
+        backend = self._backend(tmp_path, slots=16)
+        for i in range(100):
+            backend.set_serialized("key%d" % i, b"value")
+        eq_(backend._read_header()[2], 12)
+        eq_(backend.get_serialized("key87"), NO_VALUE)
+        eq_(backend.get_serialized("key88"), b"value")
+
+    def test_deleted_slots_reused(self, tmp_path):
+        backend = self._backend(tmp_path, slots=16)
+        for i in range(100):
+            backend.set_serialized("key%d" % i, b"value")
+            backend.delete("key%d" % i)
+        eq_(backend._read_header()[2], 0)
+        eq_(backend._read_header()[3] < 12, True)
+
+    def test_replace_value(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("key", b"one")
+        backend.set_serialized("key", b"two")
+        eq_(backend.get_serialized("key"), b"two")
+        eq_(backend._read_header()[2], 1)
+
+    def test_oversized_value_not_stored(self, tmp_path):
+        backend = self._backend(tmp_path, size=1024)
+        backend.set_serialized("key", b"small")
+        backend.set_serialized("key", b"x" * 2048)
+        eq_(backend.get_serialized("key"), NO_VALUE)
+
+    def test_hash_uses_all_slots_and_stripes(self, tmp_path):
+        backend = self._backend(tmp_path, slots=64, lock_stripes=8)
+        hashes = [_hash(b"key%d" % i) for i in range(1000)]
+        assert all(key_hash > 1 for key_hash in hashes)
+        eq_({key_hash & backend._mask for key_hash in hashes}, set(range(64)))
+        eq_(
+            {key_hash % len(backend._dogpile_locks) for key_hash in hashes},
+            set(range(8)),
+        )
+
+    def test_torn_slot_is_miss(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("key", b"value")
+        index, record = backend._find(b"key", _hash(b"key"))
+        offset, length = _SLOT.unpack_from(
+            backend._mm, backend._slot_base + index * _SLOT.size
+        )[1:]
+
+        # a slot read part way through an update pairs the offset of one
+        # record with the length of another
+        backend._set_slot(index, _hash(b"key"), offset, length + 3)
+        eq_(backend.get_serialized("key"), NO_VALUE)
+        backend._set_slot(index, _hash(b"key"), offset, length)
+        eq_(backend.get_serialized("key"), b"value")
+
+    def test_close(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("key", b"value")
+        backend.close()
+        backend.close()
+        eq_(backend._mm.closed, True)
+        assert_raises_message(
+            OSError, "Bad file descriptor", os.fstat, backend._fd
+        )
+        eq_(self._backend(tmp_path).get_serialized("key"), b"value")
+
+    def test_close_keeps_file_open_for_other_backends(self, tmp_path):
+        backend = self._backend(tmp_path)
+        other = self._backend(tmp_path)
+        other.close()
+        os.fstat(backend._fd)
+        backend.set_serialized("key", b"value")
+        eq_(backend.get_serialized("key"), b"value")
+
+    def test_backends_in_one_process_share_locks(self, tmp_path):
+        one, two = self._backend(tmp_path), self._backend(tmp_path)
+        assert one._write_lock is two._write_lock
+
+        mutex = one.get_mutex("key")
+        assert mutex.acquire(False)
+        try:
+            result = []
+            thread = threading.Thread(
+                target=lambda: result.append(
+                    two.get_mutex("key").acquire(False)
+                )
+            )
+            thread.start()
+            thread.join()
+            eq_(result, [False])
+        finally:
+            mutex.release()
+
+    def test_concurrent_writes_from_two_backends(self, tmp_path):
+        backends = [
+            self._backend(tmp_path, size=65536, slots=256),
+            self._backend(tmp_path),
+        ]
+
+        def write(backend, name):
+            for i in range(500):
+                backend.set_serialized(
+                    "%s%d" % (name, i % 50), b"%s %d" % (name.encode(), i)
+                )
+
+        threads = [
+            threading.Thread(target=write, args=(backend, name))
+            for backend, name in zip(backends, ("a", "b"))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for backend in backends:
+            eq_(
+                backend.get_serialized_multi(
+                    ["a%d" % i for i in range(50)]
+                    + ["b%d" % i for i in range(50)]
+                ),
+                [b"a %d" % (450 + i) for i in range(50)]
+                + [b"b %d" % (450 + i) for i in range(50)],
+            )
+        eq_(backends[0]._read_header()[2], 100)
+
+    def test_existing_file_geometry_used(self, tmp_path):
+        self._backend(tmp_path, size=8192, slots=32)
+        backend = self._backend(tmp_path, size=1024, slots=1024)
+        eq_((backend._size, backend._slots), (8192, 32))
+
+    def test_shared_between_processes(self, tmp_path):
+        backend = self._backend(tmp_path)
+        process = multiprocessing.get_context("fork").Process(
+            target=_set_in_child,
+            args=(backend.filename, "key", b"from child"),
+        )
+        process.start()
+        process.join()
+        eq_(backend.get_serialized("key"), b"from child")
+
+    def test_mutex_shared_between_processes(self, tmp_path):
+        backend = self._backend(tmp_path)
+        context = multiprocessing.get_context("fork")
+        acquired, release = context.Event(), context.Event()
+        process = context.Process(
+            target=_hold_mutex_in_child,
+            args=(backend.filename, "key", acquired, release),
+        )
+        process.start()
+        try:
+            assert acquired.wait(10)
+            mutex = backend.get_mutex("key")
+            assert not mutex.acquire(False)
+        finally:
+            release.set()
+            process.join()
+        assert mutex.acquire(False)
+        mutex.release()
+
+
+def teardown_module():
+    for fname in os.listdir(os.curdir):
+        if fname.startswith(test_fname):
+            os.unlink(fname)
@@ -0,0 +1,185 @@
+import multiprocessing
+import os
+import sys
+import threading
+from unittest import mock
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends.sqlite import SQLiteBackend
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+from dogpile.testing.fixtures import _GenericBackendTestSuite
+from dogpile.testing.fixtures import _GenericSerializerTestSuite
+
+test_fname = "test_%s.sqlite" % sys.hexversion
+
+
+def _set_in_child(backend, key, value):
+    # uses the backend inherited from the parent, which must open a new
+    # connection
+    backend.set_serialized(key, value)
+
+
+class SQLiteBackendTest(_GenericBackendTestSuite):
+    backend = "dogpile.cache.sqlite"
+
+    config_args = {"arguments": {"filename": test_fname}}
+
+
+class SQLiteBackendSerializerTest(
+    _GenericSerializerTestSuite, SQLiteBackendTest
+):
+    pass
+
+
+class SQLiteBackendBehaviorTest:
+    def _backend(self, tmp_path, **arguments):
+        return SQLiteBackend(
+            {"filename": str(tmp_path / "cache.sqlite"), **arguments}
+        )
+
+    def test_wal_mode(self, tmp_path):
+        backend = self._backend(tmp_path)
+        eq_(
+            backend._connection().execute("PRAGMA journal_mode").fetchone(),
+            ("wal",),
+        )
+
+    def test_invalid_table_name(self, tmp_path):
+        assert_raises_message(
+            ValueError,
+            "Invalid table name",
+            self._backend,
+            tmp_path,
+            table='x"; DROP TABLE y; --',
+        )
+
+    def test_tables_independent(self, tmp_path):
+        one = self._backend(tmp_path, table="one")
+        two = self._backend(tmp_path, table="two")
+        one.set_serialized("key", b"one")
+        eq_(two.get_serialized("key"), NO_VALUE)
+
+    def test_multi(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized_multi(
+            {"key%d" % i: b"value%d" % i for i in range(1200)}
+        )
+        keys = ["key%d" % i for i in range(0, 1300, 2)] + ["key0"]
+        eq_(
+            backend.get_serialized_multi(keys),
+            [
+                b"value%d" % i if i < 1200 else NO_VALUE
+                for i in range(0, 1300, 2)
+            ]
+            + [b"value0"],
+        )
+        backend.delete_multi(keys)
+        eq_(backend.get_serialized("key0"), NO_VALUE)
+        eq_(backend.get_serialized("key1"), b"value1")
+
+    def test_expired_row_is_miss(self, tmp_path):
+        backend = self._backend(tmp_path, expiration_time=10)
+        with mock.patch("time.time", return_value=1000.0):
+            backend.set_serialized_multi({"k1": b"one", "k2": b"two"})
+        with mock.patch("time.time", return_value=1009.0):
+            eq_(backend.get_serialized("k1"), b"one")
+        with mock.patch("time.time", return_value=1011.0):
+            eq_(backend.get_serialized("k1"), NO_VALUE)
+            eq_(backend.get_serialized_multi(["k1", "k2"]), [NO_VALUE] * 2)
+
+    def test_expired_rows_purged_incrementally(self, tmp_path):
+        backend = self._backend(tmp_path, expiration_time=10)
+        backend._purge_batch = 5
+        with mock.patch("time.time", return_value=1000.0):
+            backend.set_serialized_multi(
+                {"key%d" % i: b"value" for i in range(12)}
+            )
+
+        def rows():
+            return (
+                backend._connection()
+                .execute("SELECT count(*) FROM dogpile_cache")
+                .fetchone()[0]
+            )
+
+        with mock.patch("time.time", return_value=1011.0):
+            backend.set_serialized("new1", b"value")
+            eq_(rows(), 8)
+            backend.set_serialized("new2", b"value")
+            eq_(rows(), 4)
+            backend.sweep()
+            eq_(rows(), 2)
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path):
+        backend = self._backend(tmp_path, max_entries=3, touch_interval=5)
+        with mock.patch("time.time", return_value=1000.0):
+            backend.set_serialized_multi({"k1": b"1", "k2": b"2", "k3": b"3"})
+        with mock.patch("time.time", return_value=1010.0):
+            eq_(backend.get_serialized("k1"), b"1")
+            eq_(backend.get_serialized_multi(["k2"]), [b"2"])
+        with mock.patch("time.time", return_value=1020.0):
+            backend.set_serialized("k4", b"4")
+        eq_(
+            backend.get_serialized_multi(["k1", "k2", "k3", "k4"]),
+            [b"1", b"2", NO_VALUE, b"4"],
+        )
+
+    def test_read_within_touch_interval_not_written(self, tmp_path):
+        backend = self._backend(tmp_path, max_entries=3, touch_interval=60)
+        with mock.patch("time.time", return_value=1000.0):
+            backend.set_serialized("k1", b"1")
+        with (
+            mock.patch("time.time", return_value=1030.0),
+            mock.patch.object(backend, "_touch_rows") as touch_rows,
+        ):
+            backend.get_serialized("k1")
+            backend.get_serialized_multi(["k1"])
+        eq_(touch_rows.mock_calls, [mock.call([], 1030.0)])
+
+    def test_row_count_maintained(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized_multi({"k1": b"1", "k2": b"2"})
+
+        backend = self._backend(tmp_path, max_entries=10)
+        backend.set_serialized_multi({"k2": b"2", "k3": b"3"})
+        backend.delete("k1")
+        backend.delete("nonexistent")
+        eq_(
+            backend._connection()
+            .execute("SELECT n FROM dogpile_cache_count")
+            .fetchone(),
+            (2,),
+        )
+
+    def test_connection_per_thread(self, tmp_path):
+        backend = self._backend(tmp_path)
+        connections = []
+
+        def run():
+            backend.set_serialized("key", b"value")
+            connections.append(backend._connection())
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        assert connections[0] is not backend._connection()
+        eq_(backend.get_serialized("key"), b"value")
+
+    def test_shared_between_processes(self, tmp_path):
+        backend = self._backend(tmp_path)
+        backend.set_serialized("key", b"from parent")
+        process = multiprocessing.get_context("fork").Process(
+            target=_set_in_child,
+            args=(backend, "key", b"from child"),
+        )
+        process.start()
+        process.join()
+        eq_(process.exitcode, 0)
+        eq_(backend.get_serialized("key"), b"from child")
+
+
+def teardown_module():
+    for fname in os.listdir(os.curdir):
+        if fname.startswith(test_fname):
+            os.unlink(fname)
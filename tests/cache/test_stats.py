@@ -0,0 +1,226 @@
+import threading
+from unittest import mock
+
+from dogpile.cache import make_region
+from dogpile.cache.region import _TimedMutex
+from dogpile.cache.stats import CacheStats
+from dogpile.cache.stats import Histogram
+from dogpile.cache.stats import OpenTelemetryObserver
+from dogpile.testing import assert_raises_message
+from dogpile.testing import eq_
+
+
+def _counters(stats, region, namespace=None):
+    return {
+        name: stats.counter(name, region, namespace)
+        for name in (
+            "hits",
+            "negative_hits",
+            "misses",
+            "regenerations",
+            "regeneration_errors",
+        )
+        if stats.counter(name, region, namespace)
+    }
+
+
+class HistogramTest:
+    def test_cumulative_counts(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        eq_(
+            histogram.cumulative_counts(),
+            [(0.1, 2), (1.0, 3), (float("inf"), 4)],
+        )
+        eq_(histogram.count, 4)
+        eq_(histogram.sum, 2.65)
+
+
+class CacheStatsTest:
+    def _region(self, backend="dogpile.cache.memory", **init_args):
+        self.stats = CacheStats()
+        return make_region(
+            "some region", stats=self.stats, **init_args
+        ).configure(backend)
+
+    def test_get(self):
+        region = self._region()
+        region.set("k1", "v1")
+        region.get("k1")
+        region.get("k2")
+        region.get_multi(["k1", "k2", "k3"])
+        eq_(_counters(self.stats, "some region"), {"hits": 2, "misses": 3})
+
+    def test_get_or_create(self):
+        region = self._region()
+        region.get_or_create("k1", lambda: "v1")
+        region.get_or_create("k1", lambda: "v1")
+        region.get_or_create(
+            "k2", lambda: None, negative_fn=lambda value: value is None
+        )
+        region.get_or_create(
+            "k2", lambda: None, negative_fn=lambda value: value is None
+        )
+        eq_(
+            _counters(self.stats, "some region"),
+            {"hits": 2, "negative_hits": 1, "misses": 2, "regenerations": 2},
+        )
+        eq_(self.stats.histogram("creator_seconds", "some region").count, 2)
+
+    def test_get_or_create_multi(self):
+        region = self._region()
+        region.set("k1", "v1")
+        region.get_or_create_multi(
+            ["k1", "k2", "k3"], lambda *keys: ["v" for key in keys]
+        )
+        eq_(
+            _counters(self.stats, "some region"),
+            {"hits": 1, "misses": 2, "regenerations": 1},
+        )
+
+    def test_regeneration_error(self):
+        region = self._region()
+
+        def creator(*keys):
+            raise Exception("boom")
+
+        assert_raises_message(
+            Exception, "boom", region.get_or_create, "k1", creator
+        )
+        assert_raises_message(
+            Exception, "boom", region.get_or_create_multi, ["k1"], creator
+        )
+        eq_(
+            _counters(self.stats, "some region"),
+            {"regenerations": 2, "regeneration_errors": 2},
+        )
+
+    def test_decorator_namespace(self):
+        region = self._region()
+
+        @region.cache_on_arguments()
+        def go(x):
+            return x
+
+        @region.cache_multi_on_arguments(namespace="ns")
+        def go_multi(*xs):
+            return xs
+
+        go(1)
+        go(1)
+        go_multi(1, 2)
+        go_multi(1, 3)
+        eq_(
+            _counters(self.stats, "some region", "%s:go" % __name__),
+            {"hits": 1, "misses": 1, "regenerations": 1},
+        )
+        eq_(
+            _counters(self.stats, "some region", "%s:go_multi|ns" % __name__),
+            {"hits": 1, "misses": 3, "regenerations": 2},
+        )
+        eq_(_counters(self.stats, "some region"), {})
+
+    def test_serialization(self):
+        region = self._region(backend="dogpile.cache.memory_pickle")
+        region.set("k1", "v1")
+        region.get("k1")
+        size = len(region.backend.get_serialized("k1"))
+        eq_(self.stats.counter("bytes_written", "some region"), size)
+        eq_(self.stats.counter("bytes_read", "some region"), size)
+        eq_(self.stats.histogram("serialize_seconds", "some region").count, 1)
+        eq_(
+            self.stats.histogram("deserialize_seconds", "some region").count,
+            1,
+        )
+
+    def test_mutex_wait(self):
+        region = self._region()
+        creating = threading.Event()
+        proceed = threading.Event()
+
+        def creator():
+            creating.set()
+            proceed.wait(5)
+            return "v1"
+
+        thread = threading.Thread(
+            target=region.get_or_create, args=("k1", creator)
+        )
+        thread.start()
+        creating.wait(5)
+        threading.Timer(0.1, proceed.set).start()
+        eq_(region.get_or_create("k1", creator), "v1")
+        thread.join(5)
+
+        histogram = self.stats.histogram("mutex_wait_seconds", "some region")
+        eq_(histogram.count, 2)
+        assert histogram.sum >= 0.05
+
+    def test_disabled(self):
+        region = make_region().configure("dogpile.cache.memory")
+        assert type(region._mutex("k1")) is not _TimedMutex
+
+    def test_prometheus_text(self):
+        stats = CacheStats(buckets=(0.5,))
+        stats.record_hits("r1", None, 3, 1)
+        stats.record_misses("r1", 'ns "x"', 2)
+        stats.record_regeneration("r1", None, 0.25)
+        stats.record_regeneration("r1", None, 1.0, failed=True)
+        text = stats.prometheus_text()
+        for line in [
+            "# TYPE dogpile_cache_hits_total counter",
+            'dogpile_cache_hits_total{region="r1",namespace=""} 3',
+            'dogpile_cache_negative_hits_total{region="r1",namespace=""} 1',
+            'dogpile_cache_misses_total{region="r1",namespace="ns \\"x\\""} 2',
+            'dogpile_cache_regeneration_errors_total{region="r1",'
+            'namespace=""} 1',
+            "# TYPE dogpile_cache_creator_seconds histogram",
+            'dogpile_cache_creator_seconds_bucket{region="r1",namespace="",'
+            'le="0.5"} 1',
+            'dogpile_cache_creator_seconds_bucket{region="r1",namespace="",'
+            'le="+Inf"} 2',
+            'dogpile_cache_creator_seconds_sum{region="r1",namespace=""} 1.25',
+            'dogpile_cache_creator_seconds_count{region="r1",namespace=""} 2',
+        ]:
+            assert line in text.splitlines(), line
+        assert text.endswith("\n")
+
+
+class OpenTelemetryObserverTest:
+    def test_records(self):
+        meter = mock.Mock()
+        instruments = {}
+
+        def create(name, unit, description):
+            instruments[name] = mock.Mock()
+            return instruments[name]
+
+        meter.create_counter.side_effect = create
+        meter.create_histogram.side_effect = create
+
+        region = make_region(
+            "some region", stats=OpenTelemetryObserver(meter)
+        ).configure("dogpile.cache.memory")
+        region.get_or_create("k1", lambda: "v1")
+        region.get_or_create("k1", lambda: "v1")
+
+        attributes = {"region": "some region", "namespace": ""}
+        eq_(
+            instruments["dogpile.cache.hits"].add.mock_calls,
+            [mock.call(1, attributes)],
+        )
+        eq_(
+            instruments["dogpile.cache.misses"].add.mock_calls,
+            [mock.call(1, attributes)],
+        )
+        eq_(
+            instruments["dogpile.cache.regenerations"].add.mock_calls,
+            [mock.call(1, attributes)],
+        )
+        eq_(
+            len(
+                instruments["dogpile.cache.creator_seconds"].record.mock_calls
+            ),
+            1,
+        )
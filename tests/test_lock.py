@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 import math
@@ -7,6 +8,7 @@ from unittest import mock
 
 import pytest
 
+from dogpile import AsyncLock
 from dogpile import Lock
 from dogpile import NeedRegenerationException
 from dogpile.testing import eq_
@@ -323,3 +325,94 @@ class RaceConditionTest:
                 eq_(entered_value, "the value")
 
         eq_(value_and_created_fn.call_count, 1)
+
+
+class _AsyncMutex:
+    def __init__(self):
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, wait=True):
+        if not wait and self.lock.locked():
+            return False
+        await self.lock.acquire()
+        return True
+
+    async def release(self):
+        self.lock.release()
+
+
+class AsyncLockTest:
+    def _cache(self, expiretime=None):
+        cache = {}
+        canary = []
+
+        async def creator():
+            canary.append(1)
+            await asyncio.sleep(0.05)
+            cache["value"] = ("value %d" % len(canary), time.time())
+            return cache["value"]
+
+        async def value_and_created_fn():
+            if "value" not in cache:
+                raise NeedRegenerationException()
+            return cache["value"]
+
+        async def get(mutex):
+            async with AsyncLock(
+                mutex, creator, value_and_created_fn, expiretime
+            ) as value:
+                return value
+
+        return cache, canary, get
+
+    def test_single_creation(self):
+        cache, canary, get = self._cache()
+
+        async def go():
+            mutex = _AsyncMutex()
+            return await asyncio.gather(*[get(mutex) for i in range(10)])
+
+        eq_(asyncio.run(go()), ["value 1"] * 10)
+        eq_(len(canary), 1)
+
+    def test_expired_value_returned_while_creating(self):
+        cache, canary, get = self._cache(expiretime=10)
+        cache["value"] = ("old value", time.time() - 20)
+
+        async def go():
+            mutex = _AsyncMutex()
+            return await asyncio.gather(*[get(mutex) for i in range(5)])
+
+        eq_(sorted(asyncio.run(go())), ["old value"] * 4 + ["value 1"])
+        eq_(len(canary), 1)
+
+    def test_async_creator(self):
+        cache, canary, get = self._cache(expiretime=10)
+        cache["value"] = ("old value", time.time() - 20)
+        released = []
+
+        async def async_creator(mutex):
+            released.append(mutex)
+            await mutex.release()
+
+        async def go():
+            mutex = _AsyncMutex()
+            async with AsyncLock(
+                mutex,
+                None,
+                lambda: asyncio.sleep(0, cache["value"]),
+                10,
+                async_creator,
+            ) as value:
+                return value, mutex
+
+        value, mutex = asyncio.run(go())
+        eq_(value, "old value")
+        eq_(released, [mutex])
+        eq_(canary, [])
+
+    def test_not_usable_with_sync_with(self):
+        lock = AsyncLock(_AsyncMutex(), None, None, None)
+        with pytest.raises(TypeError):
+            with lock:
+                pass
@@ -0,0 +1,95 @@
+"""Compare the codecs of :mod:`dogpile.cache.serializers`.
+
+Times encoding and decoding a few typical payload shapes with each codec
+and reports the size of the encoded value.  Codecs which can't encode a
+payload, such as JSON with a dataclass, or which aren't installed, such as
+msgpack, are reported as ``n/a``.  Run from the project root::
+
+    python -m tools.benchmarks.codecs --number 20000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import timeit
+
+from dogpile.cache.serializers import JSONCodec
+from dogpile.cache.serializers import MsgpackCodec
+from dogpile.cache.serializers import PickleCodec
+from dogpile.cache.serializers import StructCodec
+
+
+@dataclasses.dataclass
+class User:
+    id: int
+    name: str
+    email: str
+    active: bool
+    score: float
+
+
+def payloads() -> dict[str, object]:
+    users = [
+        User(i, "user %d" % i, "user%d@example.com" % i, i % 2 == 0, i / 3)
+        for i in range(50)
+    ]
+    return {
+        "small str": "some value",
+        "api dict": {
+            "id": 5,
+            "name": "some name",
+            "tags": ["a", "b", "c"],
+            "children": [{"id": i, "value": "v%d" % i} for i in range(20)],
+        },
+        "dataclass": users[0],
+        "dataclass list": users,
+        "large text": "<p>some text</p>" * 1000,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    options = parser.parse_args(argv)
+
+    codecs = {
+        "pickle": PickleCodec(),
+        "pickle (2)": PickleCodec(protocol=2),
+        "json": JSONCodec(),
+        "msgpack": MsgpackCodec(),
+        "struct": StructCodec([User]),
+    }
+
+    print(
+        "%-16s %-12s %10s %14s %14s"
+        % ("payload", "codec", "size", "encode (us)", "decode (us)")
+    )
+    for payload_name, payload in payloads().items():
+        for codec_name, codec in codecs.items():
+            try:
+                data = codec.dumps(payload)
+            except (ImportError, TypeError, ValueError):
+                print("%-16s %-12s %10s" % (payload_name, codec_name, "n/a"))
+                continue
+            encode = timeit.timeit(
+                lambda: codec.dumps(payload), number=options.number
+            )
+            decode = timeit.timeit(
+                lambda: codec.loads(data), number=options.number
+            )
+            print(
+                "%-16s %-12s %10d %14.3f %14.3f"
+                % (
+                    payload_name,
+                    codec_name,
+                    len(data),
+                    encode / options.number * 1e6,
+                    decode / options.number * 1e6,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
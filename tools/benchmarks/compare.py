@@ -0,0 +1,78 @@
+"""Compare two sets of results from the benchmark suite.
+
+Reads two JSON files written by ``python -m tools.benchmarks.suite
+--output``, and prints the time of each benchmark present in both along
+with the change as a percentage.  Exits with status 1 if any benchmark
+became slower by more than ``--threshold`` percent, so that it can be
+used to check a change for regressions::
+
+    python -m tools.benchmarks.compare before.json after.json --threshold 10
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="percentage slowdown reported as a regression",
+    )
+    options = parser.parse_args(argv)
+
+    with open(options.before) as file_:
+        before = json.load(file_)
+    with open(options.after) as file_:
+        after = json.load(file_)
+
+    print("before: %s (Python %s)" % (before["commit"], before["python"]))
+    print("after:  %s (Python %s)" % (after["commit"], after["python"]))
+    print(
+        "%-16s %-22s %12s %12s %9s"
+        % ("backend", "benchmark", "before (us)", "after (us)", "change")
+    )
+
+    regressions = 0
+    for backend, results in before["results"].items():
+        for name, before_usec in results.items():
+            after_usec = after["results"].get(backend, {}).get(name)
+            if after_usec is None:
+                continue
+            change = (after_usec - before_usec) / before_usec * 100
+            regressed = change > options.threshold
+            regressions += regressed
+            print(
+                "%-16s %-22s %12.3f %12.3f %+8.1f%%%s"
+                % (
+                    backend,
+                    name,
+                    before_usec,
+                    after_usec,
+                    change,
+                    " *" if regressed else "",
+                )
+            )
+
+    if regressions:
+        print(
+            "%d benchmark(s) slower by more than %g%%"
+            % (regressions, options.threshold)
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
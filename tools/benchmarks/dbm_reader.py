@@ -0,0 +1,90 @@
+"""Measure reads from ``dogpile.cache.dbm`` with a persistent handle.
+
+Fills a DBM file with ``--keys`` keys, then reports keys read per second
+using ``get_serialized()`` and ``get_serialized_multi()`` of ten keys, with
+the DBM file kept open between reads, as :class:`.DBMBackend` does, and
+with the file opened for every call, as it did previously.  Run from the
+project root::
+
+    python -m tools.benchmarks.dbm_reader --keys 1000000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import dbm
+import os
+import random
+import tempfile
+import time
+
+from dogpile.cache.backends.file import DBMBackend
+
+
+class ReopeningDBMBackend(DBMBackend):
+    @contextmanager
+    def _dbm_reader(self):
+        with self._use_rw_lock(False):
+            with dbm.open(self.filename, "r") as dbm_obj:
+                yield dbm_obj
+
+
+def run(fn, keys: list[str], batch: int, seconds: float) -> float:
+    ops = 0
+    start = time.perf_counter()
+    end = start + seconds
+    while time.perf_counter() < end:
+        index = ops % len(keys)
+        fn(keys[index : index + batch])
+        ops += batch
+    return ops / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=1000000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    options = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "benchmark.dbm")
+        backend = DBMBackend({"filename": filename})
+        value = b"x" * 200
+        for start in range(0, options.keys, 10000):
+            backend.set_serialized_multi(
+                {
+                    "key%d" % i: value
+                    for i in range(start, min(start + 10000, options.keys))
+                }
+            )
+        print(
+            "%s with %d keys" % (dbm.whichdb(filename), options.keys),
+        )
+
+        rand = random.Random(0)
+        keys = ["key%d" % rand.randrange(options.keys) for _ in range(1000)]
+
+        print("%-12s %-22s %14s" % ("handle", "operation", "keys/sec"))
+        for name, cls in (
+            ("reopened", ReopeningDBMBackend),
+            ("persistent", DBMBackend),
+        ):
+            backend = cls({"filename": filename})
+            for operation, fn, batch in (
+                (
+                    "get_serialized",
+                    lambda keys: backend.get_serialized(keys[0]),
+                    1,
+                ),
+                ("get_serialized_multi", backend.get_serialized_multi, 10),
+            ):
+                print(
+                    "%-12s %-22s %14.0f"
+                    % (name, operation, run(fn, keys, batch, options.seconds))
+                )
+
+
+if __name__ == "__main__":
+    main()
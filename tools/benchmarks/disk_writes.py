@@ -0,0 +1,98 @@
+"""Measure writes to the backends which store values on local disk.
+
+Reports keys written per second using ``set_serialized()`` and
+``set_serialized_multi()`` of ten keys, overwriting ``--keys`` distinct
+keys with values of ``--size`` bytes, for ``dogpile.cache.dbm``,
+``dogpile.cache.sqlite``, ``dogpile.cache.directory`` and
+``dogpile.cache.log_structured``.  Run from the project root::
+
+    python -m tools.benchmarks.disk_writes --keys 100000 --size 200
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Any
+
+from dogpile.cache.region import _backend_loader
+
+
+def backends(tmpdir: str) -> dict[str, tuple[str, dict[str, Any]]]:
+    return {
+        "dbm": (
+            "dogpile.cache.dbm",
+            {"filename": os.path.join(tmpdir, "benchmark.dbm")},
+        ),
+        "sqlite": (
+            "dogpile.cache.sqlite",
+            {"filename": os.path.join(tmpdir, "benchmark.sqlite")},
+        ),
+        "directory": (
+            "dogpile.cache.directory",
+            {"directory": os.path.join(tmpdir, "benchmark.dir")},
+        ),
+        "log_structured": (
+            "dogpile.cache.log_structured",
+            {"directory": os.path.join(tmpdir, "benchmark.log")},
+        ),
+    }
+
+
+def run(fn, keys: list[str], batch: int, seconds: float) -> float:
+    ops = 0
+    start = time.perf_counter()
+    end = start + seconds
+    while time.perf_counter() < end:
+        index = ops % len(keys)
+        fn(keys[index : index + batch])
+        ops += batch
+    return ops / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument(
+        "--backend",
+        action="append",
+        help="only run the given backend, may be repeated",
+    )
+    options = parser.parse_args(argv)
+
+    keys = ["key%d" % i for i in range(options.keys)]
+    value = b"x" * options.size
+
+    print("%-16s %-22s %14s" % ("backend", "operation", "keys/sec"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (backend_name, arguments) in backends(tmpdir).items():
+            if options.backend and name not in options.backend:
+                continue
+            backend = _backend_loader.load(backend_name)(arguments)
+            for operation, fn, batch in (
+                (
+                    "set_serialized",
+                    lambda keys: backend.set_serialized(keys[0], value),
+                    1,
+                ),
+                (
+                    "set_serialized_multi",
+                    lambda keys: backend.set_serialized_multi(
+                        dict.fromkeys(keys, value)
+                    ),
+                    10,
+                ),
+            ):
+                print(
+                    "%-16s %-22s %14.0f"
+                    % (name, operation, run(fn, keys, batch, options.seconds))
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Measure the per-call overhead of :meth:`.CacheRegion.get_or_create`.
+
+Times ``get_or_create()`` for a key which is already cached against a
+plain ``backend.get()`` of the same key, so that the difference is the
+cost added by the region on a cache hit.  ``dogpile.cache.null`` never
+stores anything, so its row measures the full miss path including the
+dogpile lock, for comparison.  Run from the project root::
+
+    python -m tools.benchmarks.get_or_create_hit --number 200000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from dogpile.cache import make_region
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200000)
+    options = parser.parse_args(argv)
+
+    print(
+        "%-27s %16s %22s %14s"
+        % (
+            "backend",
+            "backend.get (us)",
+            "get_or_create (us)",
+            "overhead (us)",
+        )
+    )
+    for backend in (
+        "dogpile.cache.null",
+        "dogpile.cache.memory",
+        "dogpile.cache.memory_pickle",
+    ):
+        region = make_region().configure(backend, expiration_time=3600)
+
+        def creator() -> str:
+            return "some value"
+
+        region.get_or_create("some key", creator)
+
+        get = timeit.timeit(
+            lambda: region.backend.get("some key"), number=options.number
+        )
+        get_or_create = timeit.timeit(
+            lambda: region.get_or_create("some key", creator),
+            number=options.number,
+        )
+        print(
+            "%-27s %16.3f %22.3f %14.3f"
+            % (
+                backend,
+                get / options.number * 1e6,
+                get_or_create / options.number * 1e6,
+                (get_or_create - get) / options.number * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
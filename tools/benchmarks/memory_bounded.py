@@ -0,0 +1,74 @@
+"""Compare hit ratio and throughput of the bounded memory backends.
+
+Runs a Zipfian (skewed) get-or-set workload against
+``dogpile.cache.memory`` and each eviction policy of
+``dogpile.cache.memory_bounded``, reporting hit ratio and operations per
+second.  Run from the project root::
+
+    python -m tools.benchmarks.memory_bounded --keys 100000 --capacity 5000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import time
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends.memory import BoundedMemoryBackend
+from dogpile.cache.backends.memory import MemoryBackend
+
+
+def zipf_keys(num_keys: int, skew: float, count: int, seed: int) -> list[str]:
+    weights = [1.0 / (rank**skew) for rank in range(1, num_keys + 1)]
+    cum_weights = list(itertools.accumulate(weights))
+    keys = ["key%d" % i for i in range(num_keys)]
+    rand = random.Random(seed)
+    return rand.choices(keys, cum_weights=cum_weights, k=count)
+
+
+def run(backend, workload: list[str]) -> tuple[float, float]:
+    hits = 0
+    get, set_ = backend.get, backend.set
+    start = time.perf_counter()
+    for key in workload:
+        if get(key) is NO_VALUE:
+            set_(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return hits / len(workload), len(workload) / elapsed
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--capacity", type=int, default=5000)
+    parser.add_argument("--skew", type=float, default=0.99)
+    parser.add_argument("--ops", type=int, default=500000)
+    parser.add_argument("--seed", type=int, default=42)
+    options = parser.parse_args(argv)
+
+    workload = zipf_keys(options.keys, options.skew, options.ops, options.seed)
+
+    print(
+        "%d ops, %d keys, zipf s=%.2f, capacity %d"
+        % (options.ops, options.keys, options.skew, options.capacity)
+    )
+    print("%-24s %10s %14s" % ("backend", "hit ratio", "ops/sec"))
+
+    hit_ratio, ops = run(MemoryBackend({}), workload)
+    print("%-24s %10.4f %14.0f" % ("memory (unbounded)", hit_ratio, ops))
+
+    for policy in ("lru", "lfu", "arc", "tinylfu"):
+        backend = BoundedMemoryBackend(
+            {"max_entries": options.capacity, "eviction_policy": policy}
+        )
+        hit_ratio, ops = run(backend, workload)
+        print("%-24s %10.4f %14.0f" % ("bounded " + policy, hit_ratio, ops))
+
+
+if __name__ == "__main__":
+    main()
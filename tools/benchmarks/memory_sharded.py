@@ -0,0 +1,100 @@
+"""Measure multi-threaded throughput of the memory backends.
+
+Runs the same get-or-set workload on an increasing number of threads
+sharing one backend, reporting aggregate operations per second for
+``dogpile.cache.memory``, ``dogpile.cache.memory_bounded`` and
+``dogpile.cache.memory_sharded``.  Throughput only scales with the number
+of threads on a free-threaded build of Python (3.13t and later).  Run
+from the project root::
+
+    python -m tools.benchmarks.memory_sharded --threads 1 2 4 8 16
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from dogpile.cache.api import NO_VALUE
+from dogpile.cache.backends.memory import BoundedMemoryBackend
+from dogpile.cache.backends.memory import MemoryBackend
+from dogpile.cache.backends.memory import ShardedMemoryBackend
+
+
+def worker(backend, keys: list[str], barrier: threading.Barrier) -> None:
+    get, set_ = backend.get, backend.set
+    barrier.wait()
+    for key in keys:
+        if get(key) is NO_VALUE:
+            set_(key, key)
+
+
+def run(backend, num_threads: int, num_keys: int, ops: int) -> float:
+    rand = random.Random(num_threads)
+    workloads = [
+        ["key%d" % rand.randrange(num_keys) for _ in range(ops)]
+        for _ in range(num_threads)
+    ]
+    barrier = threading.Barrier(num_threads + 1)
+    threads = [
+        threading.Thread(target=worker, args=(backend, workload, barrier))
+        for workload in workloads
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return num_threads * ops / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--capacity", type=int, default=50000)
+    parser.add_argument("--shards", type=int, default=64)
+    parser.add_argument("--ops", type=int, default=200000, help="per thread")
+    options = parser.parse_args(argv)
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        "Python %s, GIL %s, %d ops per thread, %d keys"
+        % (
+            sys.version.split()[0],
+            "enabled" if gil_enabled else "disabled",
+            options.ops,
+            options.keys,
+        )
+    )
+
+    backends = {
+        "memory": lambda: MemoryBackend({}),
+        "bounded lru": lambda: BoundedMemoryBackend(
+            {"max_entries": options.capacity}
+        ),
+        "sharded": lambda: ShardedMemoryBackend({"shards": options.shards}),
+        "sharded bounded lru": lambda: ShardedMemoryBackend(
+            {"shards": options.shards, "max_entries": options.capacity}
+        ),
+    }
+
+    print(
+        "%-22s" % "backend"
+        + "".join("%12s" % ("%d threads" % n) for n in options.threads)
+    )
+    for name, factory in backends.items():
+        results = [
+            run(factory(), num_threads, options.keys, options.ops)
+            for num_threads in options.threads
+        ]
+        print("%-22s" % name + "".join("%12.0f" % ops for ops in results))
+
+
+if __name__ == "__main__":
+    main()
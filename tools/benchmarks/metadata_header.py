@@ -0,0 +1,56 @@
+"""Compare the cost of JSON and binary metadata headers.
+
+Times writing and reading back serialized values through
+:class:`.CacheRegion` with and without ``binary_metadata``, and reports
+the size of each header.  Run from the project root::
+
+    python -m tools.benchmarks.metadata_header --number 200000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from dogpile.cache import make_region
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200000)
+    options = parser.parse_args(argv)
+
+    print(
+        "%-8s %12s %14s %14s"
+        % ("header", "header size", "write (us)", "read (us)")
+    )
+    for name, binary in (("json", False), ("binary", True)):
+        region = make_region(binary_metadata=binary).configure(
+            "dogpile.cache.memory_pickle"
+        )
+        value = region._value("some value")
+        serialized = region._serialized_cached_value(value)
+        payload_size = len(region.serializer(value.payload))
+
+        write = timeit.timeit(
+            lambda: region._serialized_cached_value(value),
+            number=options.number,
+        )
+        read = timeit.timeit(
+            lambda: region._parse_serialized_from_backend(serialized),
+            number=options.number,
+        )
+        print(
+            "%-8s %12d %14.3f %14.3f"
+            % (
+                name,
+                len(serialized) - payload_size,
+                write / options.number * 1e6,
+                read / options.number * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
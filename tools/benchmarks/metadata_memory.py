@@ -0,0 +1,69 @@
+"""Measure the memory used per entry by ``dogpile.cache.memory``.
+
+Fills a memory backend with small values using dictionary metadata, as
+produced by earlier versions of :class:`.CacheRegion`, and using
+:class:`.CachedMetadata`, reporting the bytes allocated per entry and the
+time taken by a full garbage collection.  Run from the project root::
+
+    python -m tools.benchmarks.metadata_memory --entries 1000000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+
+from dogpile.cache.api import CachedMetadata
+from dogpile.cache.api import CachedValue
+from dogpile.cache.backends.memory import MemoryBackend
+from dogpile.cache.region import value_version
+
+
+def dict_metadata() -> Any:
+    return {"ct": time.time(), "v": value_version}
+
+
+def compact_metadata() -> Any:
+    return CachedMetadata(time.time(), value_version)
+
+
+def run(metadata: Callable[[], Any], entries: int) -> tuple[float, float]:
+    keys = ["key%d" % i for i in range(entries)]
+    backend = MemoryBackend({})
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i, key in enumerate(keys):
+        backend.set(key, CachedValue(i, metadata()))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    gc.collect()
+    collect_time = time.perf_counter() - start
+    return (after - before) / entries, collect_time
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1000000)
+    options = parser.parse_args(argv)
+
+    print("%d entries" % options.entries)
+    print("%-12s %16s %14s" % ("metadata", "bytes/entry", "gc.collect()"))
+    for name, metadata in (
+        ("dict", dict_metadata),
+        ("compact", compact_metadata),
+    ):
+        per_entry, collect_time = run(metadata, options.entries)
+        print("%-12s %16.1f %13.3fs" % (name, per_entry, collect_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Run the dogpile.cache benchmark suite.
+
+Times the hot paths of :class:`.CacheRegion` on cache hits -- ``get()``,
+``get_multi()``, ``get_or_create()``, ``get_or_create_multi()`` and a
+function decorated with ``cache_on_arguments()`` -- against each
+available backend, along with serialization, key generation and the
+dogpile :class:`.Lock`, which don't depend on a backend.
+
+The memory backends and those which store values on local disk are
+always run.  Redis, Valkey and memcached are run when
+``DOGPILE_REDIS_PORT``, ``DOGPILE_VALKEY_PORT`` or
+``DOGPILE_MEMCACHED_PORT`` name a local server, as set by pifpaf;
+``nox -s benchmark`` spawns these servers and runs the suite.  Results
+written with ``--output`` can be compared between commits using
+:mod:`tools.benchmarks.compare`.  Run from the project root::
+
+    python -m tools.benchmarks.suite --output before.json
+    git checkout some_branch
+    python -m tools.benchmarks.suite --output after.json
+    python -m tools.benchmarks.compare before.json after.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+from typing import Any
+
+from dogpile import Lock
+from dogpile.cache import make_region
+from dogpile.cache import util
+from dogpile.cache.region import CacheRegion
+
+NUM_KEYS = 10
+
+STANDALONE = "standalone"
+
+
+def backends(tmpdir: str) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Return the backends to benchmark, with their arguments."""
+
+    result = {
+        "memory": ("dogpile.cache.memory", {}),
+        "memory_pickle": ("dogpile.cache.memory_pickle", {}),
+        "dbm": (
+            "dogpile.cache.dbm",
+            {"filename": os.path.join(tmpdir, "benchmark.dbm")},
+        ),
+        "directory": (
+            "dogpile.cache.directory",
+            {"directory": os.path.join(tmpdir, "benchmark.dir")},
+        ),
+        "log_structured": (
+            "dogpile.cache.log_structured",
+            {"directory": os.path.join(tmpdir, "benchmark.log")},
+        ),
+        "sqlite": (
+            "dogpile.cache.sqlite",
+            {"filename": os.path.join(tmpdir, "benchmark.sqlite")},
+        ),
+    }
+    for name in ("redis", "valkey"):
+        port = os.environ.get("DOGPILE_%s_PORT" % name.upper())
+        if port:
+            result[name] = (
+                "dogpile.cache.%s" % name,
+                {"host": "127.0.0.1", "port": int(port)},
+            )
+    port = os.environ.get("DOGPILE_MEMCACHED_PORT")
+    if port:
+        result["pymemcache"] = (
+            "dogpile.cache.pymemcache",
+            {"url": "127.0.0.1:%s" % port},
+        )
+    return result
+
+
+def region_benchmarks(region: CacheRegion) -> dict[str, Callable[[], Any]]:
+    keys = ["key%d" % i for i in range(NUM_KEYS)]
+    region.set_multi({key: "value %s" % key for key in keys})
+
+    def creator() -> str:
+        return "value"
+
+    def multi_creator(*keys: str) -> list[str]:
+        return ["value %s" % key for key in keys]
+
+    @region.cache_on_arguments()
+    def decorated(x: int) -> int:
+        return x
+
+    decorated(1)
+
+    return {
+        "get": lambda: region.get("key0"),
+        "get_multi": lambda: region.get_multi(keys),
+        "get_or_create": lambda: region.get_or_create("key0", creator),
+        "get_or_create_multi": lambda: region.get_or_create_multi(
+            keys, multi_creator
+        ),
+        "cache_on_arguments": lambda: decorated(1),
+    }
+
+
+def standalone_benchmarks() -> dict[str, Callable[[], Any]]:
+    region = make_region().configure("dogpile.cache.memory_pickle")
+    value = region._value({"id": 5, "name": "some name", "tags": ["a", "b"]})
+    serialized = region._serialized_cached_value(value)
+
+    def fn(x: int, y: str) -> None:
+        pass
+
+    generate_key = util.function_key_generator(None, fn)
+
+    mutex = threading.Lock()
+    created = time.time()
+
+    def creator() -> tuple[str, float]:
+        return "value", created
+
+    def value_and_created() -> tuple[str, float]:
+        return "value", created
+
+    def lock() -> None:
+        with Lock(mutex, creator, value_and_created, 3600):
+            pass
+
+    return {
+        "serialize": lambda: region._serialized_cached_value(value),
+        "deserialize": lambda: region._parse_serialized_from_backend(
+            serialized
+        ),
+        "key_generation": lambda: generate_key(5, "some string"),
+        "lock": lock,
+    }
+
+
+def run(fn: Callable[[], Any], number: int, repeat: int) -> float:
+    """Return the best time per call of ``fn``, in microseconds."""
+
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--backend",
+        action="append",
+        help="only run the given backend, may be repeated; "
+        "use %r for the benchmarks that don't use a backend" % STANDALONE,
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        help="only run the given benchmark, may be repeated",
+    )
+    parser.add_argument("--output", help="write results as JSON to a file")
+    options = parser.parse_args(argv)
+
+    results: dict[str, dict[str, float]] = {}
+    print("%-16s %-22s %12s" % ("backend", "benchmark", "time (us)"))
+
+    def run_all(backend: str, benchmarks: dict[str, Callable[[], Any]]):
+        for name, fn in benchmarks.items():
+            if options.benchmark and name not in options.benchmark:
+                continue
+            usec = run(fn, options.number, options.repeat)
+            results.setdefault(backend, {})[name] = usec
+            print("%-16s %-22s %12.3f" % (backend, name, usec))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (backend, arguments) in backends(tmpdir).items():
+            if options.backend and name not in options.backend:
+                continue
+            region = make_region().configure(
+                backend, expiration_time=3600, arguments=arguments
+            )
+            run_all(name, region_benchmarks(region))
+
+    if not options.backend or STANDALONE in options.backend:
+        run_all(STANDALONE, standalone_benchmarks())
+
+    if options.output:
+        with open(options.output, "w") as file_:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "python": sys.version.split()[0],
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "number": options.number,
+                    "repeat": options.repeat,
+                    "results": results,
+                },
+                file_,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()